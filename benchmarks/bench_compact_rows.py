@@ -0,0 +1,81 @@
+"""
+dict 행과 CompactRow 행의 메모리 사용량 비교
+
+get_task_schedule_list 결과와 같은 컬럼 구성의 행을 만들어 tracemalloc으로 측정한다.
+DB 연결 없이 실행된다.
+
+    python benchmarks/bench_compact_rows.py --rows 5000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from broffice.dbconns import CompactRow
+
+# get_task_schedule_list 반환 컬럼
+COLUMNS = (
+    'task_schedule_id', 'task_id', 'user_id', 'memo', 'scheduled_date',
+    'change_scheduled_yn', 'completed_date', 'canceled_at', 'change_user_id',
+    'effective_date', 'effective_day', 'client_name', 'worker_name', 'worker_mobile',
+    'admin_name', 'manager_name', 'schedule_status', 'area_count', 'completed_area_count',
+)
+
+
+def make_values(i):
+    """드라이버가 반환하는 값과 비슷한 한 행의 값 (행마다 새 객체)"""
+    day = i % 28 + 1
+    return (
+        100000 + i, 500 + i % 300, 20 + i % 15, None, f'2026-02-{day:02d}',
+        0, None, None, None,
+        f'2026-02-{day:02d}', '월', f'업체{i % 300}', f'작업자{i % 15}', f'010-0000-{i % 10000:04d}',
+        None, f'관리자{i % 5}', 'scheduled', 8, i % 9,
+    )
+
+
+def build_dict_rows(count):
+    # DictCursor처럼 행마다 컬럼 이름 키를 가진 dict 생성
+    return [dict(zip(COLUMNS, make_values(i))) for i in range(count)]
+
+
+def build_compact_rows(count):
+    index = {name: position for position, name in enumerate(COLUMNS)}
+    return [CompactRow(index, make_values(i)) for i in range(count)]
+
+
+def measure(builder, count):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = builder(count)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for row in rows:
+        row['client_name']
+        row.get('completed_area_count', 0)
+    access = time.perf_counter() - start
+    return current, elapsed, access
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=3000, help='행 수 (기본: 3000)')
+    args = parser.parse_args()
+
+    print(f"행 수: {args.rows:,}, 컬럼 수: {len(COLUMNS)}")
+    results = {}
+    for name, builder in (('dict', build_dict_rows), ('compact', build_compact_rows)):
+        memory, build, access = measure(builder, args.rows)
+        results[name] = memory
+        print(f"{name:8s} 메모리 {memory / 1024:10,.1f} KiB "
+              f"(행당 {memory / args.rows:6,.0f} B), 생성 {build * 1000:7.2f} ms, 조회 {access * 1000:7.2f} ms")
+    print(f"절감: {(1 - results['compact'] / results['dict']) * 100:.1f}%")
+
+
+if __name__ == '__main__':
+    main()
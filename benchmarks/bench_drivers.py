@@ -0,0 +1,82 @@
+"""
+DB 드라이버별 결과 디코딩 성능 비교 (pymysql vs mysqlclient)
+
+목록 화면에서 사용하는 대표 조회 프로시저를 드라이버마다 같은 연결 설정으로 반복 실행하고
+호출당 소요 시간과 클라이언트 CPU 시간(결과 디코딩 비용)을 비교한다.
+.env의 DB 접속 설정(DB_ENV)을 사용하며, 설치되지 않은 드라이버는 건너뛴다.
+
+    python benchmarks/bench_drivers.py --year-month 2026-02 --repeat 10
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from broffice import dbconns
+from broffice.dbdrivers import DRIVERS, get_driver
+
+
+def representative_calls(year_month, task_kind_id):
+    """목록/보고서 화면의 대표 조회 (프로시저 이름, 파라미터)"""
+    return [
+        ('get_task_schedule_list', [task_kind_id, year_month]),
+        ('get_task_client_list', [0, year_month, 1, 1000, task_kind_id]),
+        ('get_report_by_client', [year_month, task_kind_id, 0]),
+        ('get_sns_log_list', [year_month, '']),
+        ('get_client_list', []),
+    ]
+
+
+def run_calls(db_driver, calls, repeat):
+    config = dict(dbconns.db_config, cursorclass=db_driver.DictCursor, client_flag=db_driver.MULTI_STATEMENTS)
+    conn = db_driver.connect(config)
+    results = []
+    try:
+        for proc_name, params in calls:
+            sql = dbconns._build_call_statement(proc_name, params)
+            # 첫 실행은 서버 캐시 준비용으로 제외
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                cursor.fetchall()
+            
+            rows = 0
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            for _ in range(repeat):
+                with conn.cursor() as cursor:
+                    cursor.execute(sql, params)
+                    rows += len(cursor.fetchall())
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            results.append((proc_name, rows // repeat, wall / repeat * 1000, cpu / repeat * 1000, rows / cpu if cpu else 0))
+    finally:
+        conn.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--year-month', default=time.strftime('%Y-%m'), help='조회 연월 (기본: 이번 달)')
+    parser.add_argument('--task-kind-id', type=int, default=4, help='작업 종류 (기본: 4 청소)')
+    parser.add_argument('--repeat', type=int, default=10, help='프로시저별 반복 횟수 (기본: 10)')
+    args = parser.parse_args()
+
+    calls = representative_calls(args.year_month, args.task_kind_id)
+    print(f"DB_ENV={dbconns.DB_ENV}, 호스트={dbconns.db_config.get('host')}, 반복 {args.repeat}회")
+    for name in DRIVERS:
+        try:
+            db_driver = get_driver(name)
+        except ImportError as e:
+            print(f"\n[{name}] 건너뜀: {e}")
+            continue
+        
+        print(f"\n[{name}]")
+        print(f"{'프로시저':32s} {'행 수':>8s} {'호출당(ms)':>12s} {'CPU(ms)':>10s} {'행/CPU초':>12s}")
+        for proc_name, rows, wall_ms, cpu_ms, rows_per_cpu in run_calls(db_driver, calls, args.repeat):
+            print(f"{proc_name:32s} {rows:8,d} {wall_ms:12.2f} {cpu_ms:10.2f} {rows_per_cpu:12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+반복 규칙 날짜 계산 처리량 비교 (문자열 비교 일별 루프 vs 해석된 규칙)
+
+작업 수 x 개월 수만큼 한 달치 작업 날짜를 계산한다. 일별 루프는 SQL 프로시저
+(set_task_schedule_generate)처럼 날짜마다 days_of_week/fix_dates 문자열에서 값을 찾는다.
+두 방식의 결과가 같은지도 확인한다. DB 연결이나 앱 설정(.env) 없이 실행된다.
+
+    python benchmarks/bench_recurrence.py --tasks 10000 --months 12
+"""
+import argparse
+import calendar
+import importlib.util
+import os
+import random
+import time
+from datetime import date, timedelta
+
+# broffice 패키지(__init__)를 거치면 앱 설정(SECRET_KEY 등)이 필요하므로 반복 규칙 모듈 파일만 불러온다
+_RECURRENCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'broffice', 'utils', 'recurrence.py')
+_spec = importlib.util.spec_from_file_location('recurrence', _RECURRENCE_PATH)
+recurrence = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(recurrence)
+
+
+def make_tasks(count, seed=1):
+    """운영 데이터와 비슷한 구성의 작업 규칙 (요일 지정 대부분, 매일/월별 일부)"""
+    rng = random.Random(seed)
+    tasks = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.1:
+            tasks.append({'days_of_week': recurrence.DAILY, 'fix_dates': None})
+        elif kind < 0.3:
+            days = sorted(rng.sample(range(1, 29), rng.randint(1, 3)))
+            tasks.append({'days_of_week': recurrence.MONTHLY, 'fix_dates': ', '.join(map(str, days))})
+        else:
+            days = sorted(rng.sample(range(1, 8), rng.randint(1, 5)))
+            tasks.append({'days_of_week': ','.join(map(str, days)), 'fix_dates': None})
+    return tasks
+
+
+def month_starts(start_year, months):
+    result = []
+    for i in range(months):
+        year, month = divmod(i, 12)
+        result.append((start_year + year, month + 1))
+    return result
+
+
+def expand_loop(task, year, month):
+    """날짜마다 문자열 목록에서 요일/일자를 찾는 방식 (SQL FIND_IN_SET 루프와 같은 방식)"""
+    days_of_week = task['days_of_week']
+    fix_dates = (task['fix_dates'] or '').replace(' ', '').split(',')
+    weekdays = (days_of_week or '').split(',')
+    current = date(year, month, 1)
+    end = date(year, month, calendar.monthrange(year, month)[1])
+    result = []
+    while current <= end:
+        if days_of_week == '0':
+            if str(current.day) in fix_dates:
+                result.append(current)
+        elif str(current.isoweekday()) in weekdays:
+            result.append(current)
+        current += timedelta(days=1)
+    return result
+
+
+def expand_compiled(task, year, month):
+    rule = recurrence.rule_for_task(task)
+    return [date(year, month, day) for day in rule.month_days(year, month)]
+
+
+def run(expand, tasks, months):
+    start = time.perf_counter()
+    total = 0
+    for task in tasks:
+        for year, month in months:
+            total += len(expand(task, year, month))
+    return time.perf_counter() - start, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=10000, help='작업 수 (기본: 10000)')
+    parser.add_argument('--months', type=int, default=12, help='개월 수 (기본: 12)')
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+    months = month_starts(2026, args.months)
+    for task in tasks[:500]:
+        for year, month in months:
+            assert expand_loop(task, year, month) == expand_compiled(task, year, month), task
+
+    expansions = args.tasks * args.months
+    print(f"작업 수: {args.tasks:,}, 개월 수: {args.months}, 계산 횟수: {expansions:,}")
+    results = {}
+    for name, expand in (('loop', expand_loop), ('compiled', expand_compiled)):
+        recurrence.compile_rule.cache_clear()
+        recurrence._month_days.cache_clear()
+        elapsed, total = run(expand, tasks, months)
+        results[name] = elapsed
+        print(f"{name:8s} {elapsed * 1000:9.1f} ms, 초당 {expansions / elapsed:12,.0f}회, 날짜 {total:,}건")
+    info = recurrence._month_days.cache_info()
+    print(f"월별 계산 캐시: 적중 {info.hits:,}, 계산 {info.misses:,}")
+    print(f"속도: {results['loop'] / results['compiled']:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
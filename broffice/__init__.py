@@ -41,6 +41,9 @@ def create_app(config_class=None):
     # 에러 핸들러 등록
     register_error_handlers(app)
     
+    # CLI 명령 등록
+    register_commands(app)
+    
     # 추가 URL 규칙
     app.add_url_rule('/file_download', 'file_download', file_download, methods=['GET'])
     
@@ -51,6 +54,10 @@ def create_app(config_class=None):
 
 def init_extensions(app):
     """Flask 확장 초기화"""
+    # 요청 단위 DB 연결 반환 등록
+    from broffice import dbconns
+    dbconns.init_app(app)
+    
     # SendGrid 설정 확인
     if app.config.get('SENDGRID_API_KEY'):
         app.logger.info("SendGrid API 키 설정 확인 완료")
@@ -100,6 +107,7 @@ def register_filters(app):
 
 def register_error_handlers(app):
     """에러 핸들러 등록"""
+    from broffice.dbconns import DatabaseUnavailableError
     
     def _is_api_request():
         """AJAX/fetch 요청 여부 판별"""
@@ -137,6 +145,15 @@ def register_error_handlers(app):
             return str(error), 500
         return render_template('errors/500.html'), 500
     
+    @app.errorhandler(DatabaseUnavailableError)
+    def database_unavailable_error(e):
+        """DB 장애로 회로 차단기가 열린 경우 대기 없이 503 응답"""
+        app.logger.warning(f"DB 연결 차단 중 요청 거부: {request.path}")
+        headers = {'Retry-After': str(e.retry_after)}
+        if _is_api_request():
+            return jsonify({'success': False, 'message': str(e.args[1])}), 503, headers
+        return '일시적으로 데이터베이스에 연결할 수 없습니다. 잠시 후 다시 시도해 주세요.', 503, headers
+    
     @app.errorhandler(Exception)
     def handle_exception(e):
         """전역 예외 핸들러"""
@@ -163,6 +180,18 @@ def register_error_handlers(app):
         # 프로덕션 환경에서는 일반 에러 페이지
         return render_template('errors/500.html'), 500
 
+
+def register_commands(app):
+    """CLI 명령 등록 (flask <명령>)"""
+    
+    @app.cli.command('reconcile-task-counts')
+    def reconcile_task_counts():
+        """작업/스케줄 진행 카운터(구역 수, 작업 구역 수, 사진 수) 전체 재계산"""
+        from broffice import dbconns
+        res = dbconns.execute_return('set_task_counts_reconcile', [])
+        print(f"진행 카운터 재계산 완료: 작업 {res['task_count']}건, 스케줄 {res['schedule_count']}건 수정")
+
+
 def register_blueprints(app):
     """모든 블루프린트를 앱에 등록"""
     from broffice.router import homes, accounts, samples, tasks, reports
@@ -1,17 +1,35 @@
 import os
-import pymysql
+import sys
+import json
+import socket
+import random
 import time
 import logging
+from datetime import datetime
 import threading
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from dotenv import load_dotenv
-from flask import current_app
+from flask import g, has_request_context, request
+from broffice.dbdrivers import get_driver
 
 load_dotenv()
 
+# DB 드라이버 (DB_DRIVER=pymysql(기본값) 또는 mysqlclient, dbdrivers 참고)
+driver = get_driver()
+
 # 환경별 DB 설정 선택
 DB_ENV = os.environ.get('DB_ENV', 'remote')  # local, remote, production
 
+# 연결 직후 실행할 세션 설정 (한국시간 타임존 + autocommit을 한 번의 왕복으로 처리)
+# autocommit은 init_command에서 설정하므로 접속 인자는 None(서버 기본값 유지, 추가 쿼리 없음)으로 둔다
+# 조회는 autocommit으로 실행해 스냅샷이 연결에 남지 않게 하고, 쓰기는 명시적으로 트랜잭션을 연다
+SESSION_INIT_COMMAND = "SET time_zone = '+09:00', autocommit = 1"
+
+# 접속 제한 시간 (초, DB 서버가 응답하지 않을 때 요청 스레드가 붙잡히는 시간)
+CONNECT_TIMEOUT = int(os.environ.get('DB_CONNECT_TIMEOUT', 5))
+
 def get_db_config():
     """환경에 따른 DB 설정 반환"""
     if DB_ENV == 'remote':
@@ -25,8 +43,11 @@ def get_db_config():
             'password': os.environ.get('REMOTE_DB_PASSWORD'),
             'database': os.environ.get('REMOTE_DB_NAME'),
             'charset': 'utf8mb4',
-            'cursorclass': pymysql.cursors.DictCursor,
-            'autocommit': False,
+            'cursorclass': driver.DictCursor,
+            'autocommit': None,
+            'init_command': SESSION_INIT_COMMAND,
+            'connect_timeout': CONNECT_TIMEOUT,
+            'client_flag': driver.MULTI_STATEMENTS,  # call_many 일괄 실행용
             'auth_plugin_map': {'auth_gssapi_client': 'mysql_native_password'}
         }
     elif DB_ENV == 'production':
@@ -38,8 +59,11 @@ def get_db_config():
             'password': os.environ.get('PROD_DB_PASSWORD'),
             'database': os.environ.get('PROD_DB_NAME'),
             'charset': 'utf8mb4',
-            'cursorclass': pymysql.cursors.DictCursor,
-            'autocommit': False,
+            'cursorclass': driver.DictCursor,
+            'autocommit': None,
+            'init_command': SESSION_INIT_COMMAND,
+            'connect_timeout': CONNECT_TIMEOUT,
+            'client_flag': driver.MULTI_STATEMENTS,  # call_many 일괄 실행용
             'auth_plugin_map': {'auth_gssapi_client': 'mysql_native_password'}
         }
     else:
@@ -51,124 +75,793 @@ def get_db_config():
             'password': os.environ.get('LOCAL_DB_PASSWORD'),
             'database': os.environ.get('LOCAL_DB_NAME', 'broffice'),
             'charset': 'utf8mb4',
-            'cursorclass': pymysql.cursors.DictCursor,
-            'autocommit': False
+            'cursorclass': driver.DictCursor,
+            'autocommit': None,
+            'init_command': SESSION_INIT_COMMAND,
+            'connect_timeout': CONNECT_TIMEOUT,
+            'client_flag': driver.MULTI_STATEMENTS  # call_many 일괄 실행용
         }
 
+def get_replica_config():
+    """
+    읽기 전용 복제본(replica) DB 설정 반환 (설정하지 않았으면 None)
+    
+    {REMOTE|PROD|LOCAL}_REPLICA_DB_HOST가 있을 때만 사용하며,
+    PORT/USER/PASSWORD/NAME을 생략하면 주 DB 설정값을 따른다.
+    """
+    prefix = {'remote': 'REMOTE', 'production': 'PROD'}.get(DB_ENV, 'LOCAL')
+    host = os.environ.get(f'{prefix}_REPLICA_DB_HOST')
+    if not host:
+        return None
+    
+    config = get_db_config()
+    config['host'] = host
+    for key, name in (('port', 'PORT'), ('user', 'USER'), ('password', 'PASSWORD'), ('database', 'NAME')):
+        value = os.environ.get(f'{prefix}_REPLICA_DB_{name}')
+        if value is not None:
+            config[key] = int(value) if key == 'port' else value
+    return config
+
+def get_pool_config(prefix='DB_POOL', min_connections=2, max_connections=10, max_idle=5, checkout_timeout=5):
+    """
+    환경 변수 기반 연결 풀 설정 반환
+    
+    Args:
+        prefix: 풀 크기 환경 변수 접두사 (예: 'DB_REPORTING_POOL' -> DB_REPORTING_POOL_MAX)
+        min_connections, max_connections, max_idle, checkout_timeout: 환경 변수가 없을 때의 기본값
+    
+    풀 크기/대기 시간 외의 설정(유휴/수명/검사/회로 차단기)은 모든 풀이 DB_POOL_* 값을 공유한다.
+    """
+    return {
+        'min_connections': int(os.environ.get(f'{prefix}_MIN', min_connections)),
+        'max_connections': int(os.environ.get(f'{prefix}_MAX', max_connections)),
+        # 반환된 연결을 풀에 보관할 최대 개수
+        'max_idle': int(os.environ.get(f'{prefix}_MAX_IDLE', max_idle)),
+        # 연결이 모두 사용 중일 때 기다리는 최대 시간 (초, 초과하면 TimeoutError)
+        'checkout_timeout': float(os.environ.get(f'{prefix}_TIMEOUT', checkout_timeout)),
+        # 유휴 연결 정리 기준 (초, PythonAnywhere MySQL은 300초 유휴 시 연결을 끊음)
+        'idle_timeout': int(os.environ.get('DB_POOL_IDLE_TIMEOUT', 240)),
+        # 연결 최대 수명 (초, 0이면 무제한)
+        'max_lifetime': int(os.environ.get('DB_POOL_MAX_LIFETIME', 3600)),
+        # 이 시간(초) 이상 유휴 상태였던 연결만 ping으로 검사
+        'validate_after': float(os.environ.get('DB_POOL_VALIDATE_AFTER', 30)),
+        # 연속 연결 실패가 이 횟수에 도달하면 회로 차단기 열림 (0이면 사용 안 함)
+        'breaker_threshold': int(os.environ.get('DB_BREAKER_THRESHOLD', 5)),
+        # 차단 후 연결을 다시 시도하기까지 기다리는 시간 (초)
+        'breaker_reset_timeout': float(os.environ.get('DB_BREAKER_RESET_TIMEOUT', 10)),
+    }
+
+# 보고서 등 무거운 조회를 위한 별도 연결 풀 크기 (주 풀의 연결을 모두 차지하지 않도록 분리)
+# 연결이 부족하면 이 풀 안에서만 기다리고(보고서는 오래 걸리므로 대기 시간을 길게) 주 풀 연결은 빌리지 않는다
+# 보고서 대시보드(reports.dashboard)의 get_report_* 5개를 call_parallel로 한 번에 실행할 수 있는 크기로 설정
+REPORTING_POOL_CONFIG = get_pool_config('DB_REPORTING_POOL', min_connections=0, max_connections=5, max_idle=2,
+                                        checkout_timeout=15)
+
+# 조회 프로시저별 전용 풀 배정 (쓰기는 항상 oltp 풀에서 실행)
+PROCEDURE_POOLS = {
+    'get_report_monthly_summary': 'reporting',
+    'get_report_by_worker': 'reporting',
+    'get_report_by_client': 'reporting',
+    'get_report_daily_trend': 'reporting',
+    'get_report_managers': 'reporting',
+}
+
+# 블루프린트별 전용 풀 배정 (해당 화면의 모든 조회에 적용)
+BLUEPRINT_POOLS = {
+    'reports': 'reporting',
+}
+
+# 프로시저 실행 제한 시간 (초, 초과하면 별도 연결에서 KILL QUERY로 중단)
+# MySQL max_execution_time은 저장 프로시저 안의 SELECT에는 적용되지 않으므로 사용하지 않는다
+DEFAULT_STATEMENT_TIMEOUT = float(os.environ.get('DB_STATEMENT_TIMEOUT', 0))  # 0이면 제한 없음
+
+# 무거운 조회 프로시저별 기본 제한 시간 (execute_return/return_list의 timeout 인자로 변경 가능)
+STATEMENT_TIMEOUTS = {
+    'get_report_monthly_summary': 30,
+    'get_report_by_worker': 30,
+    'get_report_by_client': 30,
+    'get_report_daily_trend': 30,
+    'get_task_schedule_list': 15,
+    'get_task_client_list': 15,
+    'get_sns_log_list': 15,
+}
+
+# 교착 상태(1213)/잠금 대기 시간 초과(1205) 시 재시도할 쓰기 프로시저
+# 프로시저 전체가 하나의 트랜잭션으로 롤백되어 다시 실행해도 안전한 것만 등록 (내부에서 COMMIT하는 프로시저 제외)
+LOCK_RETRY_PROCEDURES = {
+    'set_task_area_log',
+    'set_task_area_photo_insert',
+    'set_task_area_photo_delete',
+    'set_task_schedule_complete',
+    'set_schedule_job_start',
+}
+LOCK_RETRY_ATTEMPTS = int(os.environ.get('DB_LOCK_RETRY_ATTEMPTS', 3))
+# 재시도 대기 시간 (초, 0 ~ base * 2^n 사이 임의 값, 최대 max_delay)
+LOCK_RETRY_BASE_DELAY = float(os.environ.get('DB_LOCK_RETRY_BASE_DELAY', 0.05))
+LOCK_RETRY_MAX_DELAY = float(os.environ.get('DB_LOCK_RETRY_MAX_DELAY', 1.0))
+
+# 연결 장기 보유 감시 (초, 이 시간 이상 반환되지 않은 연결을 호출 위치와 함께 로그로 남김, 0이면 사용 안 함)
+LEAK_THRESHOLD = float(os.environ.get('DB_LEAK_THRESHOLD', 30))
+LEAK_CHECK_INTERVAL = float(os.environ.get('DB_LEAK_CHECK_INTERVAL', 10))
+# 연결을 빌려간 호출 위치로 기록할 프레임 수
+LEAK_STACK_DEPTH = 4
+
+# call_parallel 동시 실행 스레드 수 (각 스레드가 풀 연결을 하나씩 사용)
+# 보고서 풀 크기(DB_REPORTING_POOL_MAX) 이하로 두면 작업 스레드가 풀 연결을 기다리지 않는다
+# (여러 요청의 호출이 겹치면 스레드 풀 대기열에서 기다리므로 풀 대기 시간 초과가 생기지 않음)
+PARALLEL_WORKERS = int(os.environ.get('DB_PARALLEL_WORKERS', 5))
+
+# 조회 결과 캐시 설정
+CACHE_ENABLED = os.environ.get('DB_CACHE_ENABLED', '1') == '1'
+CACHE_MAX_ENTRIES = int(os.environ.get('DB_CACHE_MAX_ENTRIES', 256))
+# 다른 워커 프로세스의 쓰기를 반영하기 위해 DB의 태그 버전(cache_tag_versions)을 확인하는 간격 (초, 0이면 조회마다 확인)
+CACHE_SYNC_INTERVAL = float(os.environ.get('DB_CACHE_SYNC_INTERVAL', 1))
+
+# 캐시할 조회 프로시저: TTL(초)과 의존 태그 (자주 조회되지만 거의 바뀌지 않는 기준 목록)
+# 캐시 대상은 복제 지연된 결과가 캐시되지 않도록 복제본/전용 풀이 아닌 주 DB에서 조회한다 (_select_pool)
+CACHE_RULES = {
+    'get_workers_list': {'ttl': 300, 'tags': ('users',)},
+    'get_manager_list': {'ttl': 300, 'tags': ('users',)},
+    'get_client_list': {'ttl': 300, 'tags': ('clients', 'users')},
+    'get_client_list_by_task_kind': {'ttl': 300, 'tags': ('clients',)},
+    'get_active_client_list': {'ttl': 300, 'tags': ('clients',)},
+    'get_report_managers': {'ttl': 300, 'tags': ('clients', 'users')},
+    'get_notice_list_by_target': {'ttl': 60, 'tags': ('notices', 'users')},
+}
+
+# 쓰기 프로시저가 변경하는 태그 (실행 성공 시 해당 태그의 캐시 무효화)
+CACHE_INVALIDATIONS = {
+    'set_client_insert': ('clients',),
+    'set_client_update': ('clients',),
+    'set_client_delete': ('clients',),
+    'set_user_insert': ('users',),
+    'set_user_update': ('users',),
+    'set_user_delete': ('users',),
+    'set_user_profile_update': ('users',),
+    'set_notice_insert': ('notices',),
+    'set_notice_update': ('notices',),
+    'set_notice_delete': ('notices',),
+}
+
+# get_*이지만 데이터를 변경하므로 쓰기로 취급하는 프로시저 (주 DB에서 실행, 커밋)
+PRIMARY_ONLY_PROCEDURES = {
+    'get_user_login',  # 로그인 이력 기록
+}
+
+# 복제 지연 없이 주 DB에서 조회해야 하는 조회 프로시저 (다른 요청/프로세스가 방금 기록한 값을 읽음)
+PRIMARY_READ_PROCEDURES = {
+    'get_schedule_job',  # 여러 달 스케줄 생성 작업 진행률
+}
+
 # MySQL 연결 설정
 db_config = get_db_config()
+replica_config = get_replica_config()
+pool_config = get_pool_config()
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 끊어진 연결을 의미하는 MySQL 클라이언트 오류 코드
+# 2006: server has gone away, 2013: lost connection, 2055: lost connection (extended),
+# 4031: 유휴 시간 초과로 서버가 연결 종료 (MySQL 8.0.24+)
+DISCONNECT_ERROR_CODES = {2006, 2013, 2055, 4031}
+
+# 서버에 도달하지 못한 접속 오류 (회로 차단기 실패로 계산)
+# 2002: 로컬 소켓 연결 실패, 2003: 서버에 연결할 수 없음, 2005: 알 수 없는 호스트, 2013: 접속 중 연결 끊김
+# 1040(연결 수 초과), 1045(인증 실패) 등 서버가 응답한 오류는 제외
+UNREACHABLE_ERROR_CODES = {2002, 2003, 2005, 2013}
+
+# 쓰기 프로시저는 요청이 서버에 전달되지 않았음이 확실한 경우(2006)에만 재시도
+WRITE_RETRY_ERROR_CODES = {2006}
+
+# 잠금 충돌 오류 (1213: 교착 상태, 1205: 잠금 대기 시간 초과)
+LOCK_RETRY_ERROR_CODES = {1213, 1205}
+
+# 실행 중단 오류 (1317: KILL QUERY로 중단됨, 3024: max_execution_time 초과)
+STATEMENT_TIMEOUT_ERROR_CODES = {1317, 3024}
+
+
+def _error_code(e):
+    """드라이버 예외에서 MySQL 오류 코드 추출"""
+    if isinstance(e, driver.MySQLError) and e.args and isinstance(e.args[0], int):
+        return e.args[0]
+    return None
+
+
+def _is_disconnect_error(e):
+    """연결이 끊어져 발생한 오류인지 여부"""
+    if isinstance(e, driver.InterfaceError):
+        # 이미 닫힌 소켓에 쿼리를 보낸 경우
+        return True
+    return _error_code(e) in DISCONNECT_ERROR_CODES
+
+
+def _is_unreachable_error(e):
+    """DB 서버에 도달하지 못해 발생한 접속 오류인지 여부 (소켓 시간 초과 포함)"""
+    if isinstance(e, (socket.timeout, ConnectionError)):
+        return True
+    return _error_code(e) in UNREACHABLE_ERROR_CODES
+
+
+def _is_read_procedure(proc_name):
+    """조회 전용 프로시저 여부 (명명 규칙: get_*, 데이터를 변경하는 예외 프로시저 제외)"""
+    return proc_name.startswith('get_') and proc_name not in PRIMARY_ONLY_PROCEDURES
+
+class DatabaseUnavailableError(driver.OperationalError):
+    """회로 차단기가 열려 있어 DB 연결을 시도하지 않고 즉시 거부함 (HTTP 503으로 응답)"""
+    
+    def __init__(self, retry_after):
+        self.retry_after = max(1, int(retry_after + 0.999))
+        super().__init__(2003, f"데이터베이스에 연결할 수 없습니다. {self.retry_after}초 후 다시 시도해 주세요.")
+
+
+class StatementTimeoutError(driver.OperationalError):
+    """프로시저 실행이 제한 시간을 넘겨 중단됨"""
+    
+    def __init__(self, label, timeout):
+        self.timeout = timeout
+        super().__init__(1317, f"프로시저 실행 시간이 제한({timeout:g}초)을 초과하여 중단되었습니다: {label}")
+
+
+class CircuitBreaker:
+    """
+    연결 실패가 이어지면 일정 시간 새 연결 시도를 막는 회로 차단기
+    
+    DB 장애 중에 요청마다 연결을 시도하며 접속 제한 시간만큼 스레드가 묶이는 것을 막는다.
+    서버에 도달하지 못한 오류(UNREACHABLE_ERROR_CODES, 소켓 시간 초과)만 실패로 계산하며,
+    차단 중에도 풀에 남아 있는 유휴 연결은 그대로 사용할 수 있다. (새 연결 생성만 차단)
+    - closed: 정상 상태. 연속 실패가 failure_threshold에 도달하면 open
+    - open: 새 연결 시도 없이 즉시 DatabaseUnavailableError. reset_timeout이 지나면 half_open
+    - half_open: 한 스레드만 연결을 시도(probe)하고, 성공하면 closed, 실패하면 다시 open
+      (reset_timeout이 지난 open 상태도 상태 조회에서는 half_open으로 표시)
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold=5, reset_timeout=10):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0       # 연속 연결 실패 수
+        self.opened_at = 0.0
+        self.stats = {'opened': 0, 'rejected': 0}
+    
+    def _reject(self):
+        """차단 중 요청 거부 (lock 보유 상태에서 호출)"""
+        self.stats['rejected'] += 1
+        raise DatabaseUnavailableError(self.opened_at + self.reset_timeout - time.monotonic())
+    
+    def _current_state(self):
+        """reset_timeout이 지난 open 상태를 half_open으로 본 현재 상태 (lock 보유 상태에서 호출)"""
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.state
+    
+    def ensure_available(self):
+        """새 연결을 만들 수 없는 상태(open, probe 진행 중)이면 즉시 예외 (상태를 바꾸지 않음, 대기 전 확인용)"""
+        if self.state == self.CLOSED:
+            return
+        with self.lock:
+            if self.state == self.HALF_OPEN or (
+                    self.state == self.OPEN and time.monotonic() - self.opened_at < self.reset_timeout):
+                self._reject()
+    
+    def before_connect(self):
+        """새 연결 시도 전 호출 (재시도 시점이 되면 이 호출자가 probe가 됨)"""
+        if self.failure_threshold <= 0:
+            return
+        with self.lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                logger.info("DB 회로 차단기 재시도 (half-open)")
+                return
+            self._reject()
+    
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                logger.warning("DB 회로 차단기 닫힘: 연결 복구")
+    
+    def record_failure(self):
+        if self.failure_threshold <= 0:
+            return
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (
+                    self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.stats['opened'] += 1
+                logger.error(f"DB 회로 차단기 열림: 연속 연결 실패 {self.failures}회, "
+                             f"{self.reset_timeout:.0f}초 동안 연결 시도 중단")
+    
+    def get_stats(self):
+        with self.lock:
+            return {
+                'breaker_state': self._current_state(),
+                'breaker_failures': self.failures,
+                'breaker_opened': self.stats['opened'],
+                'breaker_rejected': self.stats['rejected'],
+            }
+
+
+# 호출 위치 기록에서 제외할 내부 파일 (dbconns, contextlib)
+_INTERNAL_FILES = {__file__, contextmanager.__code__.co_filename}
+
+
+def _caller_stack(depth=LEAK_STACK_DEPTH):
+    """연결을 빌려간 호출 위치 ('파일:줄 함수' 리스트, 가까운 호출부터, 내부 프레임 제외)"""
+    frame = sys._getframe(1)
+    stack = []
+    while frame is not None and len(stack) < depth:
+        code = frame.f_code
+        if code.co_filename not in _INTERNAL_FILES:
+            stack.append(f"{os.path.basename(code.co_filename)}:{frame.f_lineno} {code.co_name}")
+        frame = frame.f_back
+    return stack
+
+
+class _Checkout:
+    """사용 중인 연결의 대여 기록 (누수/장기 보유 추적용)"""
+    __slots__ = ('acquired_at', 'started_at', 'thread', 'stack', 'reported')
+
+    def __init__(self, stack):
+        self.acquired_at = time.monotonic()
+        self.started_at = datetime.now()
+        self.thread = threading.current_thread().name
+        self.stack = stack
+        self.reported = False   # 장기 보유 경고 로그 기록 여부
+
+
+class _Waiter:
+    """연결 대기 중인 스레드 (FIFO 대기열 항목)"""
+    __slots__ = ('condition', 'conn', 'granted')
+
+    def __init__(self, lock):
+        self.condition = threading.Condition(lock)
+        self.conn = None        # 반환된 연결을 직접 전달받음
+        self.granted = False    # 전달 완료 여부 (conn이 None이면 새 연결 생성 권한)
+
+
+def _in_transaction(conn):
+    """연결에 열린 트랜잭션이 있는지 여부 (왕복 없이 확인, 드라이버별 방법은 dbdrivers 참고)"""
+    return driver.in_transaction(conn)
+
+def _drop_inherited_connection(conn):
+    """부모 프로세스에서 물려받은 연결의 소켓만 닫기 (서버에 종료 패킷을 보내지 않음)"""
+    try:
+        driver.force_close(conn)
+    except Exception:
+        pass
+
+
 class ConnectionPool:
     """데이터베이스 연결 풀 클래스"""
     
-    def __init__(self, db_config, min_connections=2, max_connections=10):
+    def __init__(self, db_config, min_connections=2, max_connections=10,
+                 max_idle=5, idle_timeout=240, max_lifetime=3600, validate_after=30,
+                 breaker_threshold=5, breaker_reset_timeout=10, checkout_timeout=5, name='primary'):
+        self.name = name
         self.db_config = db_config
         self.min_connections = min_connections
         self.max_connections = max_connections
-        self.pool = []
+        self.checkout_timeout = checkout_timeout
+        self.max_idle = max(max_idle, min_connections)
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.validate_after = validate_after
+        self.pool = []          # 유휴 연결 (마지막에 반환된 연결이 뒤쪽)
         self.in_use = {}
+        self.checkouts = {}     # id(conn) -> _Checkout (사용 중인 연결의 대여 시각/스레드/호출 위치)
+        self.hold_time = LatencyHistogram()  # 연결 보유 시간 분포 (ms)
+        self.created_at = {}    # id(conn) -> 연결 생성 시각
+        self.released_at = {}   # id(conn) -> 풀에 반환된 시각
+        self.opening = 0  # 생성 중인 연결 수 (최대 연결 수 계산에 포함)
         self.lock = threading.RLock()
+        self.waiters = deque()
+        self.stats = self._new_stats()
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset_timeout)
+        self.pid = os.getpid()     # 풀을 생성한 프로세스 (fork 감지용)
+        self.warm_pending = True   # 프로세스별 최초 사용 시 min_connections까지 미리 연결
+    
+    @staticmethod
+    def _new_stats():
+        return {
+            'checkouts': 0,        # 연결 획득 횟수
+            'waits': 0,            # 대기 후 획득한 횟수
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'handoffs': 0,         # 반환 시 대기 스레드에 직접 전달한 횟수
+            'timeouts': 0,
+            'queue_depth_max': 0,
+            'created': 0,          # 새로 생성한 연결 수
+            'closed_idle': 0,      # 유휴 시간 초과로 닫은 연결 수
+            'closed_lifetime': 0,  # 최대 수명 초과로 닫은 연결 수
+            'closed_overflow': 0,  # max_idle 초과로 닫은 연결 수
+            'validations': 0,      # ping 검사 횟수
+            'discarded': 0,        # 오류로 폐기된 연결 수
+            'rollbacks': 0,        # 트랜잭션이 열린 채 반환되어 롤백한 횟수
+        }
     
     def initialize_pool(self):
-        """초기 연결 풀 생성"""
+        """초기 연결 풀 생성 (최소 연결 수까지)"""
         with self.lock:
-            for _ in range(self.min_connections):
+            self.warm_pending = False
+            missing = self.min_connections - len(self.pool) - len(self.in_use) - self.opening
+            for _ in range(missing):
                 try:
                     conn = self._create_connection()
-                    self.pool.append(conn)
+                    self._park(conn)
                 except Exception as e:
+                    # 연결이 안 되면 나머지도 실패하므로 중단 (요청 시 다시 연결)
                     logger.error(f"연결 풀 초기화 중 오류: {str(e)}")
+                    break
     
     def _create_connection(self):
-        """새 데이터베이스 연결 생성"""
+        """새 데이터베이스 연결 생성 (회로 차단기가 열려 있으면 시도하지 않고 즉시 실패)"""
+        self.breaker.before_connect()
         try:
-            conn = pymysql.connect(**self.db_config)
-            
-            # 한국시간 타임존 설정
-            with conn.cursor() as cursor:
-                cursor.execute("SET time_zone = '+09:00'")
-                cursor.execute("SET SESSION time_zone = '+09:00'")
-            
-            return conn
+            # 한국시간 타임존 등 세션 설정은 init_command로 접속 과정에서 처리
+            conn = driver.connect(self.db_config)
         except Exception as e:
+            if _is_unreachable_error(e):
+                self.breaker.record_failure()
+            else:
+                # 연결 수 초과/인증 실패 등은 서버가 응답한 것이므로 차단 사유가 아님
+                self.breaker.record_success()
             logger.error(f"데이터베이스 연결 생성 중 오류: {str(e)}")
             raise
+        self.breaker.record_success()
+        with self.lock:
+            self.created_at[id(conn)] = time.monotonic()
+            self.stats['created'] += 1
+        return conn
+    
+    def reset_after_fork(self):
+        """
+        fork된 자식 프로세스에서 풀 상태 초기화
+        
+        부모에게서 물려받은 연결은 부모 프로세스와 같은 소켓을 공유하므로 close()로
+        종료 패킷(COM_QUIT)을 보내면 부모의 세션까지 끊긴다. 자식 쪽 소켓만 닫고 버린다.
+        fork 시점에 다른 스레드가 잡고 있던 잠금은 자식에서 영원히 풀리지 않으므로 새로 만든다.
+        """
+        inherited = self.pool + list(self.in_use.values())
+        self.lock = threading.RLock()
+        self.pool = []
+        self.in_use = {}
+        self.checkouts = {}
+        self.hold_time = LatencyHistogram()
+        self.created_at = {}
+        self.released_at = {}
+        self.opening = 0
+        self.waiters = deque()
+        self.stats = self._new_stats()
+        self.breaker = CircuitBreaker(self.breaker.failure_threshold, self.breaker.reset_timeout)
+        self.pid = os.getpid()
+        self.warm_pending = True
+        for conn in inherited:
+            _drop_inherited_connection(conn)
+        if inherited:
+            logger.info(f"fork 이후 상속된 DB 연결 {len(inherited)}개 폐기 (pid={self.pid})")
+    
+    def _ensure_process(self):
+        """fork 감지 및 프로세스별 최초 연결 준비
+        
+        register_at_fork 훅이 실행되지 않는 방식(C 확장의 fork 등)으로 fork된 경우에도
+        PID 비교로 상속된 풀을 사용하지 않도록 한다.
+        """
+        if self.pid != os.getpid():
+            self.reset_after_fork()
+        if self.warm_pending:
+            self.initialize_pool()
+    
+    def _park(self, conn):
+        """유휴 풀에 연결 보관 (lock 보유 상태에서 호출)"""
+        self.released_at[id(conn)] = time.monotonic()
+        self.pool.append(conn)
+    
+    def _discard(self, conn):
+        """연결 닫기 및 추적 정보 제거"""
+        with self.lock:
+            self.created_at.pop(id(conn), None)
+            self.released_at.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
     
-    def get_connection(self, timeout=5):
-        """풀에서 연결 가져오기"""
-        start_time = time.time()
+    def _is_expired(self, conn, now):
+        """최대 수명 초과 여부"""
+        if not self.max_lifetime:
+            return False
+        created = self.created_at.get(id(conn))
+        return created is not None and now - created >= self.max_lifetime
+    
+    def _take_idle(self, expired):
+        """재사용 가능한 유휴 연결 꺼내기 (lock 보유 상태에서 호출)
+        
+        최근에 반환된 연결부터 사용(LIFO)하여 오래된 연결이 자연스럽게 유휴 정리되도록 한다.
+        수명이 지난 연결은 expired 리스트에 담아 lock 밖에서 닫는다.
         
-        while time.time() - start_time < timeout:
+        Returns:
+            (연결, ping 검사 필요 여부) 또는 (None, False)
+        """
+        now = time.monotonic()
+        while self.pool:
+            conn = self.pool.pop()
+            released = self.released_at.pop(id(conn), now)
+            if self._is_expired(conn, now):
+                self.stats['closed_lifetime'] += 1
+                expired.append(conn)
+                continue
+            return conn, now - released >= self.validate_after
+        return None, False
+    
+    def _prune_idle(self, expired):
+        """유휴 시간이 지난 연결 정리 (최소 연결 수는 유지, lock 보유 상태에서 호출)"""
+        if not self.idle_timeout:
+            return
+        now = time.monotonic()
+        # 풀 앞쪽이 가장 오래 유휴 상태인 연결
+        while len(self.pool) > self.min_connections:
+            conn = self.pool[0]
+            if now - self.released_at.get(id(conn), now) < self.idle_timeout:
+                break
+            self.pool.pop(0)
+            self.released_at.pop(id(conn), None)
+            self.stats['closed_idle'] += 1
+            expired.append(conn)
+    
+    @property
+    def queue_depth(self):
+        """현재 연결을 기다리는 스레드 수"""
+        return len(self.waiters)
+    
+    def get_stats(self):
+        """연결 풀 상태 및 대기 통계 반환"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats.update({
+                'idle': len(self.pool),
+                'in_use': len(self.in_use),
+                'opening': self.opening,
+                'queue_depth': len(self.waiters),
+                'pid': self.pid,
+                'holders': len(self.checkouts),
+                'hold_p50_ms': self.hold_time.percentile(50),
+                'hold_p95_ms': self.hold_time.percentile(95),
+                'hold_p99_ms': self.hold_time.percentile(99),
+                'hold_max_ms': self.hold_time.max,
+                **self.breaker.get_stats(),
+                'name': self.name,
+                'host': self.db_config.get('host'),
+                'wait_time_avg': (stats['wait_time_total'] / stats['waits']) if stats['waits'] else 0.0,
+            })
+            return stats
+    
+    def _hand_off(self, conn=None):
+        """가장 오래 기다린 스레드에 연결(또는 새 연결 생성 권한)을 전달 (lock 보유 상태에서 호출)"""
+        if not self.waiters:
+            return False
+        waiter = self.waiters.popleft()
+        waiter.conn = conn
+        waiter.granted = True
+        if conn is not None:
+            self.in_use[id(conn)] = conn
+        else:
+            self.opening += 1
+        self.stats['handoffs'] += 1
+        waiter.condition.notify()
+        return True
+    
+    def _open_reserved(self):
+        """예약된 슬롯으로 새 연결 생성 (실패 시 슬롯을 다음 대기자에게 넘김)"""
+        try:
+            conn = self._create_connection()
+        except Exception as e:
+            if not isinstance(e, DatabaseUnavailableError):
+                logger.error(f"새 연결 생성 중 오류: {str(e)}")
             with self.lock:
-                if self.pool:
-                    conn = self.pool.pop(0)
-                    
-                    # 연결 유효성 검사
-                    try:
-                        conn.ping(reconnect=True)
-                    except:
-                        # 연결이 끊어진 경우 새 연결 생성
-                        try:
-                            conn = self._create_connection()
-                        except Exception as e:
-                            logger.error(f"손상된 연결 재생성 중 오류: {str(e)}")
-                            if len(self.pool) + len(self.in_use) < self.min_connections:
-                                continue  # 최소 연결 수 유지를 위해 재시도
-                            raise
-                    
-                    # 사용 중인 연결 추적
+                self.opening -= 1
+                self._hand_off()
+            raise
+        with self.lock:
+            self.opening -= 1
+            self.in_use[id(conn)] = conn
+        return conn
+    
+    def _validate(self, conn):
+        """획득한 연결 유효성 검사 (끊어진 경우 새 연결로 교체)"""
+        with self.lock:
+            self.stats['validations'] += 1
+        try:
+            driver.ping(conn)
+            return conn
+        except Exception:
+            pass
+        
+        # 연결이 끊어진 경우 새 연결 생성
+        with self.lock:
+            self.in_use.pop(id(conn), None)
+            self.opening += 1
+        self._discard(conn)
+        try:
+            return self._open_reserved()
+        except Exception as e:
+            logger.error(f"손상된 연결 재생성 중 오류: {str(e)}")
+            raise
+    
+    def get_connection(self, timeout=None):
+        """
+        풀에서 연결 가져오기 (모두 사용 중이면 FIFO 순서로 대기, 최대 timeout초 또는 checkout_timeout초)
+        
+        회로 차단기가 열려 있어도 유휴 연결이 있으면 사용하고, 새 연결이 필요하면
+        대기하지 않고 DatabaseUnavailableError를 발생시킨다.
+        """
+        self._ensure_process()
+        conn = None
+        reserved = False
+        validate = False
+        unavailable = None
+        expired = []
+        
+        with self.lock:
+            self.stats['checkouts'] += 1
+            self._prune_idle(expired)
+            
+            # 대기자가 있으면 새치기하지 않고 대기열 뒤에 선다
+            if not self.waiters:
+                conn, validate = self._take_idle(expired)
+                if conn is not None:
                     self.in_use[id(conn)] = conn
-                    return conn
-                
+            
+            if conn is None:
+                try:
+                    self.breaker.ensure_available()
+                except DatabaseUnavailableError as e:
+                    unavailable = e
+            
+            if conn is None and unavailable is None and not self.waiters \
+                    and len(self.in_use) + self.opening < self.max_connections:
                 # 최대 연결 수에 도달하지 않았다면 새 연결 생성
-                if len(self.in_use) < self.max_connections:
-                    try:
-                        conn = self._create_connection()
-                        self.in_use[id(conn)] = conn
-                        return conn
-                    except Exception as e:
-                        logger.error(f"새 연결 생성 중 오류: {str(e)}")
-                        raise
+                self.opening += 1
+                reserved = True
             
-            # 연결을 얻지 못했다면 잠시 대기 후 재시도
-            time.sleep(0.1)
+            if conn is None and not reserved and unavailable is None:
+                waiter = _Waiter(self.lock)
+                self.waiters.append(waiter)
+                self.stats['queue_depth_max'] = max(self.stats['queue_depth_max'], len(self.waiters))
+                
+                start_time = time.monotonic()
+                deadline = start_time + (self.checkout_timeout if timeout is None else timeout)
+                while not waiter.granted:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    waiter.condition.wait(remaining)
+                
+                waited = time.monotonic() - start_time
+                self.stats['waits'] += 1
+                self.stats['wait_time_total'] += waited
+                self.stats['wait_time_max'] = max(self.stats['wait_time_max'], waited)
+                
+                if not waiter.granted:
+                    # 타임아웃 발생
+                    self.waiters.remove(waiter)
+                    self.stats['timeouts'] += 1
+                    raise TimeoutError(f"데이터베이스 연결을 얻는 데 시간이 초과되었습니다. ({self.name} 풀)")
+                
+                conn = waiter.conn
+                reserved = conn is None
+        
+        for old_conn in expired:
+            self._discard(old_conn)
+        if unavailable is not None:
+            raise unavailable
         
-        # 타임아웃 발생
-        raise TimeoutError("데이터베이스 연결을 얻는 데 시간이 초과되었습니다.")
+        if reserved:
+            conn = self._open_reserved()
+        elif validate:
+            # 최근까지 사용된 연결(직접 전달받은 연결 포함)은 ping 왕복을 생략
+            conn = self._validate(conn)
+        
+        record = _Checkout(_caller_stack())
+        with self.lock:
+            self.checkouts[id(conn)] = record
+        return conn
     
-    def release_connection(self, conn):
-        """연결을 풀로 반환"""
+    def release_connection(self, conn, discard=False):
+        """
+        연결을 풀로 반환 (대기 중인 스레드가 있으면 바로 전달)
+        
+        반환 시에는 ping하지 않는다. 사용 중 연결 오류가 발생했다면 discard=True로 폐기한다.
+        트랜잭션이 열린 채 반환된 연결은 롤백해 다음 사용자가 깨끗한 상태로 받도록 한다.
+        세션 변수는 초기화하지 않으므로(추가 왕복 방지) 프로시저에서 SET SESSION으로 세션 설정을
+        바꾸지 않는다. 트랜잭션 격리 수준은 트랜잭션을 시작할 때마다 명시한다 (dbdrivers.BEGIN_SQL).
+        """
+        healthy = not discard and driver.is_open(conn)
+        if healthy and _in_transaction(conn):
+            try:
+                conn.rollback()
+                with self.lock:
+                    self.stats['rollbacks'] += 1
+                logger.warning("트랜잭션이 열린 채 반환된 연결을 롤백했습니다.")
+            except Exception:
+                healthy = False
+        
+        replenish = False
+        expired = []
         with self.lock:
-            conn_id = id(conn)
-            if conn_id in self.in_use:
-                del self.in_use[conn_id]
-                
-                # 연결 유효성 검사
-                try:
-                    conn.ping(reconnect=False)
-                    
-                    # 풀 크기가 최소 연결 수보다 작으면 연결 유지
-                    if len(self.pool) < self.min_connections:
-                        self.pool.append(conn)
-                    else:
-                        conn.close()
-                except:
-                    # 연결이 손상된 경우 닫기
-                    try:
-                        conn.close()
-                    except:
-                        pass
-                    
-                    # 최소 연결 수 유지
-                    if len(self.pool) + len(self.in_use) < self.min_connections:
-                        try:
-                            new_conn = self._create_connection()
-                            self.pool.append(new_conn)
-                        except Exception as e:
-                            logger.error(f"연결 풀 재생성 중 오류: {str(e)}")
+            if self.in_use.pop(id(conn), None) is None:
+                return
+            record = self.checkouts.pop(id(conn), None)
+            if record is not None:
+                self.hold_time.observe((time.monotonic() - record.acquired_at) * 1000)
+            if not healthy:
+                self.stats['discarded'] += 1
+            self._prune_idle(expired)
+            
+            if healthy and self._is_expired(conn, time.monotonic()):
+                # 최대 수명이 지난 연결은 재사용하지 않고 교체
+                self.stats['closed_lifetime'] += 1
+                healthy = False
+            
+            if healthy:
+                if self._hand_off(conn):
+                    conn = None
+                # 유휴 연결 수가 max_idle보다 작으면 연결 유지
+                elif len(self.pool) < self.max_idle:
+                    self._park(conn)
+                    conn = None
+                else:
+                    self.stats['closed_overflow'] += 1
+            elif self._hand_off():
+                # 대기자가 직접 새 연결을 생성한다
+                pass
+            elif len(self.pool) + len(self.in_use) + self.opening < self.min_connections:
+                # 최소 연결 수 유지
+                self.opening += 1
+                replenish = True
+        
+        # 연결 닫기 (초과분, 수명 초과 또는 손상된 연결)
+        for old_conn in expired:
+            self._discard(old_conn)
+        if conn is not None:
+            self._discard(conn)
+        
+        if replenish:
+            try:
+                new_conn = self._create_connection()
+            except Exception as e:
+                if not isinstance(e, DatabaseUnavailableError):
+                    logger.error(f"연결 풀 재생성 중 오류: {str(e)}")
+                with self.lock:
+                    self.opening -= 1
+                    self._hand_off()
+                return
+            with self.lock:
+                self.opening -= 1
+                if not self._hand_off(new_conn):
+                    self._park(new_conn)
+    
+    def kill_query(self, thread_id):
+        """
+        실행 중인 쿼리 중단 (별도 연결에서 KILL QUERY)
+        
+        풀 연결이 모두 사용 중이어도 동작하도록 풀 밖에서 일회용 연결을 연다.
+        """
+        killer = driver.connect(self.db_config)
+        try:
+            with killer.cursor() as cursor:
+                cursor.execute('KILL QUERY %s', (thread_id,))
+        finally:
+            killer.close()
     
     def close_all(self):
         """모든 연결 닫기"""
@@ -180,6 +873,8 @@ class ConnectionPool:
                 except:
                     pass
             self.pool.clear()
+            self.created_at.clear()
+            self.released_at.clear()
             
             # 사용 중인 연결 닫기
             for conn_id, conn in list(self.in_use.items()):
@@ -188,29 +883,664 @@ class ConnectionPool:
                 except:
                     pass
             self.in_use.clear()
+            self.checkouts.clear()
+    
+    def get_holders(self):
+        """현재 연결을 빌려간 호출 목록 (보유 시간 포함)"""
+        now = time.monotonic()
+        with self.lock:
+            return [{
+                'pool': self.name,
+                'held_ms': (now - record.acquired_at) * 1000,
+                'acquired_at': record.started_at,
+                'thread': record.thread,
+                'stack': record.stack,
+            } for record in self.checkouts.values()]
+    
+    def find_long_holders(self, threshold):
+        """threshold(초) 이상 반환되지 않은 연결 중 아직 보고하지 않은 대여 기록"""
+        now = time.monotonic()
+        found = []
+        with self.lock:
+            for record in self.checkouts.values():
+                if not record.reported and now - record.acquired_at >= threshold:
+                    record.reported = True
+                    found.append(record)
+        return found
+
+_MISS = object()
+
+
+def _copy_result(result):
+    """캐시 결과 복사 (호출한 쪽에서 행을 수정해도 캐시가 오염되지 않도록)"""
+    if isinstance(result, list):
+        # CompactRow는 변경 불가이므로 그대로 공유
+        return [dict(row) if isinstance(row, dict) else row for row in result]
+    if isinstance(result, dict):
+        return dict(result)
+    return result
+
+
+class CompactRow:
+    """
+    튜플 기반 경량 결과 행 (return_list(row_format='compact'))
+    
+    컬럼 이름 -> 위치 인덱스를 목록 전체가 공유하고 행마다 값 튜플만 보관하므로
+    행마다 키 문자열을 담는 dict보다 메모리를 크게 줄인다.
+    row['col'], row.get('col'), 템플릿의 row.col 접근을 지원하며 값 변경은 불가하다.
+    (dict가 아니므로 JSON 응답에 넣을 때는 to_dict()로 변환)
+    """
+    __slots__ = ('_index', '_values')
+    
+    def __init__(self, index, values):
+        self._index = index
+        self._values = values
+    
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+    
+    def get(self, key, default=None):
+        position = self._index.get(key)
+        return default if position is None else self._values[position]
+    
+    def __contains__(self, key):
+        return key in self._index
+    
+    def __iter__(self):
+        return iter(self._index)
+    
+    def __len__(self):
+        return len(self._index)
+    
+    def keys(self):
+        return self._index.keys()
+    
+    def values(self):
+        return list(self._values)
+    
+    def items(self):
+        return [(key, self._values[position]) for key, position in self._index.items()]
+    
+    def to_dict(self):
+        return dict(self.items())
+    
+    def __eq__(self, other):
+        if isinstance(other, CompactRow):
+            return self.items() == other.items()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"CompactRow({self.to_dict()!r})"
+
+
+def _fetch_compact_rows(cursor):
+    """튜플 커서 결과를 CompactRow 목록으로 변환 (컬럼 인덱스는 전체 행이 공유)"""
+    if cursor.description is None:
+        return []
+    index = {column[0]: position for position, column in enumerate(cursor.description)}
+    return [CompactRow(index, values) for values in cursor.fetchall()]
+
+
+class ProcedureCache:
+    """
+    조회 프로시저 결과 캐시 (TTL + LRU 크기 제한 + 태그 기반 무효화)
+    
+    프로세스 내 메모리 캐시이므로 같은 프로세스의 쓰기는 바로 무효화하고,
+    다른 워커 프로세스의 쓰기는 sync_interval마다 DB의 태그 버전(loader)을 읽어
+    버전이 바뀐 태그를 무효화한다. (쓰기 프로시저와 같은 트랜잭션에서 버전 증가)
+    """
+    
+    def __init__(self, rules, invalidations, max_entries=256, enabled=True, loader=None, sync_interval=1.0):
+        self.rules = rules
+        self.invalidations = invalidations
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.loader = loader                 # DB의 태그 버전 조회 함수 ({tag: version} 반환)
+        self.sync_interval = sync_interval
+        self.remote_versions = None          # 마지막으로 확인한 태그 버전 (None이면 아직 확인 전)
+        self.synced_at = 0.0
+        self.syncing = False
+        self.entries = OrderedDict()   # key -> (만료 시각, 결과, 태그)
+        self.tag_keys = {}             # tag -> 해당 태그에 의존하는 key 집합
+        self.generations = {}          # tag -> 무효화 세대 (조회 중 무효화된 결과 저장 방지)
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0,
+                      'syncs': 0, 'sync_errors': 0}
+    
+    def is_cacheable(self, proc_name):
+        return self.enabled and proc_name in self.rules
+    
+    @staticmethod
+    def _key(proc_name, params, mode):
+        return (proc_name, mode, tuple(params) if params else ())
+    
+    def _remove(self, key):
+        """항목 제거 (lock 보유 상태에서 호출)"""
+        _, _, tags = self.entries.pop(key)
+        for tag in tags:
+            keys = self.tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+    
+    def sync(self):
+        """
+        다른 워커 프로세스의 무효화 반영 (sync_interval마다 한 스레드만 태그 버전 조회)
+        
+        버전이 바뀐 태그는 무효화하고, 조회에 실패하면 확인할 수 없으므로 캐시를 모두 비운다.
+        """
+        if self.loader is None:
+            return
+        with self.lock:
+            if self.syncing or time.monotonic() - self.synced_at < self.sync_interval:
+                return
+            self.syncing = True
+        try:
+            versions = self.loader()
+        except Exception as e:
+            logger.warning(f"캐시 태그 버전 조회 실패로 캐시를 비웁니다: {str(e)}")
+            versions = None
+        with self.lock:
+            self.syncing = False
+            self.synced_at = time.monotonic()
+            previous = self.remote_versions
+            self.remote_versions = versions
+            if versions is None:
+                self.stats['sync_errors'] += 1
+            else:
+                self.stats['syncs'] += 1
+        if previous is None or versions is None:
+            # 기준 버전이 없는 동안 저장된 결과는 확인할 수 없으므로 비운다
+            self.clear()
+            return
+        changed = [tag for tag in set(previous) | set(versions) if previous.get(tag) != versions.get(tag)]
+        if changed:
+            self.invalidate_tags(changed)
+    
+    def get(self, proc_name, params, mode):
+        """캐시 조회 (없으면 _MISS 반환)"""
+        if not self.is_cacheable(proc_name):
+            return _MISS
+        self.sync()
+        key = self._key(proc_name, params, mode)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                self.stats['expirations'] += 1
+                entry = None
+            if entry is None:
+                self.stats['misses'] += 1
+                return _MISS
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            result = entry[1]
+        return _copy_result(result)
+    
+    def token(self, proc_name):
+        """조회 시작 시점의 태그 세대 (put에 전달)"""
+        if not self.is_cacheable(proc_name):
+            return None
+        with self.lock:
+            return tuple(self.generations.get(tag, 0) for tag in self.rules[proc_name]['tags'])
+    
+    def put(self, proc_name, params, mode, result, token):
+        """조회 결과 저장 (조회 도중 관련 태그가 무효화되었으면 저장하지 않음)"""
+        if token is None or not self.is_cacheable(proc_name):
+            return
+        rule = self.rules[proc_name]
+        tags = rule['tags']
+        key = self._key(proc_name, params, mode)
+        with self.lock:
+            if token != tuple(self.generations.get(tag, 0) for tag in tags):
+                return
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (time.monotonic() + rule['ttl'], _copy_result(result), tags)
+            for tag in tags:
+                self.tag_keys.setdefault(tag, set()).add(key)
+            while len(self.entries) > self.max_entries:
+                self._remove(next(iter(self.entries)))
+                self.stats['evictions'] += 1
+    
+    def invalidate_tags(self, tags):
+        """태그에 의존하는 캐시 항목 삭제"""
+        with self.lock:
+            for tag in tags:
+                self.generations[tag] = self.generations.get(tag, 0) + 1
+                for key in list(self.tag_keys.pop(tag, ())):
+                    if key in self.entries:
+                        self._remove(key)
+                        self.stats['invalidations'] += 1
+    
+    def invalidate_for(self, proc_name):
+        """쓰기 프로시저 실행 후 관련 태그 무효화"""
+        tags = self.invalidations.get(proc_name)
+        if tags:
+            self.invalidate_tags(tags)
+    
+    def clear(self):
+        with self.lock:
+            for tag in self.tag_keys:
+                self.generations[tag] = self.generations.get(tag, 0) + 1
+            self.entries.clear()
+            self.tag_keys.clear()
+    
+    def reset_after_fork(self):
+        """fork된 자식 프로세스에서 잠금 재생성 및 상속된 캐시 비우기"""
+        self.lock = threading.Lock()
+        self.remote_versions = None
+        self.synced_at = 0.0
+        self.syncing = False
+        self.clear()
+    
+    def get_stats(self):
+        """캐시 적중/실패 통계 반환"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self.entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] / lookups) if lookups else 0.0
+        return stats
+
+class LatencyHistogram:
+    """고정 버킷 히스토그램 (백분위수는 해당 버킷의 상한값으로 추정)"""
+    
+    # 밀리초 단위 버킷 상한
+    BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+    
+    def __init__(self, buckets=None):
+        self.buckets = buckets or self.BUCKETS
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def observe(self, value):
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+    
+    def percentile(self, p):
+        """p(0~100) 백분위수 추정값"""
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100.0
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                if i < len(self.buckets):
+                    return min(float(self.buckets[i]), self.max)
+                return self.max
+        return self.max
+    
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class ProcedureMetrics:
+    """프로시저별 호출 수, 소요 시간, 풀 대기 시간, 반환 행 수, 오류 집계"""
+    
+    # 요청당 호출 수 버킷
+    REQUEST_BUCKETS = (1, 2, 3, 5, 8, 13, 20, 30, 50, 100)
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset_after_fork(self):
+        """fork된 자식 프로세스에서 잠금 재생성 (집계는 워커 프로세스별로 새로 시작)"""
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self.lock:
+            self.procedures = {}
+            self.request_calls = LatencyHistogram(self.REQUEST_BUCKETS)
+            self.started_at = datetime.now()
+    
+    def _entry(self, proc_name):
+        """프로시저별 집계 항목 (lock 보유 상태에서 호출)"""
+        entry = self.procedures.get(proc_name)
+        if entry is None:
+            entry = self.procedures[proc_name] = {
+                'calls': 0,
+                'errors': 0,
+                'timeouts': 0,
+                'retries': 0,          # 재시도 횟수 (끊어진 연결 + 잠금 충돌)
+                'lock_conflicts': 0,   # 교착 상태/잠금 대기 시간 초과로 재시도한 횟수
+                'cache_hits': 0,
+                'rows': 0,
+                'latency': LatencyHistogram(),
+                'pool_wait': LatencyHistogram(),
+                'last_error': None,
+            }
+        return entry
+    
+    def record(self, proc_name, elapsed_ms, wait_ms, rows, error=None):
+        """프로시저 호출 1건 기록"""
+        with self.lock:
+            entry = self._entry(proc_name)
+            entry['calls'] += 1
+            entry['rows'] += rows
+            entry['latency'].observe(elapsed_ms)
+            entry['pool_wait'].observe(wait_ms)
+            if error is not None:
+                entry['errors'] += 1
+                entry['last_error'] = f"{type(error).__name__}: {error}"
+                if isinstance(error, StatementTimeoutError):
+                    entry['timeouts'] += 1
+    
+    def record_retry(self, proc_names, lock_conflict=False):
+        """재시도 1회 기록 (일괄 실행이면 포함된 모든 프로시저에 기록)"""
+        with self.lock:
+            for proc_name in proc_names:
+                entry = self._entry(proc_name)
+                entry['retries'] += 1
+                if lock_conflict:
+                    entry['lock_conflicts'] += 1
+    
+    def record_cache_hit(self, proc_name):
+        with self.lock:
+            self._entry(proc_name)['cache_hits'] += 1
+    
+    def record_request(self, calls):
+        """요청 하나에서 발생한 프로시저 호출 수 기록"""
+        with self.lock:
+            self.request_calls.observe(calls)
+    
+    def snapshot(self):
+        """프로시저별 통계 (총 소요 시간 내림차순)"""
+        with self.lock:
+            rows = []
+            for proc_name, entry in self.procedures.items():
+                latency = entry['latency']
+                pool_wait = entry['pool_wait']
+                rows.append({
+                    'proc_name': proc_name,
+                    'calls': entry['calls'],
+                    'errors': entry['errors'],
+                    'timeouts': entry['timeouts'],
+                    'retries': entry['retries'],
+                    'lock_conflicts': entry['lock_conflicts'],
+                    'cache_hits': entry['cache_hits'],
+                    'rows': entry['rows'],
+                    'avg_rows': (entry['rows'] / entry['calls']) if entry['calls'] else 0,
+                    'total_ms': latency.total,
+                    'avg_ms': latency.mean,
+                    'p50_ms': latency.percentile(50),
+                    'p95_ms': latency.percentile(95),
+                    'p99_ms': latency.percentile(99),
+                    'max_ms': latency.max,
+                    'wait_avg_ms': pool_wait.mean,
+                    'wait_p95_ms': pool_wait.percentile(95),
+                    'last_error': entry['last_error'],
+                })
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+    
+    def request_snapshot(self):
+        """요청당 호출 수 통계"""
+        with self.lock:
+            histogram = self.request_calls
+            return {
+                'requests': histogram.count,
+                'avg': histogram.mean,
+                'p50': histogram.percentile(50),
+                'p95': histogram.percentile(95),
+                'p99': histogram.percentile(99),
+                'max': histogram.max,
+                'started_at': self.started_at,
+            }
 
 # 전역 연결 풀 생성
-connection_pool = ConnectionPool(db_config)
+connection_pool = ConnectionPool(db_config, name='oltp', **pool_config)
+
+# 복제본 연결 풀 (설정된 경우에만, get_* 조회 전용)
+replica_pool = ConnectionPool(replica_config, name='replica', **pool_config) if replica_config else None
+
+# 보고서 조회 전용 풀 (복제본이 있으면 복제본에 연결)
+reporting_pool = ConnectionPool(replica_config or db_config, name='reporting', **REPORTING_POOL_CONFIG)
+
+# 이름별 연결 풀 (PROCEDURE_POOLS/BLUEPRINT_POOLS에서 참조)
+pools = {pool.name: pool for pool in (connection_pool, replica_pool, reporting_pool) if pool is not None}
+
+def get_pool_stats():
+    """모든 연결 풀의 상태 목록"""
+    return [pool.get_stats() for pool in pools.values()]
+
+def get_connection_holders():
+    """모든 풀에서 현재 연결을 빌려간 호출 목록 (오래 보유한 순)"""
+    holders = [holder for pool in pools.values() for holder in pool.get_holders()]
+    holders.sort(key=lambda holder: holder['held_ms'], reverse=True)
+    return holders
+
+_watchdog_pid = None
+_watchdog_lock = threading.Lock()
+
+def _leak_watchdog():
+    """LEAK_THRESHOLD 이상 반환되지 않은 연결을 주기적으로 찾아 로그로 남기는 감시 스레드"""
+    while True:
+        time.sleep(LEAK_CHECK_INTERVAL)
+        try:
+            for pool in list(pools.values()):
+                for record in pool.find_long_holders(LEAK_THRESHOLD):
+                    held = time.monotonic() - record.acquired_at
+                    logger.warning(f"DB 연결 장기 보유: {pool.name} 풀, {held:.1f}초, 스레드 {record.thread}, "
+                                   f"호출 위치: {' <- '.join(record.stack)}")
+        except Exception as e:
+            logger.error(f"연결 보유 감시 중 오류: {str(e)}")
+
+def _ensure_leak_watchdog():
+    """프로세스별 감시 스레드 시작 (fork된 워커에서는 처음 연결을 사용할 때 다시 시작)"""
+    global _watchdog_pid
+    if not LEAK_THRESHOLD or _watchdog_pid == os.getpid():
+        return
+    with _watchdog_lock:
+        if _watchdog_pid == os.getpid():
+            return
+        _watchdog_pid = os.getpid()
+        threading.Thread(target=_leak_watchdog, name='dbconns-leak-watchdog', daemon=True).start()
+
+# 전역 프로시저 호출 통계
+procedure_metrics = ProcedureMetrics()
+
+# 호출 단위 측정값 (스레드별, 풀 대기 시간 누적)
+_call_state = threading.local()
+
+def _load_cache_versions():
+    """
+    DB의 조회 캐시 태그 버전 ({tag: version}, 복제 지연이 없도록 주 DB에서 조회)
+    
+    요청에 고정되지 않는 짧은 연결을 사용한다. (get_db_connection을 쓰면 캐시 확인만 한 요청도
+    끝날 때까지 oltp 풀 연결을 붙잡아 보고서 화면 등이 주 풀 연결을 차지하게 된다)
+    """
+    start = time.perf_counter()
+    rows = None
+    error = None
+    try:
+        conn = connection_pool.get_connection()
+        discard = False
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute('CALL get_cache_tag_versions()')
+                rows = cursor.fetchall()
+        except Exception as e:
+            discard = _is_disconnect_error(e)
+            raise
+        finally:
+            connection_pool.release_connection(conn, discard=discard)
+        return {row['tag']: row['version'] for row in rows}
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        procedure_metrics.record('get_cache_tag_versions', (time.perf_counter() - start) * 1000, 0,
+                                 _result_rows(rows), error)
+
+def _bump_cache_versions(conn, proc_names):
+    """쓰기 프로시저가 변경한 태그의 버전 증가 (쓰기와 같은 연결/트랜잭션에서 실행, 다른 워커의 캐시 무효화용)"""
+    if not CACHE_ENABLED:
+        return
+    tags = sorted({tag for proc_name in proc_names for tag in CACHE_INVALIDATIONS.get(proc_name, ())})
+    if tags:
+        with conn.cursor() as cursor:
+            cursor.execute('CALL set_cache_tag_versions_bump(%s)', (json.dumps(tags),))
+
+# 전역 조회 결과 캐시
+procedure_cache = ProcedureCache(CACHE_RULES, CACHE_INVALIDATIONS,
+                                 max_entries=CACHE_MAX_ENTRIES, enabled=CACHE_ENABLED,
+                                 loader=_load_cache_versions, sync_interval=CACHE_SYNC_INTERVAL)
+
+def init_app(app):
+    """Flask 앱에 요청 단위 연결 반환 처리 등록"""
+    app.teardown_request(release_request_connection)
+
+
+def _count_request_calls(count=1):
+    """현재 요청의 프로시저 호출 수 누적 (요청 컨텍스트 밖에서는 무시)"""
+    if has_request_context():
+        g._db_call_count = g.get('_db_call_count', 0) + count
+
+
+def release_request_connection(exc=None):
+    """현재 요청에 고정된 연결을 풀로 반환 (teardown_request에서 호출)"""
+    calls = g.pop('_db_call_count', 0)
+    if calls:
+        procedure_metrics.record_request(calls)
+    g.pop('_db_wrote', None)
+    
+    conns = g.pop('_db_conns', None)
+    for pool, conn in (conns or {}).values():
+        try:
+            pool.release_connection(conn)
+        except Exception as e:
+            logger.error(f"요청 연결 반환 중 오류: {str(e)}")
+
+
+def _reads_from_primary():
+    """현재 요청(또는 작업 스레드)에서 이미 쓰기를 했는지 여부 (read-your-writes)"""
+    if has_request_context():
+        return g.get('_db_wrote', False)
+    return getattr(_call_state, 'read_primary', False)
+
+
+def _mark_write():
+    """쓰기 실행 표시 (이후 같은 요청의 조회는 복제 지연과 무관하게 주 DB에서 실행)"""
+    if has_request_context():
+        g._db_wrote = True
+
+
+def _blueprint_pool_name():
+    """현재 요청(또는 call_parallel 작업 스레드)의 블루프린트에 배정된 풀 이름"""
+    if has_request_context():
+        return BLUEPRINT_POOLS.get(request.blueprint)
+    return getattr(_call_state, 'blueprint_pool', None)
+
+
+def _select_pool(read_only, proc_names=()):
+    """
+    실행할 연결 풀 선택
+    
+    쓰기는 항상 oltp 풀(주 DB)에서 실행한다.
+    조회는 PROCEDURE_POOLS/BLUEPRINT_POOLS에 배정된 풀(보고서 등)을 우선 사용하고,
+    배정이 없으면 복제본이 설정된 경우 복제본으로 보낸다. (PRIMARY_READ_PROCEDURES는 항상 주 DB)
+    캐시 대상 조회도 주 DB에서 실행한다. 복제본이 지연되면 무효화 직후 쓰기 전 결과가
+    캐시되어 TTL 동안 모든 워커에 남기 때문이다.
+    같은 요청에서 쓰기를 한 뒤의 조회는 방금 쓴 내용을 읽을 수 있도록 주 DB를 사용한다.
+    """
+    if not read_only or _reads_from_primary():
+        return connection_pool
+    if any(proc_name in PRIMARY_READ_PROCEDURES or procedure_cache.is_cacheable(proc_name)
+           for proc_name in proc_names):
+        return connection_pool
+    for proc_name in proc_names:
+        if proc_name in PROCEDURE_POOLS:
+            return pools[PROCEDURE_POOLS[proc_name]]
+    pool_name = _blueprint_pool_name()
+    if pool_name is not None:
+        return pools[pool_name]
+    return replica_pool or connection_pool
+
+
+def _checkout(pool):
+    """
+    풀에서 연결 획득 (복제본 풀 연결 실패 시에만 주 DB로 대체)
+    
+    보고서 등 전용 풀은 연결이 부족하거나 차단되어도 주 풀 연결을 빌리지 않고
+    자기 풀의 대기 시간 안에서 기다리거나 실패한다. (현장 저장/업로드용 연결 보호)
+    """
+    _ensure_leak_watchdog()
+    try:
+        return pool, pool.get_connection()
+    except (driver.OperationalError, TimeoutError) as e:
+        if pool is not replica_pool:
+            raise
+        logger.warning(f"복제본 연결 실패로 주 DB에서 조회: {str(e)}")
+        return connection_pool, connection_pool.get_connection()
+
 
 @contextmanager
-def get_db_connection():
-    """데이터베이스 연결을 안전하게 획득하고 반환하는 컨텍스트 매니저"""
+def get_db_connection(read_only=False, proc_names=()):
+    """
+    데이터베이스 연결을 안전하게 획득하고 반환하는 컨텍스트 매니저
+    
+    Flask 요청 처리 중에는 요청(g)마다 풀별로 연결 하나를 고정해 재사용하고,
+    요청이 끝날 때(teardown_request) 풀로 반환한다.
+    요청 컨텍스트 밖(백그라운드 작업 등)에서는 호출마다 획득/반환한다.
+    
+    Args:
+        read_only: 조회 전용 여부 (True이면 복제본/전용 풀 연결을 사용할 수 있음)
+        proc_names: 실행할 프로시저 이름 (PROCEDURE_POOLS 풀 배정용)
+    """
+    request_scoped = has_request_context()
+    pool = _select_pool(read_only, proc_names)
+    key = pool.name
     conn = None
+    discard = False
     try:
-        conn = connection_pool.get_connection()
+        wait_start = time.perf_counter()
+        if request_scoped:
+            conns = g.setdefault('_db_conns', {})
+            pinned = conns.get(key)
+            if pinned is None:
+                pinned = _checkout(pool)
+                conns[key] = pinned
+            pool, conn = pinned
+        else:
+            pool, conn = _checkout(pool)
+        _call_state.pool_wait = getattr(_call_state, 'pool_wait', 0.0) + (time.perf_counter() - wait_start)
         yield conn
     except Exception as e:
-        if conn:
-            try:
-                conn.rollback()
-            except:
-                pass
-        logger.error(f"데이터베이스 연결 사용 중 오류: {str(e)}")
+        if _is_disconnect_error(e):
+            # 끊어진 연결은 풀에 되돌리지 않고 폐기
+            discard = True
+            logger.warning(f"데이터베이스 연결 끊김: {str(e)}")
+        elif not isinstance(e, DatabaseUnavailableError):
+            if conn:
+                try:
+                    conn.rollback()
+                except:
+                    pass
+            logger.error(f"데이터베이스 연결 사용 중 오류: {str(e)}")
         raise
     finally:
-        if conn:
+        if conn and (discard or not request_scoped):
+            if request_scoped:
+                g.get('_db_conns', {}).pop(key, None)
             try:
-                connection_pool.release_connection(conn)
+                pool.release_connection(conn, discard=discard)
             except Exception as e:
                 logger.error(f"연결 반환 중 오류: {str(e)}")
 
@@ -232,6 +1562,292 @@ def _build_call_statement(proc_name, params):
     else:
         return f"CALL {proc_name}()"
 
+def _result_rows(result):
+    """결과의 행 수 (통계용)"""
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return 0 if result is None else 1
+
+class _Transaction:
+    """transaction() 블록 상태 (블록을 연 스레드에 저장)"""
+    __slots__ = ('conn', 'read_only', 'written')
+
+    def __init__(self, conn, read_only):
+        self.conn = conn
+        self.read_only = read_only
+        self.written = set()    # 블록 안에서 실행한 쓰기 프로시저 (커밋 후 캐시 무효화)
+
+
+def _current_transaction():
+    """현재 스레드에서 열려 있는 transaction() 블록 (없으면 None)"""
+    return getattr(_call_state, 'transaction', None)
+
+
+def _in_write_transaction():
+    tx = _current_transaction()
+    return tx is not None and not tx.read_only
+
+
+@contextmanager
+def transaction(read_only=False):
+    """
+    여러 프로시저 호출을 하나의 트랜잭션으로 묶는 컨텍스트 매니저
+    
+    블록 안의 execute_*/return_list/call_many 호출은 같은 연결에서 실행되고,
+    블록이 정상 종료되면 커밋, 예외가 발생하면 롤백한다.
+    read_only=True이면 START TRANSACTION READ ONLY(REPEATABLE READ)로 여러 조회가 같은 스냅샷을 보도록 한다.
+    (복제본이 설정되어 있으면 복제본에서 실행)
+    
+    블록 밖의 단일 호출은 조회는 autocommit, 쓰기는 호출마다 트랜잭션으로 실행된다.
+    return_iter와 call_parallel은 별도 연결을 사용하므로 블록에 포함되지 않는다.
+    
+    사용 예:
+        with conn.transaction():
+            conn.execute_return('set_task_area_log', [...])
+            conn.execute_return('set_task_schedule_complete', [...])
+    
+    Args:
+        read_only: 읽기 전용 트랜잭션 여부
+    """
+    current = _current_transaction()
+    if current is not None:
+        # 중첩된 블록은 바깥 트랜잭션에 포함
+        if current.read_only and not read_only:
+            raise RuntimeError("읽기 전용 트랜잭션 안에서 쓰기 트랜잭션을 시작할 수 없습니다.")
+        yield
+        return
+    
+    with get_db_connection(read_only) as conn:
+        driver.begin(conn, read_only)
+        tx = _Transaction(conn, read_only)
+        _call_state.transaction = tx
+        try:
+            yield
+        except BaseException:
+            _call_state.transaction = None
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
+        _call_state.transaction = None
+        conn.commit()
+    
+    if not read_only:
+        _mark_write()
+        # 커밋 전에 다른 요청이 캐시에 담았을 수 있는 이전 데이터 제거
+        for proc_name in tx.written:
+            procedure_cache.invalidate_for(proc_name)
+
+def _pool_of(conn):
+    """연결을 빌려준 풀 찾기"""
+    for pool in pools.values():
+        if id(conn) in pool.in_use:
+            return pool
+    return connection_pool
+
+
+class _StatementTimer:
+    """
+    제한 시간이 지나면 별도 연결에서 KILL QUERY를 보내는 타이머
+    
+    중단된 프로시저는 1317 오류로 끝나고 연결은 그대로 재사용할 수 있다.
+    중단 요청을 보내는 동안에는 실행 스레드가 다음 쿼리로 넘어가지 않도록 잠금으로 막는다.
+    """
+    
+    def __init__(self, conn, timeout):
+        self.conn = conn
+        self.thread_id = conn.thread_id()
+        self.lock = threading.Lock()
+        self.done = False
+        self.timer = threading.Timer(timeout, self._kill)
+        self.timer.daemon = True
+    
+    def __enter__(self):
+        self.timer.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.timer.cancel()
+        with self.lock:
+            self.done = True
+        return False
+    
+    def _kill(self):
+        with self.lock:
+            if self.done:
+                return
+            try:
+                _pool_of(self.conn).kill_query(self.thread_id)
+            except Exception as e:
+                logger.error(f"제한 시간 초과 쿼리 중단 실패: thread_id={self.thread_id}, {str(e)}")
+
+
+def _statement_timeout(proc_names, timeout=None):
+    """
+    실행 제한 시간 결정 (초, None이면 제한 없음)
+    
+    인자로 지정한 값이 우선이고, 없으면 STATEMENT_TIMEOUTS 또는 DEFAULT_STATEMENT_TIMEOUT을 사용한다.
+    일괄 실행(call_many)은 각 프로시저 제한 시간의 합이며, 하나라도 제한이 없으면 제한하지 않는다.
+    """
+    if timeout is not None:
+        return timeout or None
+    total = 0
+    for proc_name in proc_names:
+        limit = STATEMENT_TIMEOUTS.get(proc_name, DEFAULT_STATEMENT_TIMEOUT)
+        if not limit:
+            return None
+        total += limit
+    return total or None
+
+
+def _run_statement(conn, sql, args, fetch, cursor_class, timeout, label):
+    """커서로 SQL 실행 후 결과 읽기 (timeout 초과 시 StatementTimeoutError)"""
+    if not timeout:
+        with conn.cursor(cursor_class) as cursor:
+            cursor.execute(sql, args)
+            return fetch(cursor) if fetch else None
+    try:
+        with _StatementTimer(conn, timeout):
+            with conn.cursor(cursor_class) as cursor:
+                cursor.execute(sql, args)
+                return fetch(cursor) if fetch else None
+    except driver.OperationalError as e:
+        if _error_code(e) in STATEMENT_TIMEOUT_ERROR_CODES:
+            raise StatementTimeoutError(label, timeout) from e
+        raise
+
+
+def _execute_in_transaction(tx, proc_names, sql, args, fetch, cursor_class=None, timeout=None):
+    """
+    transaction() 블록의 연결에서 SQL 실행
+    
+    연결이 끊어지면 트랜잭션 전체가 무효이므로 재시도하지 않고, 커밋은 블록 종료 시 한 번만 한다.
+    """
+    result = _run_statement(tx.conn, sql, args, fetch, cursor_class, timeout, ', '.join(proc_names))
+    written = [name for name in proc_names if not _is_read_procedure(name)]
+    if written:
+        _bump_cache_versions(tx.conn, written)
+        tx.written.update(written)
+    return result
+
+def _execute_statement(proc_names, sql, args, fetch, commit, read_only, cursor_class=None, timeout=None):
+    """
+    SQL 실행 공통 처리 (프로시저별 소요 시간/풀 대기 시간/행 수/오류 기록)
+    
+    풀에서 꺼낸 연결은 오래 유휴 상태였던 경우에만 검사하므로,
+    끊어진 연결로 인한 오류는 새 연결로 한 번 재시도한다.
+    (쓰기 프로시저는 서버에 요청이 전달되지 않은 경우에만 재시도)
+    
+    Args:
+        proc_names: 실행하는 프로시저 이름 리스트 (여러 개면 결과도 같은 순서의 리스트)
+        sql: 실행할 SQL
+        args: SQL 파라미터
+        fetch: 커서에서 결과를 읽는 함수 (None이면 결과 없음)
+        commit: 실행 후 커밋 여부
+        read_only: 조회 전용 여부 (재시도 범위 결정)
+        cursor_class: 커서 클래스 (None이면 연결 기본값 DictCursor)
+        timeout: 실행 제한 시간 (초, None이면 STATEMENT_TIMEOUTS 설정값, 0이면 제한 없음)
+    """
+    timeout = _statement_timeout(proc_names, timeout)
+    _call_state.pool_wait = 0.0
+    start = time.perf_counter()
+    result = None
+    error = None
+    try:
+        tx = _current_transaction()
+        if tx is not None:
+            result = _execute_in_transaction(tx, proc_names, sql, args, fetch, cursor_class, timeout)
+        else:
+            result = _execute_with_retry(proc_names, sql, args, fetch, commit, read_only, cursor_class, timeout)
+        return result
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        wait_ms = _call_state.pool_wait * 1000
+        # 일괄 실행(call_many)은 각 프로시저에 전체 소요 시간을 기록
+        if len(proc_names) == 1:
+            per_proc_rows = [_result_rows(result)]
+        else:
+            per_proc_rows = [_result_rows(r) for r in result] if result else [0] * len(proc_names)
+        for proc_name, rows in zip(proc_names, per_proc_rows):
+            procedure_metrics.record(proc_name, elapsed_ms, wait_ms, rows, error)
+
+def _lock_retry_delay(attempt):
+    """잠금 충돌 재시도 대기 시간 (지수 증가 + full jitter, 동시에 충돌한 요청이 같은 시점에 다시 부딪히지 않도록)"""
+    return random.uniform(0, min(LOCK_RETRY_MAX_DELAY, LOCK_RETRY_BASE_DELAY * (2 ** attempt)))
+
+def _execute_with_retry(proc_names, sql, args, fetch, commit, read_only, cursor_class=None, timeout=None):
+    """
+    끊어진 연결 오류 시 새 연결로 한 번 재시도하며 SQL 실행
+    
+    연결은 autocommit 상태이므로 조회는 그대로 실행하고,
+    쓰기는 프로시저 안의 여러 문장이 함께 반영되도록 트랜잭션을 열고 커밋한다.
+    LOCK_RETRY_PROCEDURES는 교착 상태/잠금 대기 시간 초과 시 롤백 후 잠시 기다렸다가 재시도한다.
+    (transaction() 블록 안에서는 블록 전체를 다시 실행해야 하므로 재시도하지 않음)
+    """
+    retry_codes = DISCONNECT_ERROR_CODES if read_only else WRITE_RETRY_ERROR_CODES
+    transactional = commit and not read_only
+    label = ', '.join(proc_names)
+    lock_retries = LOCK_RETRY_ATTEMPTS if all(name in LOCK_RETRY_PROCEDURES for name in proc_names) else 0
+    reconnected = False
+    lock_attempt = 0
+    
+    while True:
+        try:
+            with get_db_connection(read_only, proc_names) as conn:
+                if transactional:
+                    driver.begin(conn)
+                result = _run_statement(conn, sql, args, fetch, cursor_class, timeout, label)
+                if not read_only:
+                    _bump_cache_versions(conn, proc_names)
+                if transactional:
+                    conn.commit()
+                if not read_only:
+                    _mark_write()
+                return result
+        except driver.MySQLError as e:
+            code = _error_code(e)
+            # InterfaceError는 이미 닫힌 연결에 쿼리를 보내려 한 경우로, 서버에 전달되지 않음
+            if not reconnected and (isinstance(e, driver.InterfaceError) or code in retry_codes):
+                reconnected = True
+                procedure_metrics.record_retry(proc_names)
+                logger.warning(f"끊어진 연결로 프로시저 재시도: {label}, {str(e)}")
+                continue
+            if code in LOCK_RETRY_ERROR_CODES and lock_attempt < lock_retries:
+                lock_attempt += 1
+                delay = _lock_retry_delay(lock_attempt)
+                procedure_metrics.record_retry(proc_names, lock_conflict=True)
+                logger.warning(f"잠금 충돌로 프로시저 재시도 ({lock_attempt}/{lock_retries}, "
+                               f"{delay * 1000:.0f}ms 후): {label}, {str(e)}")
+                time.sleep(delay)
+                continue
+            raise
+
+def _call_procedure(proc_name, params, fetch, commit, cursor_class=None, timeout=None):
+    """저장 프로시저 실행 (CALL 문 생성 후 공통 처리)"""
+    call_sql = _build_call_statement(proc_name, params)
+    return _execute_statement([proc_name], call_sql, params if params else [],
+                              fetch, commit, _is_read_procedure(proc_name), cursor_class, timeout)
+
+def _call_with_cache(proc_name, params, mode, fetch, commit, cursor_class=None, timeout=None):
+    """캐시 대상 조회는 캐시를 거치고, 쓰기 프로시저는 실행 후 관련 캐시를 무효화"""
+    _count_request_calls()
+    if _in_write_transaction():
+        # 쓰기 트랜잭션 안의 조회는 커밋 전 데이터를 볼 수 있으므로 캐시를 거치지 않는다
+        return _call_procedure(proc_name, params, fetch, commit, cursor_class, timeout)
+    cached = procedure_cache.get(proc_name, params, mode)
+    if cached is not _MISS:
+        procedure_metrics.record_cache_hit(proc_name)
+        return cached
+    token = procedure_cache.token(proc_name)
+    result = _call_procedure(proc_name, params, fetch, commit, cursor_class, timeout)
+    procedure_cache.put(proc_name, params, mode, result, token)
+    procedure_cache.invalidate_for(proc_name)
+    return result
+
 def execute_without_return(proc_name, params=None):
     """
     저장 프로시저 실행 (반환값 없음)
@@ -241,60 +1857,312 @@ def execute_without_return(proc_name, params=None):
         params: 파라미터 리스트 (예: [user_id, user_name])
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cursor:
-                call_sql = _build_call_statement(proc_name, params)
-                cursor.execute(call_sql, params if params else [])
-                conn.commit()
+        _call_with_cache(proc_name, params, None, None, commit=True)
     except Exception as e:
         logger.error(f"프로시저 실행 중 오류: {proc_name}, {str(e)}")
         raise
 
-def execute_return(proc_name, params=None):
+def execute_return(proc_name, params=None, timeout=None):
     """
     저장 프로시저 실행 (단일 결과 반환)
     
     Args:
         proc_name: 프로시저 이름 (예: 'uspGetUser')
         params: 파라미터 리스트 (예: [user_id])
+        timeout: 실행 제한 시간 (초, None이면 STATEMENT_TIMEOUTS 설정값, 0이면 제한 없음)
     
     Returns:
         결과 딕셔너리
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cursor:
-                call_sql = _build_call_statement(proc_name, params)
-                cursor.execute(call_sql, params if params else [])
-                result = cursor.fetchone()
-                conn.commit()
-                return result
+        return _call_with_cache(proc_name, params, 'one', lambda cursor: cursor.fetchone(), commit=True,
+                                timeout=timeout)
     except Exception as e:
         logger.error(f"프로시저 실행 중 오류 (단일 결과): {proc_name}, {str(e)}")
         raise
 
-def return_list(proc_name, params=None):
+def return_list(proc_name, params=None, row_format='dict', timeout=None):
     """
     저장 프로시저 실행 (결과 목록 반환)
     
     Args:
         proc_name: 프로시저 이름 (예: 'uspGetUserList')
         params: 파라미터 리스트 (예: [channel_id])
+        row_format: 'dict'(기본) 또는 'compact' (행 수가 많은 목록용, CompactRow 참고)
+        timeout: 실행 제한 시간 (초, None이면 STATEMENT_TIMEOUTS 설정값, 0이면 제한 없음)
     
     Returns:
-        결과 딕셔너리 리스트
+        결과 딕셔너리 리스트 (row_format='compact'이면 CompactRow 리스트)
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cursor:
-                call_sql = _build_call_statement(proc_name, params)
-                cursor.execute(call_sql, params if params else [])
-                result = cursor.fetchall()
-                return result if result else []
+        if row_format == 'compact':
+            result = _call_with_cache(proc_name, params, 'compact', _fetch_compact_rows, commit=False,
+                                      cursor_class=driver.Cursor, timeout=timeout)
+        else:
+            result = _call_with_cache(proc_name, params, 'list', lambda cursor: cursor.fetchall(), commit=False,
+                                      timeout=timeout)
+        return result if result else []
     except Exception as e:
         logger.error(f"프로시저 실행 중 오류: {proc_name}, {str(e)}")
         raise
 
+def return_iter(proc_name, params=None, batch_size=500):
+    """
+    저장 프로시저 결과를 행 단위로 스트리밍 (서버 측 unbuffered 커서, SSDictCursor)
+    
+    결과 전체를 메모리에 올리지 않으므로 월 단위 목록 내보내기 등에 사용한다.
+    스트리밍 중에는 연결에서 다른 쿼리를 실행할 수 없으므로 요청 고정 연결이 아닌
+    전용 연결을 사용하며, 반복이 끝나거나 중단되면 연결을 반환한다.
+    (중간에 중단된 경우 남은 결과를 읽어 버리는 대신 연결을 폐기)
+    
+    Args:
+        proc_name: 프로시저 이름 (예: 'get_task_schedule_list')
+        params: 파라미터 리스트
+        batch_size: 서버에서 한 번에 읽어올 행 수
+    
+    Yields:
+        결과 딕셔너리
+    """
+    call_sql = _build_call_statement(proc_name, params)
+    _count_request_calls()
+    
+    start = time.perf_counter()
+    wait_ms = 0.0
+    rows = 0
+    error = None
+    conn = None
+    cursor = None
+    completed = False
+    try:
+        for attempt in range(2):
+            wait_start = time.perf_counter()
+            pool, conn = _checkout(_select_pool(_is_read_procedure(proc_name), [proc_name]))
+            wait_ms += (time.perf_counter() - wait_start) * 1000
+            cursor = conn.cursor(driver.SSDictCursor)
+            try:
+                cursor.execute(call_sql, params if params else [])
+                break
+            except driver.MySQLError as e:
+                if attempt == 0 and _is_disconnect_error(e):
+                    # 아직 결과를 하나도 내보내지 않았으므로 새 연결로 재시도
+                    logger.warning(f"끊어진 연결로 프로시저 재시도: {proc_name}, {str(e)}")
+                    pool.release_connection(conn, discard=True)
+                    conn = None
+                    continue
+                raise
+        
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            for row in batch:
+                rows += 1
+                yield row
+        
+        # 남은 결과 세트(CALL 상태 결과)까지 읽어 연결을 재사용 가능한 상태로 만든다
+        cursor.close()
+        cursor = None
+        completed = True
+    except Exception as e:
+        error = e
+        logger.error(f"프로시저 스트리밍 중 오류: {proc_name}, {str(e)}")
+        raise
+    finally:
+        if conn is not None:
+            try:
+                pool.release_connection(conn, discard=not completed)
+            except Exception as e:
+                logger.error(f"연결 반환 중 오류: {str(e)}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        procedure_metrics.record(proc_name, elapsed_ms, wait_ms, rows, error)
+
+def _fetch_call_results(cursor, modes):
+    """
+    다중 CALL 문의 결과 세트를 순서대로 읽기
+    
+    CALL 하나는 (SELECT 결과 세트 0개 이상) + (상태 결과 1개)를 반환하므로,
+    상태 결과(description 없음)를 만날 때까지를 한 프로시저의 결과로 본다.
+    프로시저가 여러 결과 세트를 반환하면 첫 번째 결과 세트를 사용한다.
+    """
+    results = []
+    has_set = True
+    for mode in modes:
+        rows = None
+        while has_set and cursor.description is not None:
+            fetched = cursor.fetchall()
+            if rows is None:
+                rows = fetched
+            has_set = cursor.nextset()
+        
+        if mode == 'one':
+            results.append(rows[0] if rows else None)
+        else:
+            results.append(list(rows) if rows else [])
+        
+        # 상태 결과를 지나 다음 CALL의 첫 결과로 이동
+        if has_set:
+            has_set = cursor.nextset()
+    return results
+
+def call_many(calls):
+    """
+    여러 저장 프로시저를 한 번의 왕복으로 실행 (다중 CALL 문 + nextset)
+    
+    서로 독립적인 조회 프로시저를 연달아 호출하는 화면에서 사용한다.
+    get_* 외의 프로시저가 포함되면 실행 후 커밋한다.
+    
+    Args:
+        calls: (프로시저 이름, 파라미터 리스트, 'one' 또는 'list') 튜플 리스트
+            예: [('get_dashboard_kpi', [], 'one'), ('get_client_request_recent', [0, 10], 'list')]
+    
+    Returns:
+        호출 순서대로의 결과 리스트 ('one': 딕셔너리 또는 None, 'list': 딕셔너리 리스트)
+    """
+    for proc_name, params, mode in calls:
+        if mode not in ('one', 'list'):
+            raise ValueError(f"지원하지 않는 결과 형식입니다: {proc_name}, {mode}")
+    
+    # 캐시에 있는 결과는 제외하고 나머지만 일괄 실행
+    _count_request_calls(len(calls))
+    # 쓰기 트랜잭션 안에서는 캐시를 거치지 않는다 (_call_with_cache 참고)
+    use_cache = not _in_write_transaction()
+    results = [procedure_cache.get(*call) if use_cache else _MISS for call in calls]
+    pending = [i for i, result in enumerate(results) if result is _MISS]
+    for call, result in zip(calls, results):
+        if result is not _MISS:
+            procedure_metrics.record_cache_hit(call[0])
+    if not pending:
+        return results
+    
+    statements = []
+    args = []
+    modes = []
+    tokens = []
+    for i in pending:
+        proc_name, params, mode = calls[i]
+        statements.append(_build_call_statement(proc_name, params))
+        args.extend(params if params else [])
+        modes.append(mode)
+        tokens.append(procedure_cache.token(proc_name))
+    
+    proc_names = [calls[i][0] for i in pending]
+    label = ', '.join(proc_names)
+    read_only = all(_is_read_procedure(name) for name in proc_names)
+    try:
+        fetched = _execute_statement(proc_names, '; '.join(statements), args,
+                                     lambda cursor: _fetch_call_results(cursor, modes),
+                                     not read_only, read_only)
+    except Exception as e:
+        logger.error(f"프로시저 일괄 실행 중 오류: {label}, {str(e)}")
+        raise
+    
+    for i, result, token in zip(pending, fetched, tokens):
+        proc_name, params, mode = calls[i]
+        if use_cache:
+            procedure_cache.put(proc_name, params, mode, result, token)
+        procedure_cache.invalidate_for(proc_name)
+        results[i] = result
+    return results
+
+_parallel_executor = None
+_parallel_executor_lock = threading.Lock()
+
+def _get_parallel_executor():
+    """call_parallel용 스레드 풀 (최초 사용 시 생성)"""
+    global _parallel_executor
+    with _parallel_executor_lock:
+        if _parallel_executor is None:
+            _parallel_executor = ThreadPoolExecutor(max_workers=PARALLEL_WORKERS,
+                                                    thread_name_prefix='dbconns-parallel')
+        return _parallel_executor
+
+def _run_call(proc_name, params, mode, read_primary=False, blueprint_pool=None):
+    """call_parallel 작업 스레드에서 프로시저 하나 실행 (요청의 read-your-writes 상태와 풀 배정을 이어받음)"""
+    _call_state.read_primary = read_primary
+    _call_state.blueprint_pool = blueprint_pool
+    try:
+        if mode == 'one':
+            return execute_return(proc_name, params)
+        return return_list(proc_name, params)
+    finally:
+        _call_state.read_primary = False
+        _call_state.blueprint_pool = None
+
+def call_parallel(calls):
+    """
+    서로 독립적인 저장 프로시저를 동시에 실행하고 결과를 모아 반환
+    
+    각 호출은 작업 스레드에서 별도의 풀 연결로 실행되므로(요청 고정 연결 미사용)
+    화면 응답 시간이 호출 시간의 합이 아닌 가장 느린 호출 수준으로 줄어든다.
+    무거운 집계 프로시저 여러 개를 조회하는 화면에 사용한다.
+    동시에 실행하는 호출 수는 사용하는 풀의 최대 연결 수로 제한한다. (풀보다 많이 보내면
+    남는 호출은 풀 대기 시간만 소모하고 대기 시간 초과로 실패할 수 있음)
+    
+    Args:
+        calls: (프로시저 이름, 파라미터 리스트, 'one' 또는 'list') 튜플 리스트
+    
+    Returns:
+        호출 순서대로의 결과 리스트 (하나라도 실패하면 첫 번째 예외를 발생)
+    """
+    for proc_name, params, mode in calls:
+        if mode not in ('one', 'list'):
+            raise ValueError(f"지원하지 않는 결과 형식입니다: {proc_name}, {mode}")
+    if len(calls) <= 1:
+        return [_run_call(*call) for call in calls]
+    
+    # 작업 스레드에는 요청 컨텍스트가 없으므로 호출 수는 여기서 누적
+    _count_request_calls(len(calls))
+    executor = _get_parallel_executor()
+    read_primary = _reads_from_primary()
+    blueprint_pool = _blueprint_pool_name()
+    targets = {_select_pool(_is_read_procedure(proc_name), [proc_name]) for proc_name, _, _ in calls}
+    limit = max(1, min(pool.max_connections for pool in targets))
+    futures = []
+    running = set()
+    for call in calls:
+        if len(running) >= limit:
+            _, running = wait(running, return_when=FIRST_COMPLETED)
+        future = executor.submit(_run_call, *call, read_primary, blueprint_pool)
+        futures.append(future)
+        running.add(future)
+    
+    # 모든 호출이 끝날 때까지 기다린 뒤 첫 번째 예외를 전달 (연결이 실행 중인 채로 남지 않도록)
+    results = []
+    error = None
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(None)
+            if error is None:
+                error = e
+    if error is not None:
+        raise error
+    return results
+
+def _after_fork_in_child():
+    """
+    fork된 워커 프로세스에서 모듈 상태 초기화
+    
+    connection_pool 등은 임포트 시점에 생성되므로 pre-fork 방식 WSGI 서버(gunicorn, uWSGI)에서는
+    마스터 프로세스의 상태가 그대로 복사된다. 상속된 연결을 버리고 잠금과 작업 스레드 풀을 새로 만든다.
+    연결은 워커에서 처음 사용할 때 min_connections까지 다시 생성된다.
+    """
+    global _parallel_executor, _parallel_executor_lock, _watchdog_lock
+    for pool in pools.values():
+        pool.reset_after_fork()
+    procedure_cache.reset_after_fork()
+    procedure_metrics.reset_after_fork()
+    # 작업 스레드는 fork 후 자식에 존재하지 않으므로 실행기도 새로 생성
+    _parallel_executor = None
+    _parallel_executor_lock = threading.Lock()
+    # 감시 스레드도 자식에는 없으므로 처음 연결을 사용할 때 다시 시작 (PID 비교)
+    _watchdog_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
 # 애플리케이션 종료 시 모든 연결 정리
 import atexit
-atexit.register(connection_pool.close_all)
\ No newline at end of file
+for _pool in pools.values():
+    atexit.register(_pool.close_all)
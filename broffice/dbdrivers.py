@@ -0,0 +1,160 @@
+"""
+DB 드라이버 선택 (환경 변수 DB_DRIVER: pymysql | mysqlclient)
+
+dbconns는 드라이버별로 다른 부분(접속, 커서 클래스, 예외 클래스, 연결/트랜잭션 상태 확인)을
+이 모듈의 드라이버 객체를 통해서만 사용한다. execute_return/return_list 등의 결과 형식은
+드라이버와 관계없이 같다 (딕셔너리 행, datetime/Decimal 값).
+
+- pymysql: 순수 Python 드라이버 (기본값, 별도 라이브러리 설치 불필요)
+- mysqlclient(MySQLdb): C 확장 드라이버, 결과 디코딩이 빠름 (MySQL 클라이언트 라이브러리 필요)
+"""
+import os
+
+# 트랜잭션 시작 SQL (격리 수준을 트랜잭션마다 명시해 세션 격리 수준이 바뀐 연결을 받아도 영향이 없도록 함)
+# MULTI_STATEMENTS로 한 번의 왕복에 실행하고, 커서를 닫으며 두 번째 결과까지 읽는다
+BEGIN_SQL = "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ; START TRANSACTION"
+BEGIN_READ_ONLY_SQL = "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ; START TRANSACTION READ ONLY"
+
+
+def _begin(conn, read_only):
+    with conn.cursor() as cursor:
+        cursor.execute(BEGIN_READ_ONLY_SQL if read_only else BEGIN_SQL)
+
+
+class PyMySQLDriver:
+    """pymysql 드라이버 (기본값)"""
+    name = 'pymysql'
+
+    def __init__(self):
+        import pymysql
+        import pymysql.cursors
+        from pymysql.constants import CLIENT, SERVER_STATUS
+
+        self.module = pymysql
+        self.MySQLError = pymysql.err.MySQLError
+        self.OperationalError = pymysql.err.OperationalError
+        self.InterfaceError = pymysql.err.InterfaceError
+        self.DictCursor = pymysql.cursors.DictCursor
+        self.Cursor = pymysql.cursors.Cursor
+        self.SSDictCursor = pymysql.cursors.SSDictCursor
+        self.MULTI_STATEMENTS = CLIENT.MULTI_STATEMENTS
+        self._in_trans_flag = SERVER_STATUS.SERVER_STATUS_IN_TRANS
+
+    def connect(self, config):
+        return self.module.connect(**config)
+
+    def ping(self, conn):
+        """연결 확인 (끊어졌으면 예외, 자동 재연결하지 않음)"""
+        conn.ping(reconnect=False)
+
+    def is_open(self, conn):
+        return bool(getattr(conn, 'open', True))
+
+    def begin(self, conn, read_only=False):
+        _begin(conn, read_only)
+
+    def in_transaction(self, conn):
+        """열린 트랜잭션 여부 (서버가 마지막 응답에 담아 보낸 상태 플래그로 판단, 왕복 없음)"""
+        return bool(getattr(conn, 'server_status', 0) & self._in_trans_flag)
+
+    def force_close(self, conn):
+        """서버에 종료 패킷(COM_QUIT)을 보내지 않고 소켓만 닫기"""
+        conn._force_close()
+
+
+class MySQLclientDriver:
+    """mysqlclient(MySQLdb) 드라이버"""
+    name = 'mysqlclient'
+
+    # pymysql 전용 접속 인자
+    UNSUPPORTED_ARGS = ('auth_plugin_map',)
+
+    def __init__(self):
+        try:
+            import MySQLdb
+            import MySQLdb.cursors
+            from MySQLdb.connections import Connection
+            from MySQLdb.constants import CLIENT
+        except ImportError as e:
+            raise ImportError("DB_DRIVER=mysqlclient를 사용하려면 mysqlclient 패키지를 설치해야 합니다. "
+                              "(pip install mysqlclient)") from e
+
+        class TrackedConnection(Connection):
+            """
+            트랜잭션 상태를 기록하는 연결
+
+            mysqlclient는 서버 상태 플래그(SERVER_STATUS_IN_TRANS)를 제공하지 않으므로
+            begin/commit/rollback 호출로 상태를 추적한다.
+            (프로시저 내부에서 열고 닫지 않은 트랜잭션은 추적하지 못함)
+            """
+            in_trans = False
+
+            def begin(self, read_only=False):
+                _begin(self, read_only)
+                self.in_trans = True
+
+            def commit(self):
+                super().commit()
+                self.in_trans = False
+
+            def rollback(self):
+                super().rollback()
+                self.in_trans = False
+
+        self.module = MySQLdb
+        self.connection_class = TrackedConnection
+        self.MySQLError = MySQLdb.MySQLError
+        self.OperationalError = MySQLdb.OperationalError
+        self.InterfaceError = MySQLdb.InterfaceError
+        self.DictCursor = MySQLdb.cursors.DictCursor
+        self.Cursor = MySQLdb.cursors.Cursor
+        self.SSDictCursor = MySQLdb.cursors.SSDictCursor
+        self.MULTI_STATEMENTS = CLIENT.MULTI_STATEMENTS
+
+    def connect(self, config):
+        args = {key: value for key, value in config.items() if key not in self.UNSUPPORTED_ARGS}
+        if args.get('autocommit') is None:
+            # mysqlclient는 autocommit 인자가 없으면 PEP 249 기본값(False)으로 바꾸므로
+            # init_command에서 설정한 autocommit = 1을 유지하도록 명시 (값이 같으면 추가 쿼리 없음)
+            args['autocommit'] = True
+        return self.connection_class(**args)
+
+    def ping(self, conn):
+        conn.ping()
+
+    def is_open(self, conn):
+        return bool(getattr(conn, 'open', True))
+
+    def begin(self, conn, read_only=False):
+        conn.begin(read_only)
+
+    def in_transaction(self, conn):
+        return getattr(conn, 'in_trans', False)
+
+    def force_close(self, conn):
+        """
+        서버에 종료 패킷을 보내지 않고 소켓만 닫기
+
+        C 확장에는 소켓만 닫는 API가 없으므로 연결의 파일 디스크립터를 /dev/null로 바꾼다.
+        이후 연결 객체가 정리될 때 보내는 종료 패킷은 부모 프로세스와 공유하던 소켓으로 가지 않는다.
+        """
+        fd = conn.fileno()
+        null_fd = os.open(os.devnull, os.O_RDWR)
+        try:
+            os.dup2(null_fd, fd)
+        finally:
+            os.close(null_fd)
+
+
+DRIVERS = {
+    'pymysql': PyMySQLDriver,
+    'mysqlclient': MySQLclientDriver,
+}
+
+
+def get_driver(name=None):
+    """DB 드라이버 객체 반환 (name이 없으면 환경 변수 DB_DRIVER, 기본값 pymysql)"""
+    name = (name or os.environ.get('DB_DRIVER', 'pymysql')).lower()
+    if name not in DRIVERS:
+        raise ValueError(f"지원하지 않는 DB 드라이버입니다: {name} (pymysql, mysqlclient 중 선택)")
+    return DRIVERS[name]()
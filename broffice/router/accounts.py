@@ -351,14 +351,12 @@ def client_detail(client_id):
 @bp.route("/client_list", methods=['GET'])
 @admin_required
 def client_list():
-    # 프로시저 1: 업체 목록 조회
-    clients = conn.return_list('get_client_list')
-
-    # 프로시저 2: 업무 종류별 통계
-    stats = conn.execute_return('get_client_stats_by_task_kind')
-    
-    # 관리팀장 목록
-    managers = conn.return_list('get_manager_list') or []
+    # 업체 목록, 업무 종류별 통계, 관리팀장 목록을 한 번의 왕복으로 조회
+    clients, stats, managers = conn.call_many([
+        ('get_client_list', None, 'list'),
+        ('get_client_stats_by_task_kind', None, 'one'),
+        ('get_manager_list', None, 'list'),
+    ])
     
     return render_template('accounts/client_list.html',
                          clients=clients,
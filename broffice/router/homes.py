@@ -16,17 +16,19 @@ def index(user_kind_id=None):
     
     # 사용자 유형별 대시보드 템플릿 분기
     if user_kind_id == 1:
-        # 관리자용 대시보드
-        kpi = conn.execute_return('get_dashboard_kpi', []) or {}
+        # 관리자용 대시보드 (조회 프로시저를 한 번의 왕복으로 일괄 실행)
         year_month = datetime.now().strftime('%Y-%m')
-        schedule_count = conn.execute_return('get_dashboard_schedule_count', [year_month]) or {}
-        client_requests = conn.return_list('get_client_request_recent', [0, 10]) or []
-        today_cleaning = conn.return_list('get_dashboard_admin_today', [4]) or []
-        today_snack = conn.return_list('get_dashboard_admin_today', [5]) or []
-        today_supplies = conn.return_list('get_dashboard_admin_today', [6]) or []
+        kpi, schedule_count, client_requests, today_cleaning, today_snack, today_supplies = conn.call_many([
+            ('get_dashboard_kpi', [], 'one'),
+            ('get_dashboard_schedule_count', [year_month], 'one'),
+            ('get_client_request_recent', [0, 10], 'list'),
+            ('get_dashboard_admin_today', [4], 'list'),
+            ('get_dashboard_admin_today', [5], 'list'),
+            ('get_dashboard_admin_today', [6], 'list'),
+        ])
         return render_template('homes/index.html',
-            kpi=kpi,
-            schedule_count=schedule_count,
+            kpi=kpi or {},
+            schedule_count=schedule_count or {},
             client_requests=client_requests,
             year_month=year_month,
             today_cleaning=today_cleaning,
@@ -67,6 +69,18 @@ def index(user_kind_id=None):
         return render_template('homes/index.html')
 
 
+@bp.route("/health", methods=['GET'])
+def health():
+    """모니터링용 상태 확인 (DB 회로 차단기 상태, 로그인 불필요)
+
+    주 풀(oltp)의 차단기가 open이면 503, half_open(재시도 가능)이면 정상으로 응답한다.
+    인증 없이 공개되므로 차단기 상태만 반환한다. (풀별 연결 수는 관리자용 /reports/db_stats)
+    """
+    breaker = conn.connection_pool.breaker.get_stats()['breaker_state']
+    healthy = breaker != 'open'
+    return jsonify({'success': healthy, 'breaker': breaker}), 200 if healthy else 503
+
+
 @bp.route("/privacy")
 def privacy():
     return render_template('homes/privacy.html')
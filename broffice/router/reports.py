@@ -23,20 +23,19 @@ def dashboard(task_kind_id=0):
     
     kind_info = TASK_KIND_MAP.get(task_kind_id, TASK_KIND_MAP[0])
     
-    # 관리직원 목록 (드롭다운용)
-    managers = conn.return_list('get_report_managers', []) or []
-    
-    # 월별 작업 종합 통계
-    monthly_summary = conn.return_list('get_report_monthly_summary', [year_month, manage_user_id]) or []
-    
-    # 업체별 작업 현황
-    client_stats = conn.return_list('get_report_by_client', [year_month, task_kind_id, manage_user_id]) or []
-    
-    # 직원별 작업 현황
-    worker_stats = conn.return_list('get_report_by_worker', [year_month, task_kind_id, manage_user_id]) or []
-    
-    # 일별 작업 추이
-    daily_trend = conn.return_list('get_report_daily_trend', [year_month, task_kind_id, manage_user_id]) or []
+    # 각 통계가 해당 월 task_schedules를 스캔하므로 별도 연결에서 동시에 실행
+    managers, monthly_summary, client_stats, worker_stats, daily_trend = conn.call_parallel([
+        # 관리직원 목록 (드롭다운용)
+        ('get_report_managers', [], 'list'),
+        # 월별 작업 종합 통계
+        ('get_report_monthly_summary', [year_month, manage_user_id], 'list'),
+        # 업체별 작업 현황
+        ('get_report_by_client', [year_month, task_kind_id, manage_user_id], 'list'),
+        # 직원별 작업 현황
+        ('get_report_by_worker', [year_month, task_kind_id, manage_user_id], 'list'),
+        # 일별 작업 추이
+        ('get_report_daily_trend', [year_month, task_kind_id, manage_user_id], 'list'),
+    ])
     
     # 종합 집계
     if task_kind_id == 0:
@@ -100,3 +99,25 @@ def sns_logs():
         pending_count=pending_count,
         error_count=error_count
     )
+
+
+@bp.route("/db_stats", methods=['GET'])
+@admin_required
+def db_stats():
+    """DB 프로시저 호출 통계 (프로세스 시작 또는 초기화 이후 누적)"""
+    return render_template('reports/db_stats.html',
+        procedures=conn.procedure_metrics.snapshot(),
+        request_stats=conn.procedure_metrics.request_snapshot(),
+        pool_stats=conn.connection_pool.get_stats(),
+        pools=conn.get_pool_stats(),
+        holders=conn.get_connection_holders(),
+        cache_stats=conn.procedure_cache.get_stats()
+    )
+
+
+@bp.route("/db_stats_reset", methods=['POST'])
+@admin_required
+def db_stats_reset():
+    """DB 프로시저 호출 통계 초기화"""
+    conn.procedure_metrics.reset()
+    return jsonify({'success': True, 'message': '통계가 초기화되었습니다.'})
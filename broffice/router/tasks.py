@@ -1,10 +1,14 @@
 import os
 import uuid
-from datetime import datetime
-from flask import Blueprint, render_template, request, jsonify, redirect, url_for, session, current_app
+from datetime import date, datetime
+from flask import Blueprint, render_template, request, jsonify, redirect, url_for, session, current_app, send_file
 from werkzeug.utils import secure_filename
 from broffice.utils.auth_handler import login_required, admin_required
 from broffice.utils.sms_handler import schedule_completion_sms
+from broffice.utils.file_handler import excel_export_handle
+from broffice.utils.schedule_handler import (generate_schedules, start_generation_job, get_generation_job,
+                                             cancel_generation_job)
+from broffice.utils import recurrence
 import broffice.dbconns as conn
 
 bp = Blueprint('tasks', __name__)
@@ -15,7 +19,7 @@ bp = Blueprint('tasks', __name__)
 def task_list(task_kind_id):
     # 스케줄 목록 조회 (tasks 테이블 기반)
     if task_kind_id in [4, 5, 6]:  # 청소, 간식, 비품
-        tasks = conn.return_list('get_task_list', [task_kind_id])
+        tasks = recurrence.label_tasks(conn.return_list('get_task_list', [task_kind_id]))
         # 모달용 업체 목록 조회
         clients = conn.return_list('get_client_list_by_task_kind', [task_kind_id])
         # 작업자 목록 조회 (user_kind_id=2)
@@ -41,7 +45,8 @@ def task_schedule_list(task_kind_id):
     
     schedules = []
     if task_kind_id in [4, 5, 6]:
-        schedules = conn.return_list('get_task_schedule_list', [task_kind_id, year_month])
+        # 월 전체 스케줄(행당 20여 개 컬럼)이므로 경량 행 형식으로 조회
+        schedules = conn.return_list('get_task_schedule_list', [task_kind_id, year_month], row_format='compact')
     
     return render_template('tasks/task_schedule_list.html',
                            task_kind_id=task_kind_id,
@@ -49,6 +54,47 @@ def task_schedule_list(task_kind_id):
                            year_month=year_month)
 
 
+# 스케줄 엑셀 내보내기 컬럼 (get_task_schedule_list 결과 키, 제목)
+SCHEDULE_EXPORT_COLUMNS = [
+    ('scheduled_date', '작업일'),
+    ('effective_day', '요일'),
+    ('client_name', '업체'),
+    ('worker_name', '작업자'),
+    ('worker_mobile', '작업자 연락처'),
+    ('manager_name', '담당자'),
+    ('schedule_status', '상태'),
+    ('completed_area_count', '작업 구역'),
+    ('area_count', '전체 구역'),
+    ('completed_date', '완료일시'),
+    ('memo', '메모'),
+]
+
+SCHEDULE_STATUS_NAMES = {
+    'scheduled': '예정',
+    'today': '오늘',
+    'completed': '완료',
+    'overdue': '지연',
+    'canceled': '취소',
+}
+
+
+@bp.route("/task_schedule_export/<int:task_kind_id>", methods=['GET'])
+@admin_required
+def task_schedule_export(task_kind_id):
+    """스케줄 일정 목록 엑셀 다운로드 (월 전체 목록을 스트리밍으로 읽어 기록)"""
+    year_month = request.args.get('year_month') or datetime.now().strftime('%Y-%m')
+
+    def export_rows():
+        for row in conn.return_iter('get_task_schedule_list', [task_kind_id, year_month]):
+            row['schedule_status'] = SCHEDULE_STATUS_NAMES.get(row['schedule_status'], row['schedule_status'])
+            yield row
+
+    output = excel_export_handle(export_rows(), SCHEDULE_EXPORT_COLUMNS)
+    return send_file(output, as_attachment=True,
+                     download_name=f'schedule_{task_kind_id}_{year_month}.xlsx',
+                     mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+
+
 @bp.route("/schedule_date_update", methods=['POST'])
 @admin_required
 def schedule_date_update():
@@ -62,6 +108,9 @@ def schedule_date_update():
         task_schedule_id, new_scheduled_date, change_user_id
     ])
     
+    if res and res.get('return_value', 0) < 0:
+        return jsonify({'success': False, 'message': '해당 날짜에 이미 같은 업무의 스케줄이 있습니다.'}), 400
+    
     return jsonify({
         'success': True,
         'message': '스케줄 날짜가 변경되었습니다.',
@@ -100,25 +149,20 @@ def task_update():
     client_id = request.form.get('clientId', type=int)
     user_id = request.form.get('userId', type=int)
     
-    # 여러 요일 값 처리
-    days_of_week_list = request.form.getlist('daysOfWeek')
-    
-    # fix_dates가 있으면 월별 스케줄
-    fix_dates = request.form.get('fixDates') or None  # 비어있으면 None
-    
-    if fix_dates:
-        days_of_week = '0'  # 월별 스케줄
-    elif len(days_of_week_list) == 7:
-        days_of_week = '1,2,3,4,5,6,7'  # 매일
-    else:
-        days_of_week = ','.join(days_of_week_list) if days_of_week_list else ''
+    # 반복 규칙 (fixDates가 있으면 월별, 없으면 선택한 요일)
+    rule = recurrence.from_form(request.form.getlist('daysOfWeek'), request.form.get('fixDates'))
+    if rule.monthly and rule.empty:
+        return jsonify({
+            'success': False,
+            'message': '월별 고정 날짜는 1~31 사이의 숫자를 콤마로 구분해 입력해주세요.'
+        }), 400
+    days_of_week = rule.days_of_week
+    fix_dates = rule.fix_dates
     
     service_started_at = request.form.get('serviceStartedAt') or None
     service_ended_at = request.form.get('serviceEndedAt') or None
     use_yn = 1 if request.form.get('useYn') else 0
     
-    days_of_week = days_of_week if days_of_week else None
-    
     # 프로시저 호출
     res = conn.execute_return('set_task_update', [
         task_id,
@@ -145,22 +189,17 @@ def task_schedule_generate():
     try:
         task_ids = request.form.getlist('taskIds[]')
         year_month = request.form.get('yearMonth')
+        # diff: 바뀐 날짜만 반영 (기본값), replace: 기존 스케줄 삭제 후 재등록
+        mode = request.form.get('mode', 'diff')
         
-        results = []
-        total_count = 0
-        skipped_messages = []
-        for task_id in task_ids:
-            res = conn.execute_return('set_task_schedule_generate', [int(task_id), year_month])
-            if res:
-                rv = res.get('return_value', 0)
-                msg = res.get('message', '')
-                if rv > 0:
-                    total_count += rv
-                elif msg:
-                    skipped_messages.append(msg)
-                results.append(res)
+        generated = generate_schedules(task_ids, year_month, mode)
+        results = generated['results']
+        total_count = generated['inserted']
+        skipped_messages = [res['message'] for res in results if res['return_value'] <= 0 and res['message']]
         
         message = f'총 {total_count}건의 스케줄이 생성되었습니다.'
+        if generated['deleted'] or generated['unchanged']:
+            message += f" (삭제 {generated['deleted']}건, 유지 {generated['unchanged']}건)"
         if skipped_messages:
             inactive_cnt = sum(1 for m in skipped_messages if '비활성' in m)
             no_area_cnt = sum(1 for m in skipped_messages if '구역' in m)
@@ -175,7 +214,8 @@ def task_schedule_generate():
         return jsonify({
             'success': True,
             'message': message,
-            'data': results
+            'data': results,
+            'counts': {key: generated[key] for key in ('inserted', 'deleted', 'updated', 'unchanged', 'skipped_dates')}
         })
     except Exception as e:
         return jsonify({
@@ -184,6 +224,97 @@ def task_schedule_generate():
         }), 500
 
 
+@bp.route("/task_schedule_preview", methods=['POST'])
+@admin_required
+def task_schedule_preview():
+    """작업 등록/수정 폼의 반복 규칙으로 예정 작업일 미리보기 (관리 시작일 또는 오늘부터)"""
+    rule = recurrence.from_form(request.form.getlist('daysOfWeek'), request.form.get('fixDates'))
+    try:
+        started_at = request.form.get('serviceStartedAt')
+        ended_at = request.form.get('serviceEndedAt')
+        start = max(datetime.strptime(started_at, '%Y-%m-%d').date(), date.today()) if started_at else date.today()
+        end = datetime.strptime(ended_at, '%Y-%m-%d').date() if ended_at else None
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': '관리 기간 날짜 형식이 올바르지 않습니다.'
+        }), 400
+    
+    dates = [d for d in recurrence.upcoming_dates(rule, start, 10) if end is None or d <= end]
+    return jsonify({
+        'success': True,
+        'data': {
+            'label': rule.label(),
+            'dates': [f"{d.strftime('%m/%d')}({recurrence.WEEKDAY_NAMES[d.weekday()]})" for d in dates]
+        }
+    })
+
+
+@bp.route("/task_schedule_job_start", methods=['POST'])
+@admin_required
+def task_schedule_job_start():
+    """여러 달 스케줄 생성 작업 시작 (업무 종류의 활성 작업 전체, 백그라운드 실행)"""
+    task_kind_id = request.form.get('taskKindId', type=int)
+    start_year_month = request.form.get('startYearMonth') or datetime.now().strftime('%Y-%m')
+    months = request.form.get('months', 3, type=int)
+    mode = request.form.get('mode', 'diff')
+    
+    if task_kind_id not in [4, 5, 6]:  # 청소, 간식, 비품
+        return jsonify({
+            'success': False,
+            'message': '스케줄을 생성할 수 없는 업무 종류입니다.'
+        }), 400
+    
+    try:
+        job = start_generation_job(task_kind_id, start_year_month, months, mode)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
+    return jsonify({
+        'success': True,
+        'message': '스케줄 생성 작업이 시작되었습니다.',
+        'data': job
+    })
+
+
+@bp.route("/task_schedule_job/<job_id>", methods=['GET'])
+@admin_required
+def task_schedule_job(job_id):
+    """스케줄 생성 작업 진행률 조회"""
+    job = get_generation_job(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'message': '스케줄 생성 작업을 찾을 수 없습니다.'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'data': job
+    })
+
+
+@bp.route("/task_schedule_job_cancel/<job_id>", methods=['POST'])
+@admin_required
+def task_schedule_job_cancel(job_id):
+    """스케줄 생성 작업 취소 (진행 중인 묶음이 끝난 뒤 중단)"""
+    job = cancel_generation_job(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'message': '스케줄 생성 작업을 찾을 수 없습니다.'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'message': '스케줄 생성 작업 취소를 요청했습니다.',
+        'data': job
+    })
+
+
 @bp.route("/task_delete", methods=['POST'])
 @admin_required
 def task_delete():
@@ -206,25 +337,20 @@ def task_insert():
     task_kind_id = request.form.get('taskKindId', type=int)
     client_id = request.form.get('clientId', type=int)
     user_id = request.form.get('userId', type=int)
-    # 여러 요일 값 처리
-    days_of_week_list = request.form.getlist('daysOfWeek')
-    
-    # fix_dates가 있으면 월별 스케줄
-    fix_dates = request.form.get('fixDates') or None  # 비어있으면 None
-    
-    if fix_dates:
-        days_of_week = '0'  # 월별 스케줄
-    elif len(days_of_week_list) == 7:
-        days_of_week = '1,2,3,4,5,6,7'  # 매일
-    else:
-        days_of_week = ','.join(days_of_week_list) if days_of_week_list else ''
+    # 반복 규칙 (fixDates가 있으면 월별, 없으면 선택한 요일)
+    rule = recurrence.from_form(request.form.getlist('daysOfWeek'), request.form.get('fixDates'))
+    if rule.monthly and rule.empty:
+        return jsonify({
+            'success': False,
+            'message': '월별 고정 날짜는 1~31 사이의 숫자를 콤마로 구분해 입력해주세요.'
+        }), 400
+    days_of_week = rule.days_of_week
+    fix_dates = rule.fix_dates
     
     service_started_at = request.form.get('serviceStartedAt') or None
     service_ended_at = request.form.get('serviceEndedAt') or None
     use_yn = 1 if request.form.get('useYn') else 0
     
-    days_of_week = days_of_week if days_of_week else None
-    
     # 프로시저 호출
     res = conn.execute_return('set_task_insert', [
         task_kind_id,
@@ -255,7 +381,7 @@ def task_area_list():
         return redirect(url_for('tasks.task_list', task_kind_id=task_kind_id))
     
     # 스케줄(task) 정보 조회
-    task_info_list = conn.return_list('get_task_list', [task_kind_id])
+    task_info_list = recurrence.label_tasks(conn.return_list('get_task_list', [task_kind_id]))
     task_info = None
     for t in task_info_list:
         if t['task_id'] == task_id:
@@ -365,21 +491,31 @@ def task_my_list(task_kind_id):
     )
 
 
+def _get_task_detail_with_photos(task_schedule_id):
+    """업무 상세, 구역 목록, 스케줄 전체 사진을 한 번에 조회하고 사진을 구역별로 나누어 담기"""
+    schedule, areas, photos = conn.call_many([
+        ('get_task_detail', [task_schedule_id], 'one'),
+        ('get_task_detail_areas', [task_schedule_id], 'list'),
+        ('get_task_schedule_photos', [task_schedule_id], 'list'),
+    ])
+    
+    photos_by_log = {}
+    for photo in photos:
+        photos_by_log.setdefault(photo['task_area_log_id'], []).append(photo)
+    for area in areas:
+        area['photos'] = photos_by_log.get(area.get('task_area_log_id'), [])
+    return schedule, areas
+
+
 @bp.route("/task_detail/<int:task_schedule_id>/<int:task_kind_id>", methods=['GET'])
 @login_required
 def task_detail(task_schedule_id, task_kind_id):
     """업무 상세 (업무보고)"""
     
-    schedule = conn.execute_return('get_task_detail', [task_schedule_id])
-    areas = conn.return_list('get_task_detail_areas', [task_schedule_id])
+    schedule, areas = _get_task_detail_with_photos(task_schedule_id)
     
-    # 각 구역의 사진 목록 조회
     has_any_work = False
     for area in areas:
-        if area.get('task_area_log_id'):
-            area['photos'] = conn.return_list('get_task_area_photos', [area['task_area_log_id']])
-        else:
-            area['photos'] = []
         # 사진이 있거나 특이사항이 있으면 작업중
         if area.get('photo_count') or area.get('log_content'):
             has_any_work = True
@@ -397,14 +533,7 @@ def task_detail(task_schedule_id, task_kind_id):
 def task_detail_view(task_schedule_id, task_kind_id):
     """업무 상세 보기 (읽기 전용)"""
     
-    schedule = conn.execute_return('get_task_detail', [task_schedule_id])
-    areas = conn.return_list('get_task_detail_areas', [task_schedule_id])
-    
-    for area in areas:
-        if area.get('task_area_log_id'):
-            area['photos'] = conn.return_list('get_task_area_photos', [area['task_area_log_id']])
-        else:
-            area['photos'] = []
+    schedule, areas = _get_task_detail_with_photos(task_schedule_id)
     
     return render_template('tasks/task_detail_view.html',
         schedule=schedule,
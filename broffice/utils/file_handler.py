@@ -39,13 +39,28 @@ def file_format_check(file_name):
     return extension in current_app.config['UPLOAD_EXTENSIONS']
 
 
-def excel_export_handle(excel_data):
-    """엑셀 파일 생성"""
+def excel_export_handle(excel_data, columns=None):
+    """
+    엑셀 파일 생성 (constant_memory: 행 순서대로 기록)
+    
+    Args:
+        excel_data: 행 단위 반복 가능 객체 (columns가 없으면 행마다 값 리스트)
+        columns: (키, 제목) 튜플 리스트. 지정하면 첫 행에 제목을 쓰고, 딕셔너리 행의 값을
+            이 순서대로 기록한다. (dbconns.return_iter 결과를 그대로 넘겨 목록 전체를
+            메모리에 올리지 않고 내보낼 수 있음)
+    """
     output = BytesIO()
-    workbook = Workbook(output)
+    workbook = Workbook(output, {'constant_memory': True})
     worksheet = workbook.add_worksheet()
 
-    for row_num, row_data in enumerate(excel_data):
+    row_offset = 0
+    if columns:
+        worksheet.write_row(0, 0, [title for _, title in columns])
+        row_offset = 1
+
+    for row_num, row_data in enumerate(excel_data, row_offset):
+        if columns:
+            row_data = [row_data.get(key) for key, _ in columns]
         for col_num, col_data in enumerate(row_data):
             worksheet.write(row_num, col_num, col_data)
 
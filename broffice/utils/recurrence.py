@@ -0,0 +1,174 @@
+"""
+작업 반복 규칙 (days_of_week / fix_dates)
+- days_of_week: 요일 목록 '1,3,5' (1=월 ~ 7=일), '1,2,3,4,5,6,7'이면 매일, '0'이면 월별
+- fix_dates: 월별(days_of_week='0')일 때 매월 작업하는 일자 목록 '15, 25'
+- 규칙은 한 번만 해석해 요일 비트마스크와 일자 비트셋으로 보관하고,
+  월별 날짜 계산 결과는 (규칙, 1일의 요일, 월의 일수) 단위로 재사용
+"""
+import calendar
+from datetime import date, timedelta
+from functools import lru_cache
+
+MONTHLY = '0'   # days_of_week 값: 월별 (fix_dates 기준)
+DAILY = '1,2,3,4,5,6,7'
+WEEKDAY_NAMES = ('월', '화', '수', '목', '금', '토', '일')
+ALL_WEEKDAYS = 0b11111110   # 비트 1~7 (ISO 요일)
+
+
+def _parse_numbers(value, low, high):
+    """'1,2, 3' 형식의 문자열에서 low ~ high 범위의 숫자만 비트셋으로 변환"""
+    mask = 0
+    if not value:
+        return mask
+    for item in str(value).replace(' ', '').split(','):
+        if item.isdigit() and low <= int(item) <= high:
+            mask |= 1 << int(item)
+    return mask
+
+
+def _bits(mask):
+    return [i for i in range(mask.bit_length()) if mask >> i & 1]
+
+
+class RecurrenceRule:
+    """
+    해석된 반복 규칙
+
+    weekday_mask: 작업 요일 비트마스크 (비트 1=월 ~ 7=일, 월별 규칙이면 0)
+    day_mask: 월별 작업 일자 비트셋 (비트 1~31, 요일 규칙이면 0)
+    """
+    __slots__ = ('weekday_mask', 'day_mask', 'monthly')
+
+    def __init__(self, weekday_mask=0, day_mask=0, monthly=False):
+        self.weekday_mask = weekday_mask
+        self.day_mask = day_mask
+        self.monthly = monthly
+
+    def __repr__(self):
+        return f'RecurrenceRule({self.days_of_week!r}, {self.fix_dates!r})'
+
+    @property
+    def empty(self):
+        """해당하는 날짜가 하나도 없는 규칙 여부"""
+        return not (self.day_mask if self.monthly else self.weekday_mask)
+
+    @property
+    def days_of_week(self):
+        """tasks.days_of_week 저장 값 ('0', '1,2,3,4,5,6,7', '1,3,5', 없으면 None)"""
+        if self.monthly:
+            return MONTHLY
+        if self.weekday_mask == ALL_WEEKDAYS:
+            return DAILY
+        return ','.join(map(str, _bits(self.weekday_mask))) or None
+
+    @property
+    def fix_dates(self):
+        """tasks.fix_dates 저장 값 ('15, 25', 월별 규칙이 아니면 None)"""
+        if not self.monthly or not self.day_mask:
+            return None
+        return ', '.join(map(str, _bits(self.day_mask)))
+
+    def label(self):
+        """화면 표시용 설명 (예: '매일', '월수금', '매월 15, 25일')"""
+        if self.monthly:
+            return f'매월 {self.fix_dates}일' if self.day_mask else '미정'
+        if self.weekday_mask == ALL_WEEKDAYS:
+            return '매일'
+        return ''.join(WEEKDAY_NAMES[day - 1] for day in _bits(self.weekday_mask)) or '미정'
+
+    def month_days(self, year, month):
+        """해당 월에 작업하는 일자 튜플 (예: (2, 9, 16, 23, 30))"""
+        first_weekday, days_in_month = calendar.monthrange(year, month)
+        return _month_days(self.weekday_mask, self.day_mask, self.monthly, first_weekday, days_in_month)
+
+    def dates_between(self, start, end):
+        """start ~ end(포함) 기간의 작업 날짜 리스트"""
+        result = []
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            for day in self.month_days(year, month):
+                current = date(year, month, day)
+                if start <= current <= end:
+                    result.append(current)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return result
+
+    def occurs_on(self, day):
+        """해당 날짜가 작업일인지 여부"""
+        if self.monthly:
+            return bool(self.day_mask >> day.day & 1)
+        return bool(self.weekday_mask >> day.isoweekday() & 1)
+
+
+@lru_cache(maxsize=4096)
+def _month_days(weekday_mask, day_mask, monthly, first_weekday, days_in_month):
+    """
+    한 달의 작업 일자 계산
+
+    요일 규칙의 결과는 1일의 요일(0=월)과 월의 일수에만 달라지므로,
+    같은 규칙의 작업은 달이 달라도 대부분 캐시된 결과를 사용한다.
+    """
+    if monthly:
+        return tuple(day for day in _bits(day_mask) if day <= days_in_month)
+    return tuple(day for day in range(1, days_in_month + 1)
+                 if weekday_mask >> ((first_weekday + day - 1) % 7 + 1) & 1)
+
+
+@lru_cache(maxsize=1024)
+def compile_rule(days_of_week, fix_dates=None):
+    """
+    tasks의 days_of_week/fix_dates 값을 RecurrenceRule로 해석 (같은 값은 같은 객체 재사용)
+
+    SQL 프로시저(set_task_schedule_generate)와 같은 의미:
+    days_of_week가 '0'이면 fix_dates의 일자, 그 외에는 days_of_week의 요일
+    """
+    if days_of_week == MONTHLY:
+        return RecurrenceRule(day_mask=_parse_numbers(fix_dates, 1, 31), monthly=True)
+    return RecurrenceRule(weekday_mask=_parse_numbers(days_of_week, 1, 7))
+
+
+def rule_for_task(task):
+    """작업 행(dict)의 반복 규칙"""
+    return compile_rule(task.get('days_of_week'), task.get('fix_dates'))
+
+
+def label_tasks(tasks):
+    """작업 목록(get_task_list 결과)의 각 행에 화면 표시용 반복 규칙 설명(day_of_week) 추가"""
+    for task in tasks:
+        task['day_of_week'] = rule_for_task(task).label()
+    return tasks
+
+
+def from_form(days_of_week_list, fix_dates):
+    """
+    작업 등록/수정 폼 값으로 반복 규칙 생성
+
+    fix_dates가 있으면 월별, 없으면 선택한 요일 (7개 모두 선택하면 매일)
+    """
+    if fix_dates and fix_dates.strip():
+        return compile_rule(MONTHLY, fix_dates)
+    return compile_rule(','.join(days_of_week_list))
+
+
+def service_dates(task, start, end):
+    """작업의 반복 규칙에 해당하는 start ~ end 기간의 날짜 리스트 (서비스 기간으로 범위 제한)"""
+    if task.get('service_started_date') and task['service_started_date'] > start:
+        start = task['service_started_date']
+    if task.get('service_ended_date') and task['service_ended_date'] < end:
+        end = task['service_ended_date']
+    if start > end:
+        return []
+    return rule_for_task(task).dates_between(start, end)
+
+
+def upcoming_dates(rule, start, count, limit_days=400):
+    """start부터 작업 날짜 count개 (미리보기용, limit_days일 안에서)"""
+    result = []
+    end = start + timedelta(days=limit_days)
+    if rule.empty:
+        return result
+    for current in rule.dates_between(start, end):
+        result.append(current)
+        if len(result) >= count:
+            break
+    return result
@@ -0,0 +1,319 @@
+"""
+스케줄 일괄 생성 핸들러
+- 선택한 작업들의 한 달치 스케줄 날짜를 Python에서 한 번에 계산
+- 완료/작업중 스케줄이 있는 날짜는 건너뛰기
+- 기존 스케줄과의 차이(추가/삭제할 날짜)만 반영하거나 삭제 후 재등록
+- 다중 행 INSERT 한 번으로 저장 (하나의 트랜잭션)
+- 여러 달(예: 향후 3개월) 생성은 백그라운드 작업으로 나누어 실행 (진행률/취소 요청은 DB에 기록해 워커 간 공유)
+"""
+import os
+import json
+import uuid
+import logging
+import calendar
+import threading
+from datetime import datetime
+
+import broffice.dbconns as conn
+from broffice.utils.recurrence import service_dates
+
+logger = logging.getLogger(__name__)
+
+# 백그라운드 생성 작업 설정 (환경변수에서 로드)
+JOB_CHUNK_SIZE = int(os.environ.get('SCHEDULE_JOB_CHUNK_SIZE', 50))       # 한 번에(한 트랜잭션으로) 처리할 작업 수
+JOB_MAX_MONTHS = int(os.environ.get('SCHEDULE_JOB_MAX_MONTHS', 12))       # 한 번에 생성할 수 있는 최대 개월 수
+JOB_RETENTION = int(os.environ.get('SCHEDULE_JOB_RETENTION', 3600))      # 끝난 작업의 진행 정보 보관 시간 (초)
+JOB_STALE_SECONDS = int(os.environ.get('SCHEDULE_JOB_STALE_SECONDS', 300))  # 진행 기록이 이 시간 이상 멈추면 중단된 작업으로 처리
+
+
+def parse_year_month(year_month):
+    """'YYYY-MM' 문자열을 해당 월의 (첫째 날, 마지막 날)로 변환"""
+    first_day = datetime.strptime(year_month, '%Y-%m').date()
+    last_day = first_day.replace(day=calendar.monthrange(first_day.year, first_day.month)[1])
+    return first_day, last_day
+
+
+def _check_task(task):
+    """스케줄을 생성할 수 없는 작업이면 사유 메시지 반환"""
+    if task is None:
+        return '작업을 찾을 수 없습니다.'
+    if not task['use_yn']:
+        return '비활성 상태의 작업은 스케줄을 생성할 수 없습니다.'
+    if not task['area_count']:
+        return '등록된 구역이 없어 스케줄을 생성할 수 없습니다.'
+    return None
+
+
+def _plan_replace(task, target_dates, rows):
+    """
+    삭제 후 재등록 방식 계획: 완료/작업중 날짜를 제외한 대상 날짜 전체를 새로 등록
+    (완료/작업중이 아닌 기존 스케줄은 저장 프로시저에서 모두 삭제)
+    """
+    locked = {row['scheduled_date'] for row in rows if row['locked_yn']}
+    inserts = [day for day in target_dates if day not in locked]
+    return {
+        'inserts': inserts,
+        'updates': [],
+        'delete_ids': [],
+        'skipped': len(target_dates) - len(inserts),
+        'unchanged': 0,
+    }
+
+
+def _plan_diff(task, target_dates, rows):
+    """
+    차이 반영 방식 계획: 없는 날짜만 등록, 해당하지 않는 날짜만 삭제
+
+    - 완료/작업중 스케줄이 있는 날짜는 건너뛰고, 같은 날짜의 다른 스케줄은 삭제
+    - 유지되는 스케줄은 task_schedule_id를 그대로 두고, 작업자가 바뀌었으면 작업자만 변경
+    - 같은 날짜에 중복된 스케줄은 하나만 남기고 삭제
+    """
+    locked = {row['scheduled_date'] for row in rows if row['locked_yn']}
+    targets = set(target_dates)
+    kept = {}
+    delete_ids = []
+    for row in rows:
+        if row['locked_yn']:
+            continue
+        day = row['scheduled_date']
+        if day in targets and day not in locked and day not in kept:
+            kept[day] = row
+        else:
+            delete_ids.append(row['task_schedule_id'])
+
+    inserts = [day for day in target_dates if day not in locked and day not in kept]
+    updates = [row['task_schedule_id'] for row in kept.values() if row['user_id'] != task['user_id']]
+    return {
+        'inserts': inserts,
+        'updates': updates,
+        'delete_ids': delete_ids,
+        'skipped': sum(1 for day in target_dates if day in locked),
+        'unchanged': len(kept) - len(updates),
+    }
+
+
+PLANNERS = {
+    'replace': _plan_replace,
+    'diff': _plan_diff,
+}
+
+
+def generate_schedules(task_ids, year_month, mode='diff'):
+    """
+    여러 작업의 한 달치 스케줄 일괄 생성
+
+    작업 정보와 해당 월의 기존 스케줄을 한 번에 조회한 뒤 생성할 날짜를 계산하고,
+    저장 프로시저 한 번으로 반영한다. 조회와 저장은 같은 트랜잭션(주 DB)에서 실행된다.
+
+    - diff: 없는 날짜만 등록하고 해당하지 않는 날짜만 삭제 (유지되는 스케줄은 ID 그대로)
+    - replace: 완료/작업중이 아닌 기존 스케줄을 모두 삭제하고 다시 등록
+
+    Args:
+        task_ids: 작업ID 리스트
+        year_month: 생성할 년월 ('YYYY-MM')
+        mode: 'diff' 또는 'replace'
+
+    Returns:
+        {'inserted': 생성 건수, 'deleted': 삭제 건수, 'updated': 작업자 변경 건수,
+         'unchanged': 유지 건수, 'skipped_dates': 건너뛴 날짜 수,
+         'results': 작업별 {'task_id', 'return_value', 'message'} 리스트}
+    """
+    if mode not in PLANNERS:
+        raise ValueError(f"지원하지 않는 스케줄 생성 방식입니다: {mode}")
+    planner = PLANNERS[mode]
+    first_day, last_day = parse_year_month(year_month)
+    # 같은 작업이 중복 선택되어도 스케줄은 한 번만 생성
+    task_ids = list(dict.fromkeys(int(task_id) for task_id in task_ids))
+    task_ids_json = json.dumps(task_ids)
+
+    with conn.transaction():
+        tasks, month_rows = conn.call_many([
+            ('get_task_schedule_generate_tasks', [task_ids_json], 'list'),
+            ('get_task_schedule_month_dates', [task_ids_json, year_month], 'list'),
+        ])
+        tasks = {task['task_id']: task for task in tasks}
+        rows_by_task = {}
+        for row in month_rows:
+            rows_by_task.setdefault(row['task_id'], []).append(row)
+
+        results = []
+        target_ids = []
+        schedules = []
+        updates = []
+        delete_ids = []
+        skipped_dates = 0
+        unchanged = 0
+        for task_id in task_ids:
+            task = tasks.get(task_id)
+            reason = _check_task(task)
+            if reason:
+                results.append({'task_id': task_id, 'return_value': 0, 'message': reason})
+                continue
+
+            target_dates = [day.isoformat() for day in service_dates(task, first_day, last_day)]
+            plan = planner(task, target_dates, rows_by_task.get(task_id, []))
+            schedules.extend([task_id, task['user_id'], day] for day in plan['inserts'])
+            updates.extend([schedule_id, task['user_id']] for schedule_id in plan['updates'])
+            delete_ids.extend(plan['delete_ids'])
+            skipped_dates += plan['skipped']
+            unchanged += plan['unchanged']
+            target_ids.append(task_id)
+            count = len(plan['inserts'])
+            results.append({'task_id': task_id, 'return_value': count,
+                            'message': f'{count}건의 스케줄이 생성되었습니다.'})
+
+        res = None
+        if mode == 'replace' and target_ids:
+            res = conn.execute_return('set_task_schedule_bulk_generate',
+                                      [json.dumps(target_ids), year_month, json.dumps(schedules)])
+        elif mode == 'diff' and (schedules or updates or delete_ids):
+            res = conn.execute_return('set_task_schedule_diff_generate',
+                                      [json.dumps(schedules), json.dumps(updates), json.dumps(delete_ids)])
+        res = res or {}
+
+    return {
+        'inserted': res.get('return_value', 0),
+        'deleted': res.get('delete_count', 0),
+        'updated': res.get('update_count', 0),
+        'unchanged': unchanged,
+        'skipped_dates': skipped_dates,
+        'results': results,
+    }
+
+
+def month_range(start_year_month, months):
+    """시작 년월부터 months개월의 'YYYY-MM' 리스트"""
+    first_day, _ = parse_year_month(start_year_month)
+    result = []
+    for i in range(months):
+        year, month = divmod(first_day.month - 1 + i, 12)
+        result.append(f'{first_day.year + year:04d}-{month + 1:02d}')
+    return result
+
+
+COUNT_KEYS = ('inserted', 'deleted', 'updated', 'unchanged', 'skipped_dates')
+
+
+def _job_to_dict(row):
+    """schedule_jobs 행을 진행률 응답 형식으로 변환"""
+    status = row['status']
+    error = row['error_message']
+    if status in ('pending', 'running') and row['idle_seconds'] >= JOB_STALE_SECONDS:
+        # 실행하던 워커 프로세스가 종료되어 진행 기록이 멈춘 작업
+        status = 'failed'
+        error = '작업을 실행하던 프로세스가 응답하지 않아 중단되었습니다.'
+    total_steps = row['total_steps']
+    done_steps = row['done_steps']
+    return {
+        'job_id': row['job_id'],
+        'task_kind_id': row['task_kind_id'],
+        'year_months': row['year_months'].split(','),
+        'task_count': row['task_count'],
+        'status': status,
+        'cancel_requested': bool(row['cancel_requested_yn']),
+        'current_month': row['current_month'],
+        'total_steps': total_steps,
+        'done_steps': done_steps,
+        'progress': round(done_steps * 100 / total_steps) if total_steps else 100,
+        'counts': {
+            'inserted': row['inserted_count'],
+            'deleted': row['deleted_count'],
+            'updated': row['updated_count'],
+            'unchanged': row['unchanged_count'],
+            'skipped_dates': row['skipped_dates'],
+        },
+        'error': error,
+    }
+
+
+class ScheduleJob:
+    """
+    여러 달 스케줄 생성 백그라운드 작업 (작업을 시작한 워커 프로세스의 스레드에서 실행)
+
+    진행률과 취소 요청은 schedule_jobs 테이블에 기록하므로 어느 워커 프로세스에서든 조회/취소할 수 있다.
+    (월, 작업 묶음) 단위로 generate_schedules와 진행 기록을 한 트랜잭션으로 저장하고,
+    진행 기록과 함께 읽은 취소 요청은 다음 묶음 전에 반영한다 (이미 저장된 달/묶음은 그대로 유지).
+    """
+    def __init__(self, year_months, task_ids, mode):
+        self.job_id = uuid.uuid4().hex
+        self.year_months = year_months
+        self.task_ids = task_ids
+        self.mode = mode
+        self.chunks = [task_ids[i:i + JOB_CHUNK_SIZE] for i in range(0, len(task_ids), JOB_CHUNK_SIZE)]
+        self.total_steps = len(year_months) * len(self.chunks)
+
+    def _progress(self, year_month, generated=None):
+        """진행 기록 (generated가 없으면 시작 표시만) 후 취소 요청 여부 반환"""
+        counts = [generated[key] if generated else 0 for key in COUNT_KEYS]
+        res = conn.execute_return('set_schedule_job_progress',
+                                  [self.job_id, year_month, 1 if generated else 0, *counts])
+        return bool(res and res['cancel_requested_yn'])
+
+    def _finish(self, status, error=None):
+        try:
+            conn.execute_return('set_schedule_job_finish', [self.job_id, status, error and error[:500]])
+        except Exception as e:
+            logger.error(f"스케줄 생성 작업 종료 기록 실패: {self.job_id}, {status}, {str(e)}")
+
+    def run(self):
+        current_month = self.year_months[0]
+        try:
+            canceled = self._progress(current_month)
+            for year_month in self.year_months:
+                current_month = year_month
+                for chunk in self.chunks:
+                    if canceled:
+                        self._finish('canceled')
+                        return
+                    with conn.transaction():
+                        generated = generate_schedules(chunk, year_month, self.mode)
+                        canceled = self._progress(year_month, generated)
+            self._finish('done')
+        except Exception as e:
+            logger.error(f"스케줄 생성 작업 실패: {self.job_id}, {current_month}, {str(e)}")
+            self._finish('failed', str(e))
+
+
+def start_generation_job(task_kind_id, start_year_month, months, mode='diff'):
+    """
+    업무 종류의 활성 작업 전체에 대해 여러 달 스케줄 생성을 백그라운드로 시작
+
+    같은 업무 종류의 작업이 이미 진행 중이면 (다른 워커 프로세스에서 시작한 작업 포함)
+    새로 시작하지 않고 그 작업의 진행률을 반환한다.
+
+    Args:
+        task_kind_id: 업무 종류ID
+        start_year_month: 시작 년월 ('YYYY-MM')
+        months: 생성할 개월 수 (1 ~ JOB_MAX_MONTHS)
+        mode: 'diff' 또는 'replace' (generate_schedules 참고)
+
+    Returns:
+        작업 진행률 딕셔너리 (_job_to_dict 참고)
+    """
+    if not 1 <= months <= JOB_MAX_MONTHS:
+        raise ValueError(f"생성 개월 수는 1 ~ {JOB_MAX_MONTHS} 사이여야 합니다.")
+    if mode not in PLANNERS:
+        raise ValueError(f"지원하지 않는 스케줄 생성 방식입니다: {mode}")
+    year_months = month_range(start_year_month, months)
+
+    tasks = conn.return_list('get_task_list', [task_kind_id])
+    job = ScheduleJob(year_months, [task['task_id'] for task in tasks if task['use_yn']], mode)
+    row = conn.execute_return('set_schedule_job_start', [
+        job.job_id, task_kind_id, ','.join(year_months), mode, len(job.task_ids), job.total_steps,
+        JOB_STALE_SECONDS, JOB_RETENTION,
+    ])
+    if row['created_yn']:
+        threading.Thread(target=job.run, name=f'schedule-job-{job.job_id[:8]}', daemon=True).start()
+    return _job_to_dict(row)
+
+
+def get_generation_job(job_id):
+    """생성 작업 진행률 조회 (없으면 None)"""
+    row = conn.execute_return('get_schedule_job', [job_id])
+    return _job_to_dict(row) if row else None
+
+
+def cancel_generation_job(job_id):
+    """생성 작업 취소 요청 (진행 중인 묶음이 끝난 뒤 중단, 없으면 None)"""
+    row = conn.execute_return('set_schedule_job_cancel', [job_id])
+    return _job_to_dict(row) if row else None
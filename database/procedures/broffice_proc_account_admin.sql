@@ -16,8 +16,7 @@ CREATE PROCEDURE get_user_admin_login(
     IN p_user_id INT
 )
 BEGIN
-    -- 트랜잭션 격리 수준 설정 (READ UNCOMMITTED)
-    SET SESSION TRANSACTION ISOLATION LEVEL READ UNCOMMITTED;
+    -- 세션 격리 수준은 변경하지 않음 (풀 연결을 다음 요청이 그대로 사용하므로)
     
     -- 사용자 정보 반환 (로그인 성공 시에만 결과 반환)
     SELECT 
@@ -0,0 +1,45 @@
+USE Broffice$brobiz;
+
+DELIMITER $$
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com
+-- Description: 조회 캐시 태그 버전 목록 조회
+--              (워커 프로세스마다 주기적으로 조회해 다른 워커의 쓰기로 바뀐 태그의 캐시를 무효화)
+-- =============================================
+
+DROP PROCEDURE IF EXISTS get_cache_tag_versions$$
+
+CREATE PROCEDURE get_cache_tag_versions()
+BEGIN
+    SELECT tag, version
+    FROM cache_tag_versions;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com
+-- Description: 조회 캐시 태그 버전 증가 (쓰기 프로시저와 같은 트랜잭션에서 호출)
+--              p_tags: 변경된 태그 JSON 배열 (예: '["clients", "users"]')
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_cache_tag_versions_bump$$
+
+CREATE PROCEDURE set_cache_tag_versions_bump(
+    IN p_tags JSON
+)
+BEGIN
+    INSERT INTO cache_tag_versions (tag, version, updated_at)
+    SELECT jt.tag, 1, NOW()
+    FROM JSON_TABLE(p_tags, '$[*]' COLUMNS (tag VARCHAR(50) PATH '$')) jt
+    ON DUPLICATE KEY UPDATE
+        version = version + 1,
+        updated_at = NOW();
+END$$
+
+
+DELIMITER ;
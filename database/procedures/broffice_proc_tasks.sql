@@ -182,6 +182,7 @@ END$$
 -- Create date: 2026-02-10
 -- Email:       bonoman77@gmail.com 
 -- Description: 스케줄 목록 조회 (구역수, 당월/익월 스케줄 생성수 포함)
+--              반복 규칙 표시용 설명(day_of_week)은 앱에서 추가 (recurrence.label_tasks)
 -- =============================================
 
 DROP PROCEDURE IF EXISTS get_task_list$$
@@ -206,30 +207,6 @@ BEGIN
         u.user_name,
         u.user_mobile,
         mgr.user_name AS manager_name,
-        CASE 
-            WHEN t.days_of_week = '0' THEN 
-                CASE 
-                    WHEN t.fix_dates IS NOT NULL AND t.fix_dates != '' THEN CONCAT('매월 ', t.fix_dates, '일')
-                    ELSE '미정'
-                END
-            WHEN t.days_of_week = '1,2,3,4,5,6,7' THEN '매일'
-            WHEN t.days_of_week = '1' THEN '월'
-            WHEN t.days_of_week = '2' THEN '화'
-            WHEN t.days_of_week = '3' THEN '수'
-            WHEN t.days_of_week = '4' THEN '목'
-            WHEN t.days_of_week = '5' THEN '금'
-            WHEN t.days_of_week = '6' THEN '토'
-            WHEN t.days_of_week = '7' THEN '일'
-            ELSE CONCAT(
-                CASE WHEN FIND_IN_SET('1', t.days_of_week) > 0 THEN '월' ELSE '' END,
-                CASE WHEN FIND_IN_SET('2', t.days_of_week) > 0 THEN '화' ELSE '' END,
-                CASE WHEN FIND_IN_SET('3', t.days_of_week) > 0 THEN '수' ELSE '' END,
-                CASE WHEN FIND_IN_SET('4', t.days_of_week) > 0 THEN '목' ELSE '' END,
-                CASE WHEN FIND_IN_SET('5', t.days_of_week) > 0 THEN '금' ELSE '' END,
-                CASE WHEN FIND_IN_SET('6', t.days_of_week) > 0 THEN '토' ELSE '' END,
-                CASE WHEN FIND_IN_SET('7', t.days_of_week) > 0 THEN '일' ELSE '' END
-            )
-        END AS day_of_week,
         CASE
             WHEN t.use_yn = 0 THEN 'inactive'
             WHEN t.use_yn = 1
@@ -239,13 +216,7 @@ BEGIN
         ELSE 'pending'
         END AS task_status,
         -- 구역수 (활성 구역만)
-        IFNULL((
-            SELECT COUNT(*)
-            FROM task_areas ta
-            WHERE ta.task_id = t.task_id
-              AND ta.use_yn = 1
-              AND ta.deleted_at IS NULL
-        ), 0) AS area_count,
+        t.area_count,
         -- 당월 스케줄 생성수
         IFNULL((
             SELECT COUNT(*)
@@ -332,6 +303,139 @@ BEGIN
 END$$
 
 
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 작업의 활성 구역 수(tasks.area_count) 갱신
+--              구역 등록/수정 프로시저에서 호출 (결과 집합 없음)
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_task_area_count_refresh$$
+
+CREATE PROCEDURE set_task_area_count_refresh(
+    IN p_task_id INT
+)
+BEGIN
+    UPDATE tasks t
+    SET t.area_count = (
+        SELECT COUNT(*)
+        FROM task_areas ta
+        WHERE ta.task_id = t.task_id
+          AND ta.use_yn = 1
+          AND ta.deleted_at IS NULL
+    )
+    WHERE t.task_id = p_task_id;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 스케줄 진행 카운터 갱신 (결과 집합 없음)
+--              area_log_count: 로그가 있는 구역 수
+--              completed_area_count: 특이사항 또는 사진이 있는 구역 수
+--              photo_count: 사진 수
+--              구역 로그/사진 저장 프로시저에서 스케줄 행을 잠근 뒤 호출
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_task_schedule_counts_refresh$$
+
+CREATE PROCEDURE set_task_schedule_counts_refresh(
+    IN p_task_schedule_id INT
+)
+BEGIN
+    UPDATE task_schedules ts
+    SET ts.area_log_count = (
+            SELECT COUNT(*) FROM task_area_logs tal 
+            INNER JOIN task_areas ta ON tal.task_area_id = ta.task_area_id
+            WHERE tal.task_schedule_id = ts.task_schedule_id 
+              AND ta.deleted_at IS NULL
+        ),
+        ts.completed_area_count = (
+            SELECT COUNT(*) FROM task_area_logs tal 
+            INNER JOIN task_areas ta ON tal.task_area_id = ta.task_area_id
+            WHERE tal.task_schedule_id = ts.task_schedule_id 
+              AND ta.deleted_at IS NULL
+              AND ((tal.content IS NOT NULL AND tal.content != '')
+                   OR EXISTS (SELECT 1 FROM task_area_photos tap WHERE tap.task_area_log_id = tal.task_area_log_id))
+        ),
+        ts.photo_count = (
+            SELECT COUNT(*) FROM task_area_photos tap
+            INNER JOIN task_area_logs tal ON tap.task_area_log_id = tal.task_area_log_id
+            WHERE tal.task_schedule_id = ts.task_schedule_id
+        )
+    WHERE ts.task_schedule_id = p_task_schedule_id;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 진행 카운터 전체 재계산 (tasks.area_count, task_schedules 진행 카운터)
+--              값이 다른 행만 수정하고 수정한 행 수를 반환
+--              (flask reconcile-task-counts 명령, 카운터 컬럼 추가 후 최초 1회 실행)
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_task_counts_reconcile$$
+
+CREATE PROCEDURE set_task_counts_reconcile()
+BEGIN
+    DECLARE v_task_count INT DEFAULT 0;
+    DECLARE v_schedule_count INT DEFAULT 0;
+    
+    START TRANSACTION;
+    
+    UPDATE tasks t
+    LEFT JOIN (
+        SELECT task_id, COUNT(*) AS area_count
+        FROM task_areas
+        WHERE use_yn = 1
+          AND deleted_at IS NULL
+        GROUP BY task_id
+    ) a ON a.task_id = t.task_id
+    SET t.area_count = IFNULL(a.area_count, 0)
+    WHERE t.area_count <> IFNULL(a.area_count, 0);
+    SET v_task_count = ROW_COUNT();
+    
+    UPDATE task_schedules ts
+    LEFT JOIN (
+        SELECT 
+            tal.task_schedule_id,
+            COUNT(*) AS area_log_count,
+            SUM(CASE 
+                    WHEN (tal.content IS NOT NULL AND tal.content != '')
+                         OR EXISTS (SELECT 1 FROM task_area_photos tap WHERE tap.task_area_log_id = tal.task_area_log_id)
+                    THEN 1 ELSE 0 
+                END) AS completed_area_count
+        FROM task_area_logs tal
+        INNER JOIN task_areas ta ON tal.task_area_id = ta.task_area_id
+        WHERE ta.deleted_at IS NULL
+        GROUP BY tal.task_schedule_id
+    ) l ON l.task_schedule_id = ts.task_schedule_id
+    LEFT JOIN (
+        SELECT tal.task_schedule_id, COUNT(*) AS photo_count
+        FROM task_area_photos tap
+        INNER JOIN task_area_logs tal ON tap.task_area_log_id = tal.task_area_log_id
+        GROUP BY tal.task_schedule_id
+    ) p ON p.task_schedule_id = ts.task_schedule_id
+    SET ts.area_log_count = IFNULL(l.area_log_count, 0),
+        ts.completed_area_count = IFNULL(l.completed_area_count, 0),
+        ts.photo_count = IFNULL(p.photo_count, 0)
+    WHERE ts.area_log_count <> IFNULL(l.area_log_count, 0)
+       OR ts.completed_area_count <> IFNULL(l.completed_area_count, 0)
+       OR ts.photo_count <> IFNULL(p.photo_count, 0);
+    SET v_schedule_count = ROW_COUNT();
+    
+    COMMIT;
+    
+    SELECT v_task_count AS task_count,
+           v_schedule_count AS schedule_count;
+END$$
+
+
 -- =============================================
 -- Author:      김승균
 -- Create date: 2026-02-10
@@ -374,6 +478,9 @@ BEGIN
     
     SET v_return_value = LAST_INSERT_ID();
     
+    -- 작업의 활성 구역 수 갱신
+    CALL set_task_area_count_refresh(p_task_id);
+    
     COMMIT;
     
     SELECT v_return_value AS return_value;
@@ -399,6 +506,7 @@ CREATE PROCEDURE set_task_area_update(
 )
 BEGIN
     DECLARE v_return_value INT DEFAULT 0;
+    DECLARE v_task_id INT;
     
     START TRANSACTION;
     
@@ -414,6 +522,12 @@ BEGIN
     
     SET v_return_value = ROW_COUNT();
     
+    -- 사용 여부가 바뀔 수 있으므로 작업의 활성 구역 수 갱신
+    SELECT task_id INTO v_task_id
+    FROM task_areas
+    WHERE task_area_id = p_task_area_id;
+    CALL set_task_area_count_refresh(v_task_id);
+    
     COMMIT;
     
     SELECT v_return_value AS return_value;
@@ -527,16 +641,16 @@ BEGIN
                 -- days_of_week가 '0'이면 fix_dates 기반 (월별)
                 IF v_days_of_week = '0' THEN
                     IF v_fix_dates IS NOT NULL AND FIND_IN_SET(v_day_of_month, REPLACE(v_fix_dates, ' ', '')) > 0 THEN
-                        INSERT INTO task_schedules (task_id, user_id, scheduled_date)
+                        INSERT IGNORE INTO task_schedules (task_id, user_id, scheduled_date)
                         VALUES (p_task_id, v_task_user_id, v_current_date);
-                        SET v_insert_count = v_insert_count + 1;
+                        SET v_insert_count = v_insert_count + ROW_COUNT();
                     END IF;
                 ELSE
                     -- days_of_week 기반 (요일)
                     IF FIND_IN_SET(v_day_of_week, v_days_of_week) > 0 THEN
-                        INSERT INTO task_schedules (task_id, user_id, scheduled_date)
+                        INSERT IGNORE INTO task_schedules (task_id, user_id, scheduled_date)
                         VALUES (p_task_id, v_task_user_id, v_current_date);
-                        SET v_insert_count = v_insert_count + 1;
+                        SET v_insert_count = v_insert_count + ROW_COUNT();
                     END IF;
                 END IF;
             END IF;
@@ -551,6 +665,203 @@ BEGIN
 END$$
 
 
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 스케줄 일괄 생성용 작업 정보 조회 (선택한 작업 전체를 한 번에)
+--              p_task_ids: 작업ID JSON 배열 (예: '[1, 2, 3]')
+-- =============================================
+
+DROP PROCEDURE IF EXISTS get_task_schedule_generate_tasks$$
+
+CREATE PROCEDURE get_task_schedule_generate_tasks(
+    IN p_task_ids JSON
+)
+BEGIN
+    SELECT 
+        t.task_id,
+        t.user_id,
+        t.days_of_week,
+        t.fix_dates,
+        DATE(t.service_started_at) AS service_started_date,
+        DATE(t.service_ended_at) AS service_ended_date,
+        t.use_yn,
+        t.area_count
+    FROM JSON_TABLE(p_task_ids, '$[*]' COLUMNS (task_id INT PATH '$')) ids
+    JOIN tasks t ON t.task_id = ids.task_id
+    WHERE t.deleted_at IS NULL;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 해당 월의 스케줄 날짜 조회 (스케줄 생성 시 건너뛸 날짜/유지할 스케줄 계산)
+--              locked_yn: 완료 또는 작업중이면 1 (생성 시 건너뛰고 삭제하지 않음)
+-- =============================================
+
+DROP PROCEDURE IF EXISTS get_task_schedule_month_dates$$
+
+CREATE PROCEDURE get_task_schedule_month_dates(
+    IN p_task_ids JSON,
+    IN p_year_month VARCHAR(7)
+)
+BEGIN
+    DECLARE v_start_date DATE;
+    DECLARE v_end_date DATE;
+    
+    SET v_start_date = STR_TO_DATE(CONCAT(p_year_month, '-01'), '%Y-%m-%d');
+    SET v_end_date = LAST_DAY(v_start_date);
+    
+    SELECT 
+        ts.task_schedule_id,
+        ts.task_id,
+        ts.user_id,
+        DATE_FORMAT(ts.scheduled_date, '%Y-%m-%d') AS scheduled_date,
+        CASE 
+            WHEN ts.completed_at IS NOT NULL
+                 OR EXISTS (SELECT 1 FROM task_area_logs tal WHERE tal.task_schedule_id = ts.task_schedule_id)
+            THEN 1 ELSE 0 
+        END AS locked_yn
+    FROM JSON_TABLE(p_task_ids, '$[*]' COLUMNS (task_id INT PATH '$')) ids
+    JOIN task_schedules ts ON ts.task_id = ids.task_id
+    WHERE ts.scheduled_date >= v_start_date
+      AND ts.scheduled_date < DATE_ADD(v_end_date, INTERVAL 1 DAY)
+    ORDER BY ts.task_schedule_id;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 스케줄 일괄 생성 (여러 작업의 한 달치 스케줄을 한 번에 저장)
+--              p_task_ids: 생성 대상 작업ID JSON 배열
+--              p_schedules: 생성할 스케줄 JSON 배열 (예: '[[task_id, user_id, "2026-03-02"], ...]')
+--              해당 월의 기존 스케줄(완료/작업중 제외)을 삭제하고 다중 행 INSERT 한 번으로 등록한다.
+--              트랜잭션은 호출하는 쪽(dbconns)에서 관리한다.
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_task_schedule_bulk_generate$$
+
+CREATE PROCEDURE set_task_schedule_bulk_generate(
+    IN p_task_ids JSON,
+    IN p_year_month VARCHAR(7),
+    IN p_schedules JSON
+)
+BEGIN
+    DECLARE v_start_date DATE;
+    DECLARE v_end_date DATE;
+    DECLARE v_delete_count INT DEFAULT 0;
+    DECLARE v_insert_count INT DEFAULT 0;
+    
+    SET v_start_date = STR_TO_DATE(CONCAT(p_year_month, '-01'), '%Y-%m-%d');
+    SET v_end_date = LAST_DAY(v_start_date);
+    
+    -- 기존 해당 월 스케줄 삭제 (완료된 것, 작업중인 것은 건너뛰기)
+    DELETE ts
+    FROM task_schedules ts
+    JOIN JSON_TABLE(p_task_ids, '$[*]' COLUMNS (task_id INT PATH '$')) ids
+      ON ids.task_id = ts.task_id
+    WHERE ts.scheduled_date >= v_start_date
+      AND ts.scheduled_date < DATE_ADD(v_end_date, INTERVAL 1 DAY)
+      AND ts.completed_at IS NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM task_area_logs tal
+          WHERE tal.task_schedule_id = ts.task_schedule_id
+      );
+    SET v_delete_count = ROW_COUNT();
+    
+    -- 남아 있는 스케줄(완료/작업중)이나 동시에 실행된 다른 생성 작업이 등록한 날짜는
+    -- 고유 키(task_id, scheduled_date)로 건너뛰고 한 번에 등록
+    -- (NOT EXISTS 조회는 task_schedules에 간격 잠금을 걸어 동시 생성과 교착 상태가 생기므로 사용하지 않음)
+    INSERT IGNORE INTO task_schedules (task_id, user_id, scheduled_date)
+    SELECT s.task_id, s.user_id, s.scheduled_date
+    FROM JSON_TABLE(p_schedules, '$[*]' COLUMNS (
+             task_id INT PATH '$[0]',
+             user_id INT PATH '$[1]',
+             scheduled_date DATE PATH '$[2]'
+         )) s;
+    SET v_insert_count = ROW_COUNT();
+    
+    SELECT v_insert_count AS return_value,
+           v_delete_count AS delete_count,
+           CONCAT(v_insert_count, '건의 스케줄이 생성되었습니다.') AS message;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 스케줄 차이 반영 (변경된 날짜만 등록/삭제, 유지되는 스케줄은 그대로 둠)
+--              p_schedules: 새로 등록할 스케줄 JSON 배열 (예: '[[task_id, user_id, "2026-03-02"], ...]')
+--              p_updates: 작업자를 바꿀 스케줄 JSON 배열 (예: '[[task_schedule_id, user_id], ...]')
+--              p_delete_ids: 더 이상 해당하지 않는 스케줄ID JSON 배열
+--              완료/작업중인 스케줄은 수정/삭제하지 않는다.
+--              트랜잭션은 호출하는 쪽(dbconns)에서 관리한다.
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_task_schedule_diff_generate$$
+
+CREATE PROCEDURE set_task_schedule_diff_generate(
+    IN p_schedules JSON,
+    IN p_updates JSON,
+    IN p_delete_ids JSON
+)
+BEGIN
+    DECLARE v_delete_count INT DEFAULT 0;
+    DECLARE v_update_count INT DEFAULT 0;
+    DECLARE v_insert_count INT DEFAULT 0;
+    
+    -- 더 이상 해당하지 않는 날짜의 스케줄 삭제 (조회 이후 작업이 시작된 것은 제외)
+    DELETE ts
+    FROM task_schedules ts
+    JOIN JSON_TABLE(p_delete_ids, '$[*]' COLUMNS (task_schedule_id INT PATH '$')) d
+      ON d.task_schedule_id = ts.task_schedule_id
+    WHERE ts.completed_at IS NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM task_area_logs tal
+          WHERE tal.task_schedule_id = ts.task_schedule_id
+      );
+    SET v_delete_count = ROW_COUNT();
+    
+    -- 작업자가 바뀐 작업의 유지되는 스케줄은 작업자만 변경
+    UPDATE task_schedules ts
+    JOIN JSON_TABLE(p_updates, '$[*]' COLUMNS (
+             task_schedule_id INT PATH '$[0]',
+             user_id INT PATH '$[1]'
+         )) u
+      ON u.task_schedule_id = ts.task_schedule_id
+    SET ts.user_id = u.user_id,
+        ts.updated_at = NOW()
+    WHERE ts.completed_at IS NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM task_area_logs tal
+          WHERE tal.task_schedule_id = ts.task_schedule_id
+      );
+    SET v_update_count = ROW_COUNT();
+    
+    -- 없는 날짜만 등록 (이미 있는 날짜는 고유 키(task_id, scheduled_date)로 건너뜀,
+    -- 수동 생성과 백그라운드 생성 작업이 같은 달에 겹쳐도 중복 행이나 간격 잠금 교착 상태가 생기지 않음)
+    INSERT IGNORE INTO task_schedules (task_id, user_id, scheduled_date)
+    SELECT s.task_id, s.user_id, s.scheduled_date
+    FROM JSON_TABLE(p_schedules, '$[*]' COLUMNS (
+             task_id INT PATH '$[0]',
+             user_id INT PATH '$[1]',
+             scheduled_date DATE PATH '$[2]'
+         )) s;
+    SET v_insert_count = ROW_COUNT();
+    
+    SELECT v_insert_count AS return_value,
+           v_update_count AS update_count,
+           v_delete_count AS delete_count,
+           CONCAT(v_insert_count, '건 생성, ', v_delete_count, '건 삭제되었습니다.') AS message;
+END$$
+
+
 -- =============================================
 -- Author:      김승균
 -- Create date: 2026-02-11
@@ -603,15 +914,8 @@ BEGIN
             WHEN ts.scheduled_date = CURDATE() THEN 'today'
             ELSE 'scheduled'
         END AS schedule_status,
-        (SELECT COUNT(*) FROM task_areas ta 
-         WHERE ta.task_id = t.task_id AND ta.use_yn = 1 AND ta.deleted_at IS NULL) AS area_count,
-        (SELECT COUNT(*) FROM task_area_logs tal 
-         INNER JOIN task_areas ta2 ON tal.task_area_id = ta2.task_area_id
-         WHERE tal.task_schedule_id = ts.task_schedule_id 
-           AND ta2.deleted_at IS NULL
-           AND ((tal.content IS NOT NULL AND tal.content != '')
-                OR EXISTS (SELECT 1 FROM task_area_photos tap WHERE tap.task_area_log_id = tal.task_area_log_id))
-        ) AS completed_area_count
+        t.area_count,
+        ts.completed_area_count
     FROM task_schedules ts
     INNER JOIN tasks t ON ts.task_id = t.task_id
     INNER JOIN clients c ON t.client_id = c.client_id
@@ -631,6 +935,7 @@ END$$
 -- Create date: 2026-02-11
 -- Email:       bonoman77@gmail.com 
 -- Description: 스케줄 날짜 변경 (scheduled_date 업데이트, change_scheduled_yn=1)
+--              같은 작업의 스케줄이 이미 있는 날짜이면 변경하지 않고 -1 반환
 -- =============================================
 
 DROP PROCEDURE IF EXISTS set_task_schedule_update$$
@@ -645,14 +950,26 @@ BEGIN
     
     START TRANSACTION;
     
-    UPDATE task_schedules
-    SET scheduled_date = p_new_scheduled_date,
-        change_scheduled_yn = 1,
-        change_user_id = p_change_user_id,
-        updated_at = NOW()
-    WHERE task_schedule_id = p_task_schedule_id;
-    
-    SET v_return_value = ROW_COUNT();
+    -- 같은 작업의 다른 스케줄이 있는 날짜로는 변경하지 않음 (task_id, scheduled_date 고유 키)
+    IF EXISTS (
+        SELECT 1
+        FROM task_schedules cur
+        INNER JOIN task_schedules ts ON ts.task_id = cur.task_id
+        WHERE cur.task_schedule_id = p_task_schedule_id
+          AND ts.scheduled_date = p_new_scheduled_date
+          AND ts.task_schedule_id <> p_task_schedule_id
+    ) THEN
+        SET v_return_value = -1;
+    ELSE
+        UPDATE task_schedules
+        SET scheduled_date = p_new_scheduled_date,
+            change_scheduled_yn = 1,
+            change_user_id = p_change_user_id,
+            updated_at = NOW()
+        WHERE task_schedule_id = p_task_schedule_id;
+        
+        SET v_return_value = ROW_COUNT();
+    END IF;
     
     COMMIT;
     
@@ -745,15 +1062,8 @@ BEGIN
             WHEN ts.scheduled_date = CURDATE() THEN 'today'
             ELSE 'scheduled'
         END AS schedule_status,
-        (SELECT COUNT(*) FROM task_areas ta 
-         WHERE ta.task_id = t.task_id AND ta.use_yn = 1 AND ta.deleted_at IS NULL) AS area_count,
-        (SELECT COUNT(*) FROM task_area_logs tal 
-         INNER JOIN task_areas ta2 ON tal.task_area_id = ta2.task_area_id
-         WHERE tal.task_schedule_id = ts.task_schedule_id 
-           AND ta2.deleted_at IS NULL
-           AND ((tal.content IS NOT NULL AND tal.content != '')
-                OR EXISTS (SELECT 1 FROM task_area_photos tap WHERE tap.task_area_log_id = tal.task_area_log_id))
-        ) AS completed_area_count
+        t.area_count,
+        ts.completed_area_count
     FROM task_schedules ts
     INNER JOIN tasks t ON ts.task_id = t.task_id
     INNER JOIN clients c ON t.client_id = c.client_id
@@ -858,7 +1168,7 @@ END$$
 -- Author:      김승균
 -- Create date: 2026-02-11
 -- Email:       bonoman77@gmail.com 
--- Description: 스케줄별 전체 사진 조회 (작업 결과 확인용)
+-- Description: 스케줄별 전체 사진 조회 (작업 결과 확인용, 업무 상세의 구역별 사진)
 -- =============================================
 
 DROP PROCEDURE IF EXISTS get_task_schedule_photos$$
@@ -869,6 +1179,7 @@ CREATE PROCEDURE get_task_schedule_photos(
 BEGIN
     SELECT 
         tap.task_area_photo_id,
+        tap.task_area_log_id,
         tap.photo_file_path,
         CONCAT(ta.floor, '층 - ', ta.area) AS area_name
     FROM task_area_photos tap
@@ -917,6 +1228,14 @@ CREATE PROCEDURE set_task_area_log(
 )
 BEGIN
     DECLARE v_log_id INT DEFAULT 0;
+    DECLARE v_schedule_id INT;
+    
+    -- 같은 스케줄의 로그/사진 변경은 순서대로 처리 (진행 카운터 갱신 충돌 방지)
+    -- 잠금 순서: 스케줄(task_schedules) -> 로그(task_area_logs) -> 사진(task_area_photos)
+    SELECT task_schedule_id INTO v_schedule_id
+    FROM task_schedules
+    WHERE task_schedule_id = p_task_schedule_id
+    FOR UPDATE;
     
     -- 기존 로그 확인
     SELECT task_area_log_id INTO v_log_id
@@ -938,6 +1257,8 @@ BEGIN
         SET v_log_id = LAST_INSERT_ID();
     END IF;
     
+    CALL set_task_schedule_counts_refresh(p_task_schedule_id);
+    
     SELECT v_log_id AS return_value;
 END$$
 
@@ -956,10 +1277,29 @@ CREATE PROCEDURE set_task_area_photo_insert(
     IN p_photo_file_path VARCHAR(500)
 )
 BEGIN
+    DECLARE v_photo_id INT;
+    DECLARE v_schedule_id INT;
+    
+    -- 로그의 스케줄ID 확인 (잠금 없이 읽기, 로그의 스케줄은 바뀌지 않음)
+    SELECT task_schedule_id INTO v_schedule_id
+    FROM task_area_logs
+    WHERE task_area_log_id = p_task_area_log_id;
+    
+    -- 같은 스케줄의 로그/사진 변경은 순서대로 처리 (set_task_area_log와 같이 스케줄 행을 먼저 잠금)
+    SELECT task_schedule_id INTO v_schedule_id
+    FROM task_schedules
+    WHERE task_schedule_id = v_schedule_id
+    FOR UPDATE;
+    
     INSERT INTO task_area_photos (task_area_log_id, photo_file_path)
     VALUES (p_task_area_log_id, p_photo_file_path);
+    SET v_photo_id = LAST_INSERT_ID();
+    
+    IF v_schedule_id IS NOT NULL THEN
+        CALL set_task_schedule_counts_refresh(v_schedule_id);
+    END IF;
     
-    SELECT LAST_INSERT_ID() AS return_value;
+    SELECT v_photo_id AS return_value;
 END$$
 
 
@@ -977,15 +1317,36 @@ CREATE PROCEDURE set_task_area_photo_delete(
 )
 BEGIN
     DECLARE v_file_path VARCHAR(500);
+    DECLARE v_schedule_id INT;
+    DECLARE v_return_value INT DEFAULT 0;
+    
+    -- 사진의 스케줄ID 확인 (잠금 없이 읽기)
+    SELECT tal.task_schedule_id INTO v_schedule_id
+    FROM task_area_photos tap
+    INNER JOIN task_area_logs tal ON tap.task_area_log_id = tal.task_area_log_id
+    WHERE tap.task_area_photo_id = p_task_area_photo_id;
     
+    -- 같은 스케줄의 로그/사진 변경은 순서대로 처리 (set_task_area_log와 같이 스케줄 행을 먼저 잠금)
+    SELECT task_schedule_id INTO v_schedule_id
+    FROM task_schedules
+    WHERE task_schedule_id = v_schedule_id
+    FOR UPDATE;
+    
+    -- 스케줄을 잠근 뒤 삭제할 사진의 파일 경로 확인 (다른 요청이 먼저 삭제했으면 NULL)
     SELECT photo_file_path INTO v_file_path
     FROM task_area_photos
-    WHERE task_area_photo_id = p_task_area_photo_id;
+    WHERE task_area_photo_id = p_task_area_photo_id
+    FOR UPDATE;
     
     DELETE FROM task_area_photos
     WHERE task_area_photo_id = p_task_area_photo_id;
+    SET v_return_value = ROW_COUNT();
     
-    SELECT ROW_COUNT() AS return_value, v_file_path AS file_path;
+    IF v_schedule_id IS NOT NULL THEN
+        CALL set_task_schedule_counts_refresh(v_schedule_id);
+    END IF;
+    
+    SELECT v_return_value AS return_value, v_file_path AS file_path;
 END$$
 
 
@@ -1100,15 +1461,9 @@ BEGIN
         mgr.user_name AS manager_name,
         mgr.user_mobile AS manager_mobile,
         ts.memo,
-        (SELECT COUNT(*) FROM task_areas ta 
-         WHERE ta.task_id = t.task_id AND ta.use_yn = 1 AND ta.deleted_at IS NULL) AS area_count,
-        (SELECT COUNT(*) FROM task_area_logs tal 
-         INNER JOIN task_areas ta2 ON tal.task_area_id = ta2.task_area_id
-         WHERE tal.task_schedule_id = ts.task_schedule_id 
-           AND ta2.deleted_at IS NULL) AS completed_area_count,
-        (SELECT COUNT(*) FROM task_area_photos tap
-         INNER JOIN task_area_logs tal2 ON tap.task_area_log_id = tal2.task_area_log_id
-         WHERE tal2.task_schedule_id = ts.task_schedule_id) AS photo_count
+        t.area_count,
+        ts.area_log_count AS completed_area_count,
+        ts.photo_count
     FROM task_schedules ts
     INNER JOIN tasks t ON ts.task_id = t.task_id
     INNER JOIN clients c ON t.client_id = c.client_id
@@ -1174,12 +1529,8 @@ BEGIN
         END AS task_kind_name,
         c.client_name,
         u.user_name AS worker_name,
-        (SELECT COUNT(*) FROM task_areas ta 
-         WHERE ta.task_id = t.task_id AND ta.use_yn = 1 AND ta.deleted_at IS NULL) AS area_count,
-        (SELECT COUNT(*) FROM task_area_logs tal 
-         INNER JOIN task_areas ta2 ON tal.task_area_id = ta2.task_area_id
-         WHERE tal.task_schedule_id = ts.task_schedule_id 
-           AND ta2.deleted_at IS NULL) AS completed_area_count
+        t.area_count,
+        ts.area_log_count AS completed_area_count
     FROM task_schedules ts
     INNER JOIN tasks t ON ts.task_id = t.task_id
     INNER JOIN clients c ON t.client_id = c.client_id
@@ -1222,15 +1573,8 @@ BEGIN
             WHEN ts.scheduled_date = CURDATE() THEN 'today'
             ELSE 'scheduled'
         END AS schedule_status,
-        (SELECT COUNT(*) FROM task_area_logs tal 
-         INNER JOIN task_areas ta2 ON tal.task_area_id = ta2.task_area_id
-         WHERE tal.task_schedule_id = ts.task_schedule_id 
-           AND ta2.deleted_at IS NULL
-           AND ((tal.content IS NOT NULL AND tal.content != '')
-                OR EXISTS (SELECT 1 FROM task_area_photos tap WHERE tap.task_area_log_id = tal.task_area_log_id))
-        ) AS completed_area_count,
-        (SELECT COUNT(*) FROM task_areas ta 
-         WHERE ta.task_id = t.task_id AND ta.use_yn = 1 AND ta.deleted_at IS NULL) AS area_count
+        ts.completed_area_count,
+        t.area_count
     FROM task_schedules ts
     INNER JOIN tasks t ON ts.task_id = t.task_id
     INNER JOIN clients c ON t.client_id = c.client_id
@@ -1273,15 +1617,8 @@ BEGIN
             WHEN ts.scheduled_date = CURDATE() THEN 'today'
             ELSE 'scheduled'
         END AS schedule_status,
-        (SELECT COUNT(*) FROM task_area_logs tal 
-         INNER JOIN task_areas ta2 ON tal.task_area_id = ta2.task_area_id
-         WHERE tal.task_schedule_id = ts.task_schedule_id 
-           AND ta2.deleted_at IS NULL
-           AND ((tal.content IS NOT NULL AND tal.content != '')
-                OR EXISTS (SELECT 1 FROM task_area_photos tap WHERE tap.task_area_log_id = tal.task_area_log_id))
-        ) AS completed_area_count,
-        (SELECT COUNT(*) FROM task_areas ta 
-         WHERE ta.task_id = t.task_id AND ta.use_yn = 1 AND ta.deleted_at IS NULL) AS area_count
+        ts.completed_area_count,
+        t.area_count
     FROM task_schedules ts
     INNER JOIN tasks t ON ts.task_id = t.task_id
     INNER JOIN clients c ON t.client_id = c.client_id
@@ -1316,15 +1653,8 @@ BEGIN
         END AS day_name,
         u.user_name AS worker_name,
         DATE_FORMAT(ts.completed_at, '%H:%i') AS completed_time,
-        (SELECT COUNT(*) FROM task_area_logs tal 
-         INNER JOIN task_areas ta2 ON tal.task_area_id = ta2.task_area_id
-         WHERE tal.task_schedule_id = ts.task_schedule_id 
-           AND ta2.deleted_at IS NULL
-           AND ((tal.content IS NOT NULL AND tal.content != '')
-                OR EXISTS (SELECT 1 FROM task_area_photos tap WHERE tap.task_area_log_id = tal.task_area_log_id))
-        ) AS completed_area_count,
-        (SELECT COUNT(*) FROM task_areas ta 
-         WHERE ta.task_id = t.task_id AND ta.use_yn = 1 AND ta.deleted_at IS NULL) AS area_count
+        ts.completed_area_count,
+        t.area_count
     FROM task_schedules ts
     INNER JOIN tasks t ON ts.task_id = t.task_id
     INNER JOIN clients c ON t.client_id = c.client_id
@@ -1338,4 +1668,223 @@ BEGIN
 END$$
 
 
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 여러 달 스케줄 생성 작업 등록
+--              같은 업무 종류의 진행 중인 작업이 있으면 새로 등록하지 않고 그 작업을 반환 (created_yn = 0)
+--              진행 기록이 p_stale_seconds 이상 멈춘 작업은 실행하던 프로세스가 종료된 것으로 보고 실패 처리
+--              끝난 지 p_retention_seconds가 지난 작업은 삭제
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_schedule_job_start$$
+
+CREATE PROCEDURE set_schedule_job_start(
+    IN p_job_id CHAR(32),
+    IN p_task_kind_id INT,
+    IN p_year_months VARCHAR(200),
+    IN p_mode VARCHAR(10),
+    IN p_task_count INT,
+    IN p_total_steps INT,
+    IN p_stale_seconds INT,
+    IN p_retention_seconds INT
+)
+BEGIN
+    DECLARE v_job_id CHAR(32) DEFAULT NULL;
+    
+    DELETE FROM schedule_jobs
+    WHERE finished_at IS NOT NULL
+      AND finished_at < NOW() - INTERVAL p_retention_seconds SECOND;
+    
+    UPDATE schedule_jobs
+    SET status = 'failed',
+        error_message = '작업을 실행하던 프로세스가 응답하지 않아 중단되었습니다.',
+        finished_at = NOW()
+    WHERE task_kind_id = p_task_kind_id
+      AND status IN ('pending', 'running')
+      AND updated_at < NOW() - INTERVAL p_stale_seconds SECOND;
+    
+    -- 동시에 시작한 요청은 같은 업무 종류 인덱스 범위의 잠금으로 순서대로 처리
+    SELECT job_id INTO v_job_id
+    FROM schedule_jobs
+    WHERE task_kind_id = p_task_kind_id
+      AND status IN ('pending', 'running')
+    ORDER BY created_at DESC
+    LIMIT 1
+    FOR UPDATE;
+    
+    IF v_job_id IS NULL THEN
+        INSERT INTO schedule_jobs (job_id, task_kind_id, year_months, mode, task_count, total_steps)
+        VALUES (p_job_id, p_task_kind_id, p_year_months, p_mode, p_task_count, p_total_steps);
+        SET v_job_id = p_job_id;
+    END IF;
+    
+    SELECT
+        job_id,
+        task_kind_id,
+        year_months,
+        mode,
+        task_count,
+        total_steps,
+        done_steps,
+        current_month,
+        status,
+        cancel_requested_yn,
+        inserted_count,
+        deleted_count,
+        updated_count,
+        unchanged_count,
+        skipped_dates,
+        error_message,
+        TIMESTAMPDIFF(SECOND, updated_at, NOW()) AS idle_seconds,
+        IF(job_id = p_job_id, 1, 0) AS created_yn
+    FROM schedule_jobs
+    WHERE job_id = v_job_id;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 스케줄 생성 작업 진행 기록 (묶음 하나를 저장한 트랜잭션에서 호출)
+--              p_step: 완료한 단계 수 (시작 표시만 할 때는 0)
+--              취소 요청 여부를 반환 (실행 중인 프로세스가 다음 묶음 전에 확인)
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_schedule_job_progress$$
+
+CREATE PROCEDURE set_schedule_job_progress(
+    IN p_job_id CHAR(32),
+    IN p_current_month VARCHAR(7),
+    IN p_step INT,
+    IN p_inserted INT,
+    IN p_deleted INT,
+    IN p_updated INT,
+    IN p_unchanged INT,
+    IN p_skipped_dates INT
+)
+BEGIN
+    UPDATE schedule_jobs
+    SET status = 'running',
+        current_month = p_current_month,
+        done_steps = done_steps + p_step,
+        inserted_count = inserted_count + p_inserted,
+        deleted_count = deleted_count + p_deleted,
+        updated_count = updated_count + p_updated,
+        unchanged_count = unchanged_count + p_unchanged,
+        skipped_dates = skipped_dates + p_skipped_dates,
+        updated_at = NOW()
+    WHERE job_id = p_job_id;
+    
+    SELECT cancel_requested_yn
+    FROM schedule_jobs
+    WHERE job_id = p_job_id;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 스케줄 생성 작업 종료 기록 (p_status: done, canceled, failed)
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_schedule_job_finish$$
+
+CREATE PROCEDURE set_schedule_job_finish(
+    IN p_job_id CHAR(32),
+    IN p_status VARCHAR(10),
+    IN p_error_message VARCHAR(500)
+)
+BEGIN
+    UPDATE schedule_jobs
+    SET status = p_status,
+        error_message = p_error_message,
+        updated_at = NOW(),
+        finished_at = NOW()
+    WHERE job_id = p_job_id;
+    
+    SELECT ROW_COUNT() AS return_value;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 스케줄 생성 작업 취소 요청 (진행 중인 작업만, 실행 중인 프로세스가 다음 묶음 전에 중단)
+-- =============================================
+
+DROP PROCEDURE IF EXISTS set_schedule_job_cancel$$
+
+CREATE PROCEDURE set_schedule_job_cancel(
+    IN p_job_id CHAR(32)
+)
+BEGIN
+    UPDATE schedule_jobs
+    SET cancel_requested_yn = 1
+    WHERE job_id = p_job_id
+      AND status IN ('pending', 'running');
+    
+    SELECT
+        job_id,
+        task_kind_id,
+        year_months,
+        mode,
+        task_count,
+        total_steps,
+        done_steps,
+        current_month,
+        status,
+        cancel_requested_yn,
+        inserted_count,
+        deleted_count,
+        updated_count,
+        unchanged_count,
+        skipped_dates,
+        error_message,
+        TIMESTAMPDIFF(SECOND, updated_at, NOW()) AS idle_seconds
+    FROM schedule_jobs
+    WHERE job_id = p_job_id;
+END$$
+
+
+-- =============================================
+-- Author:      김승균
+-- Create date: 2026-10-18
+-- Email:       bonoman77@gmail.com 
+-- Description: 스케줄 생성 작업 진행률 조회 (idle_seconds: 마지막 진행 기록 후 지난 시간)
+-- =============================================
+
+DROP PROCEDURE IF EXISTS get_schedule_job$$
+
+CREATE PROCEDURE get_schedule_job(
+    IN p_job_id CHAR(32)
+)
+BEGIN
+    SELECT
+        job_id,
+        task_kind_id,
+        year_months,
+        mode,
+        task_count,
+        total_steps,
+        done_steps,
+        current_month,
+        status,
+        cancel_requested_yn,
+        inserted_count,
+        deleted_count,
+        updated_count,
+        unchanged_count,
+        skipped_dates,
+        error_message,
+        TIMESTAMPDIFF(SECOND, updated_at, NOW()) AS idle_seconds
+    FROM schedule_jobs
+    WHERE job_id = p_job_id;
+END$$
+
+
 DELIMITER ;
@@ -0,0 +1,12 @@
+-- 조회 캐시 태그 버전 테이블 추가 (다른 워커 프로세스의 쓰기로 바뀐 캐시 무효화)
+-- 1) 이 스크립트로 테이블 추가
+-- 2) broffice_proc_cache.sql 실행 (태그 버전 조회/증가 프로시저)
+
+USE Broffice$brobiz;
+
+CREATE TABLE IF NOT EXISTS cache_tag_versions (
+    tag                   VARCHAR(50) NOT NULL COMMENT '캐시태그',
+    version               BIGINT DEFAULT 0 NOT NULL COMMENT '변경버전',
+    updated_at            DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (tag)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='cache_tag_versions 조회캐시태그버전';
@@ -0,0 +1,30 @@
+-- 스케줄 생성 작업 테이블 추가 (여러 달 생성 작업의 진행률/취소 요청을 워커 프로세스 간에 공유)
+-- 1) 이 스크립트로 테이블 추가
+-- 2) broffice_proc_tasks.sql 다시 실행 (작업 시작/진행/취소/조회 프로시저 반영)
+
+USE Broffice$brobiz;
+
+CREATE TABLE IF NOT EXISTS schedule_jobs (
+    job_id                CHAR(32) NOT NULL COMMENT '작업ID',
+    task_kind_id          INT NOT NULL COMMENT '업무종류ID',
+    year_months           VARCHAR(200) NOT NULL COMMENT '생성년월목록',
+    mode                  VARCHAR(10) NOT NULL COMMENT '생성방식',
+    task_count            INT DEFAULT 0 NOT NULL COMMENT '대상작업수',
+    total_steps           INT DEFAULT 0 NOT NULL COMMENT '전체단계수',
+    done_steps            INT DEFAULT 0 NOT NULL COMMENT '완료단계수',
+    current_month         VARCHAR(7) NULL COMMENT '처리중년월',
+    status                VARCHAR(10) DEFAULT 'pending' NOT NULL COMMENT '상태',
+    cancel_requested_yn   TINYINT(1) DEFAULT 0 NOT NULL COMMENT '취소요청여부',
+    inserted_count        INT DEFAULT 0 NOT NULL COMMENT '생성건수',
+    deleted_count         INT DEFAULT 0 NOT NULL COMMENT '삭제건수',
+    updated_count         INT DEFAULT 0 NOT NULL COMMENT '작업자변경건수',
+    unchanged_count       INT DEFAULT 0 NOT NULL COMMENT '유지건수',
+    skipped_dates         INT DEFAULT 0 NOT NULL COMMENT '건너뛴날짜수',
+    error_message         VARCHAR(500) NULL COMMENT '오류메시지',
+    created_at            DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '등록일',
+    updated_at            DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '진행기록일',
+    finished_at           DATETIME NULL COMMENT '종료일',
+    PRIMARY KEY (job_id),
+    INDEX idx_schedule_jobs_task_kind_status (task_kind_id, status),
+    INDEX idx_schedule_jobs_finished_at (finished_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='schedule_jobs 스케줄생성작업';
@@ -0,0 +1,39 @@
+-- 진행 카운터 컬럼 추가 (목록 조회의 구역 수/작업 구역 수/사진 수 상관 서브쿼리 제거)
+-- 스케줄 고유 키 추가 (같은 작업/날짜의 스케줄 중복 생성 방지, 스케줄 생성 프로시저는 INSERT IGNORE 사용)
+-- 1) 이 스크립트로 컬럼/고유 키 추가 (컬럼을 이미 추가했으면 맨 아래 고유 키 부분만 실행)
+-- 2) broffice_proc_tasks.sql 다시 실행 (카운터를 갱신하는 프로시저 반영)
+-- 3) 기존 데이터 카운터 채우기: flask reconcile-task-counts (또는 CALL set_task_counts_reconcile();)
+
+USE Broffice$brobiz;
+
+ALTER TABLE tasks
+    ADD COLUMN area_count INT DEFAULT 0 NOT NULL COMMENT '활성구역수' AFTER use_yn;
+
+ALTER TABLE task_schedules
+    ADD COLUMN area_log_count INT DEFAULT 0 NOT NULL COMMENT '기록구역수' AFTER canceled_at,
+    ADD COLUMN completed_area_count INT DEFAULT 0 NOT NULL COMMENT '작업구역수' AFTER area_log_count,
+    ADD COLUMN photo_count INT DEFAULT 0 NOT NULL COMMENT '사진수' AFTER completed_area_count;
+
+-- 같은 작업/날짜에 중복 생성된 스케줄 정리 (작업 기록이 없는 미완료 스케줄만 삭제,
+-- 완료/작업중인 스케줄이 있으면 그 스케줄을, 없으면 먼저 만든 스케줄을 유지)
+DELETE dup
+FROM task_schedules dup
+INNER JOIN task_schedules keep_ts
+   ON keep_ts.task_id = dup.task_id
+  AND keep_ts.scheduled_date = dup.scheduled_date
+  AND keep_ts.task_schedule_id <> dup.task_schedule_id
+  AND (keep_ts.task_schedule_id < dup.task_schedule_id
+       OR keep_ts.completed_at IS NOT NULL
+       OR EXISTS (SELECT 1 FROM task_area_logs tal2 WHERE tal2.task_schedule_id = keep_ts.task_schedule_id))
+WHERE dup.completed_at IS NULL
+  AND NOT EXISTS (
+      SELECT 1 FROM task_area_logs tal
+      WHERE tal.task_schedule_id = dup.task_schedule_id
+  );
+
+-- 정리 후에도 남은 중복(양쪽 모두 작업 기록이 있는 경우)이 있으면 고유 키 추가가 실패하므로 먼저 확인
+-- SELECT task_id, scheduled_date, COUNT(*) FROM task_schedules
+-- GROUP BY task_id, scheduled_date HAVING COUNT(*) > 1;
+
+ALTER TABLE task_schedules
+    ADD UNIQUE KEY uq_task_schedules_task_date (task_id, scheduled_date);
@@ -19,6 +19,8 @@ DROP TABLE IF EXISTS users;
 DROP TABLE IF EXISTS commons;
 DROP TABLE IF EXISTS notices;
 DROP TABLE IF EXISTS clients;
+DROP TABLE IF EXISTS cache_tag_versions;
+DROP TABLE IF EXISTS schedule_jobs;
 
 -- ============================================================
 -- TABLE: clients (고객사)
@@ -147,9 +149,13 @@ CREATE TABLE task_schedules (
     change_user_id        INT NULL COMMENT '관리자ID',
     completed_at          DATETIME NULL COMMENT '작업완료일',
     canceled_at           DATETIME NULL COMMENT '작업취소일',
+    area_log_count        INT DEFAULT 0 NOT NULL COMMENT '기록구역수',
+    completed_area_count  INT DEFAULT 0 NOT NULL COMMENT '작업구역수',
+    photo_count           INT DEFAULT 0 NOT NULL COMMENT '사진수',
     created_at            DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '등록일',
     updated_at            DATETIME NULL COMMENT '수정일',
     PRIMARY KEY (task_schedule_id),
+    UNIQUE KEY uq_task_schedules_task_date (task_id, scheduled_date),
     INDEX idx_task_schedules_task_id (task_id),
     INDEX idx_task_schedules_user_id (user_id),
     INDEX idx_task_schedules_scheduled_at (scheduled_at)
@@ -192,6 +198,7 @@ CREATE TABLE tasks (
     days_of_week          VARCHAR(30) NOT NULL COMMENT '복수선택요일',
     fix_dates             VARCHAR(30) NOT NULL COMMENT '복수고정날짜',
 	use_yn				  TINYINT(1) DEFAULT 0 NOT NULL COMMENT '사용여부',
+    area_count            INT DEFAULT 0 NOT NULL COMMENT '활성구역수',
     service_started_at    DATETIME NOT NULL COMMENT '관리시작일',
     service_ended_at      DATETIME NULL COMMENT '관리종료일',
     created_at            DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '등록일',
@@ -267,6 +274,44 @@ CREATE TABLE client_requests (
         
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='업체요청사항';
 
+-- ============================================================
+-- TABLE: schedule_jobs (스케줄생성작업)
+-- ============================================================
+CREATE TABLE schedule_jobs (
+    job_id                CHAR(32) NOT NULL COMMENT '작업ID',
+    task_kind_id          INT NOT NULL COMMENT '업무종류ID',
+    year_months           VARCHAR(200) NOT NULL COMMENT '생성년월목록',
+    mode                  VARCHAR(10) NOT NULL COMMENT '생성방식',
+    task_count            INT DEFAULT 0 NOT NULL COMMENT '대상작업수',
+    total_steps           INT DEFAULT 0 NOT NULL COMMENT '전체단계수',
+    done_steps            INT DEFAULT 0 NOT NULL COMMENT '완료단계수',
+    current_month         VARCHAR(7) NULL COMMENT '처리중년월',
+    status                VARCHAR(10) DEFAULT 'pending' NOT NULL COMMENT '상태',
+    cancel_requested_yn   TINYINT(1) DEFAULT 0 NOT NULL COMMENT '취소요청여부',
+    inserted_count        INT DEFAULT 0 NOT NULL COMMENT '생성건수',
+    deleted_count         INT DEFAULT 0 NOT NULL COMMENT '삭제건수',
+    updated_count         INT DEFAULT 0 NOT NULL COMMENT '작업자변경건수',
+    unchanged_count       INT DEFAULT 0 NOT NULL COMMENT '유지건수',
+    skipped_dates         INT DEFAULT 0 NOT NULL COMMENT '건너뛴날짜수',
+    error_message         VARCHAR(500) NULL COMMENT '오류메시지',
+    created_at            DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '등록일',
+    updated_at            DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '진행기록일',
+    finished_at           DATETIME NULL COMMENT '종료일',
+    PRIMARY KEY (job_id),
+    INDEX idx_schedule_jobs_task_kind_status (task_kind_id, status),
+    INDEX idx_schedule_jobs_finished_at (finished_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='schedule_jobs 스케줄생성작업';
+
+-- ============================================================
+-- TABLE: cache_tag_versions (조회 캐시 태그 버전)
+-- ============================================================
+CREATE TABLE cache_tag_versions (
+    tag                   VARCHAR(50) NOT NULL COMMENT '캐시태그',
+    version               BIGINT DEFAULT 0 NOT NULL COMMENT '변경버전',
+    updated_at            DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (tag)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='cache_tag_versions 조회캐시태그버전';
+
 -- ============================================================
 -- FOREIGN KEY CONSTRAINTS
 -- ============================================================
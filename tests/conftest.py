@@ -0,0 +1,8 @@
+import os
+import sys
+
+# 저장소 루트에서 broffice 패키지를 불러오도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# broffice 패키지를 불러올 때 설정 클래스가 SECRET_KEY를 요구하므로 테스트용 값 지정
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
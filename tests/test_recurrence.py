@@ -0,0 +1,157 @@
+"""반복 규칙 (broffice.utils.recurrence) 테스트"""
+from datetime import date
+
+import pytest
+
+from broffice.utils import recurrence
+from broffice.utils.recurrence import compile_rule, from_form, service_dates, upcoming_dates, label_tasks
+
+
+# 2026-03-01은 일요일, 2026-02는 28일, 2024-02는 29일
+
+
+def test_weekday_rule_month_days():
+    rule = compile_rule('1,3,5')
+    assert not rule.monthly
+    assert rule.month_days(2026, 3) == (2, 4, 6, 9, 11, 13, 16, 18, 20, 23, 25, 27, 30)
+
+
+def test_weekday_rule_accepts_spaces_and_unordered_values():
+    assert compile_rule('5, 1').month_days(2026, 3) == compile_rule('1,5').month_days(2026, 3)
+
+
+def test_daily_rule_covers_every_day():
+    rule = compile_rule(recurrence.DAILY)
+    assert rule.month_days(2026, 2) == tuple(range(1, 29))
+    assert rule.month_days(2026, 3) == tuple(range(1, 32))
+    assert rule.days_of_week == recurrence.DAILY
+
+
+def test_monthly_rule_month_days():
+    rule = compile_rule(recurrence.MONTHLY, '15, 25')
+    assert rule.monthly
+    assert rule.month_days(2026, 3) == (15, 25)
+    assert rule.fix_dates == '15, 25'
+
+
+@pytest.mark.parametrize('year, month, expected', [
+    (2026, 1, (15, 31)),
+    (2026, 2, (15,)),
+    (2026, 4, (15,)),
+    (2026, 5, (15, 31)),
+])
+def test_monthly_rule_skips_days_beyond_month_end(year, month, expected):
+    assert compile_rule(recurrence.MONTHLY, '15, 31').month_days(year, month) == expected
+
+
+def test_monthly_rule_leap_day():
+    rule = compile_rule(recurrence.MONTHLY, '29')
+    assert rule.month_days(2024, 2) == (29,)
+    assert rule.month_days(2026, 2) == ()
+
+
+def test_invalid_values_are_ignored():
+    assert compile_rule('0', '0, 10, 32, abc, -1').month_days(2026, 3) == (10,)
+    rule = compile_rule('8,9,x')
+    assert rule.empty
+    assert rule.month_days(2026, 3) == ()
+
+
+def test_compile_rule_reuses_rule_for_same_values():
+    assert compile_rule('1,3,5') is compile_rule('1,3,5')
+
+
+def test_occurs_on():
+    assert compile_rule('1').occurs_on(date(2026, 3, 2))
+    assert not compile_rule('1').occurs_on(date(2026, 3, 3))
+    assert compile_rule('0', '3').occurs_on(date(2026, 3, 3))
+
+
+def test_dates_between_spans_year_end():
+    rule = compile_rule('0', '1, 31')
+    assert rule.dates_between(date(2026, 12, 15), date(2027, 1, 31)) == [
+        date(2026, 12, 31), date(2027, 1, 1), date(2027, 1, 31)]
+
+
+def test_from_form_weekdays():
+    rule = from_form(['1', '3', '5'], '')
+    assert rule.days_of_week == '1,3,5'
+    assert rule.fix_dates is None
+
+
+def test_from_form_all_weekdays_is_daily():
+    assert from_form(['1', '2', '3', '4', '5', '6', '7'], None).days_of_week == recurrence.DAILY
+
+
+def test_from_form_fix_dates_take_precedence():
+    rule = from_form(['1', '2'], ' 20,5 ')
+    assert rule.monthly
+    assert rule.days_of_week == recurrence.MONTHLY
+    assert rule.fix_dates == '5, 20'
+
+
+@pytest.mark.parametrize('days, fix_dates', [
+    ([], ''),
+    ([], '   '),
+    ([], None),
+    (['0', '8', 'x'], ''),
+])
+def test_from_form_empty_weekdays(days, fix_dates):
+    rule = from_form(days, fix_dates)
+    assert not rule.monthly
+    assert rule.empty
+    assert rule.days_of_week is None
+
+
+def test_from_form_invalid_fix_dates_is_empty_monthly_rule():
+    rule = from_form([], '0, 32, abc')
+    assert rule.monthly
+    assert rule.empty
+    assert rule.fix_dates is None
+
+
+def test_service_dates_clipped_to_service_period():
+    task = {'days_of_week': '1', 'fix_dates': None,
+            'service_started_date': date(2026, 3, 10), 'service_ended_date': date(2026, 3, 24)}
+    assert service_dates(task, date(2026, 3, 1), date(2026, 3, 31)) == [date(2026, 3, 16), date(2026, 3, 23)]
+
+
+def test_service_dates_without_service_period():
+    task = {'days_of_week': '0', 'fix_dates': '1', 'service_started_date': None, 'service_ended_date': None}
+    assert service_dates(task, date(2026, 3, 1), date(2026, 4, 30)) == [date(2026, 3, 1), date(2026, 4, 1)]
+
+
+@pytest.mark.parametrize('started, ended', [
+    (date(2026, 4, 1), None),
+    (None, date(2026, 2, 28)),
+])
+def test_service_dates_outside_service_period(started, ended):
+    task = {'days_of_week': recurrence.DAILY, 'fix_dates': None,
+            'service_started_date': started, 'service_ended_date': ended}
+    assert service_dates(task, date(2026, 3, 1), date(2026, 3, 31)) == []
+
+
+def test_upcoming_dates():
+    assert upcoming_dates(compile_rule('1'), date(2026, 3, 3), 3) == [
+        date(2026, 3, 9), date(2026, 3, 16), date(2026, 3, 23)]
+    assert upcoming_dates(compile_rule('8'), date(2026, 3, 3), 3) == []
+
+
+@pytest.mark.parametrize('days_of_week, fix_dates, expected', [
+    ('1,2,3,4,5,6,7', None, '매일'),
+    ('1,3,5', None, '월수금'),
+    ('7,1', None, '월일'),
+    ('6', '', '토'),
+    ('0', '15,25', '매월 15, 25일'),
+    ('0', '', '미정'),
+    ('0', None, '미정'),
+    ('', None, '미정'),
+    (None, None, '미정'),
+])
+def test_label(days_of_week, fix_dates, expected):
+    assert compile_rule(days_of_week, fix_dates).label() == expected
+
+
+def test_label_tasks():
+    tasks = [{'days_of_week': '1,3,5', 'fix_dates': None}, {'days_of_week': '0', 'fix_dates': '10'}]
+    assert [task['day_of_week'] for task in label_tasks(tasks)] == ['월수금', '매월 10일']